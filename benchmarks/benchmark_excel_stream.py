@@ -0,0 +1,85 @@
+"""
+Compara ExcelManager.append (lê, concatena e regrava a cada lote) com
+ExcelStreamWriter (workbook aberto, write-only) gravando as mesmas linhas.
+
+Uso:
+    python benchmarks/benchmark_excel_stream.py [--rows 100000] [--batch 1000] [--skip-append] [--memory]
+
+--memory mede o pico com tracemalloc, que deixa a execução bem mais lenta;
+compare os tempos sem essa opção.
+"""
+
+import os
+import sys
+
+sys.path.append(
+    os.path.dirname(os.path.dirname(__file__))
+)
+
+import argparse
+import tempfile
+import time
+import tracemalloc
+from excel.excel_manager import ExcelManager
+from utils.logger import setup_logger
+
+
+logger = setup_logger()
+
+COLUNAS = [
+    "Protocolo", "Interessado", "Assunto", "Data", "Situação", "Setor",
+    "Responsável", "Prazo", "Origem", "Destino", "Tipo", "Observação",
+]
+
+
+def lotes(total: int, tamanho: int):
+    for inicio in range(0, total, tamanho):
+        yield [
+            {col: f"{col}-{i}" for col in COLUNAS}
+            for i in range(inicio, min(inicio + tamanho, total))
+        ]
+
+
+def medir(nome: str, func, memoria: bool) -> None:
+    if memoria:
+        tracemalloc.start()
+    inicio = time.perf_counter()
+    func()
+    tempo = time.perf_counter() - inicio
+    if not memoria:
+        logger.info(f"{nome:>10}: {tempo:8.2f}s")
+        return
+    _, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    logger.info(f"{nome:>10}: {tempo:8.2f}s | pico de memória {pico / 1024 / 1024:8.1f} MiB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--batch", type=int, default=1_000)
+    parser.add_argument("--skip-append", action="store_true", help="não roda o caminho O(n²)")
+    parser.add_argument("--memory", action="store_true", help="mede o pico de memória (tracemalloc)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        if not args.skip_append:
+            path_append = os.path.join(tmp, "append.xlsx")
+
+            def via_append():
+                for lote in lotes(args.rows, args.batch):
+                    ExcelManager.append(path_append, lote)
+
+            medir("append", via_append, args.memory)
+
+        path_stream = os.path.join(tmp, "stream.xlsx")
+
+        def via_stream():
+            with ExcelManager.stream(path_stream) as writer:
+                writer.write_batches(lotes(args.rows, args.batch))
+
+        medir("stream", via_stream, args.memory)
+
+
+if __name__ == "__main__":
+    main()
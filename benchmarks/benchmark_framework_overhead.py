@@ -0,0 +1,134 @@
+"""
+Mede o custo do próprio framework (decorators, logging, waits, retry) por
+ação, sobre o FakeDriver em memória: cada ação é executada pelo driver
+"cru" e pelo Browser/BasePage, e a diferença é o overhead do framework.
+Também mostra quantos comandos WebDriver (round trips) cada caminho envia.
+
+Uso:
+    python benchmarks/benchmark_framework_overhead.py [--iterations 500] [--log-level INFO] [--profile]
+"""
+
+import os
+import sys
+
+sys.path.append(
+    os.path.dirname(os.path.dirname(__file__))
+)
+
+import argparse
+import time
+from selenium.webdriver.common.by import By
+from benchmarks.sitac_server import SitacServer, LOGIN_PATH
+from core.base_page import BasePage
+from core.browser_manager import Browser, EXTRACT_TABLE_JS
+from core.driver_backends import FakeBackend
+from utils.command_counter import CommandCounter
+from utils.logger import setup_logger
+
+
+logger = setup_logger()
+
+BASE_URL = "http://sitac.local"
+
+
+def medir(func, iteracoes: int, counter: CommandCounter):
+    """Retorna (µs por operação, comandos por operação)."""
+    func()  # aquecimento (caches, imports tardios)
+    counter.reset()
+    inicio = time.perf_counter()
+    for _ in range(iteracoes):
+        func()
+    tempo = time.perf_counter() - inicio
+    return tempo / iteracoes * 1e6, counter.total / iteracoes
+
+
+def acoes(nav: Browser, page: BasePage):
+    driver = nav.driver
+    css = By.CSS_SELECTOR
+
+    def cru_type():
+        el = driver.find_element(css, "#username")
+        el.clear()
+        el.send_keys("usuario")
+
+    def cru_visivel():
+        return any(el.is_displayed() for el in driver.find_elements(css, "#username"))
+
+    def cru_tabela():
+        return driver.execute_script(EXTRACT_TABLE_JS, driver.find_element(css, ".display"), [])
+
+    # (nome, driver cru, Browser, BasePage ou None)
+    return [
+        ("find", lambda: driver.find_element(css, "#username"),
+            lambda: nav.wait_for("#username"),
+            lambda: page.wait_for((css, "#username"))),
+        ("click", lambda: driver.find_element(css, "#menu-protocolos").click(),
+            lambda: nav.click("#menu-protocolos"),
+            lambda: page.click((css, "#menu-protocolos"))),
+        ("type", cru_type,
+            lambda: nav.type("#username", "usuario"),
+            lambda: page.type((css, "#username"), "usuario")),
+        ("get_text", lambda: driver.find_element(css, "#welcome_avatar").text,
+            lambda: nav.get_text("#welcome_avatar"),
+            lambda: page.get_text((css, "#welcome_avatar"))),
+        ("is_visible", cru_visivel,
+            lambda: nav.is_visible("#username"),
+            lambda: page.is_element_visible((css, "#username"))),
+        ("tabela", cru_tabela,
+            lambda: nav.extract_table(".display"),
+            None),
+    ]
+
+
+def pagina_de_teste(server: SitacServer) -> str:
+    """Home + formulário de login + uma página de tabela num único documento."""
+    home = server.home_html("benchmark")
+    extras = (
+        '<input id="username" type="text">'
+        f'<div id="tabela">{server.table_html(0, 1)}</div>'
+    )
+    return home.replace("</body>", extras + "</body>")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=500)
+    parser.add_argument("--rows", type=int, default=50, help="linhas da tabela extraída")
+    parser.add_argument("--log-level", default="INFO")
+    parser.add_argument("--profile", action="store_true", help="liga o Profiler (mede o custo dele)")
+    args = parser.parse_args()
+
+    server = SitacServer(rows=args.rows, page_size=args.rows)
+    server.httpd.server_close()  # só o HTML é usado
+    url = BASE_URL + LOGIN_PATH
+    backend = FakeBackend(pages={url: pagina_de_teste(server)}, start_url=url)
+
+    nav = Browser(backend=backend, log_level=args.log_level, profile=args.profile)
+    page = BasePage(nav)
+    counter = CommandCounter(nav.driver)
+    linhas = [
+        f"{'ação':<11} {'cru µs':>9} {'Browser µs':>11} {'BasePage µs':>12} "
+        f"{'overhead µs':>12} {'cmds cru':>9} {'cmds Browser':>13} {'cmds Page':>10}"
+    ]
+    try:
+        for nome, cru, browser_fn, page_fn in acoes(nav, page):
+            t_cru, c_cru = medir(cru, args.iterations, counter)
+            t_nav, c_nav = medir(browser_fn, args.iterations, counter)
+            t_page, c_page = medir(page_fn, args.iterations, counter) if page_fn else (None, None)
+            linhas.append(
+                f"{nome:<11} {t_cru:>9.1f} {t_nav:>11.1f} "
+                f"{t_page if t_page is not None else float('nan'):>12.1f} {t_nav - t_cru:>12.1f} "
+                f"{c_cru:>9g} {c_nav:>13g} {c_page if c_page is not None else float('nan'):>10g}"
+            )
+    finally:
+        counter.detach()
+        nav.quit()
+
+    logger.info(
+        "Overhead do framework (%s iterações, log %s, profiler %s):\n%s",
+        args.iterations, args.log_level, "ligado" if args.profile else "desligado", "\n".join(linhas),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Compara o tempo de carregamento de páginas com e sem o perfil "lean".
+
+Uso:
+    python benchmarks/benchmark_lean_profile.py [url ...] [--browser firefox] [--repeat 3]
+"""
+
+import os
+import sys
+
+sys.path.append(
+    os.path.dirname(os.path.dirname(__file__))
+)
+
+import argparse
+import statistics
+import time
+from core.browser_manager import Browser
+from pages.login_page import LoginPage
+from utils.logger import setup_logger
+
+
+logger = setup_logger()
+
+
+def medir(browser_name: str, lean: bool, urls, repeat: int) -> dict:
+    nav = Browser(browser=browser_name, headless=True, lean=lean)
+    try:
+        load_times, wall_times = [], []
+        for _ in range(repeat):
+            for url in urls:
+                inicio = time.perf_counter()
+                nav.go_to(url)
+                wall_times.append(time.perf_counter() - inicio)
+                load = nav.page_load_time()
+                if load is not None:
+                    load_times.append(load)
+        return {
+            "startup": nav.startup_time,
+            "load_median": statistics.median(load_times) if load_times else None,
+            "wall_median": statistics.median(wall_times),
+        }
+    finally:
+        nav.quit()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("urls", nargs="*", default=[LoginPage.URL])
+    parser.add_argument("--browser", default="chrome")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    resultados = {
+        "normal": medir(args.browser, False, args.urls, args.repeat),
+        "lean": medir(args.browser, True, args.urls, args.repeat),
+    }
+
+    for perfil, r in resultados.items():
+        load = f"{r['load_median']:.3f}s" if r["load_median"] is not None else "n/d"
+        logger.info(
+            f"{perfil:>6}: startup {r['startup']:.2f}s | "
+            f"load (mediana) {load} | go_to (mediana) {r['wall_median']:.3f}s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""
+Replay de gravações de comandos WebDriver (Browser(record=...)) sem navegador.
+
+Subcomandos:
+    resumo ARQUIVO              comandos, contagem e tempo gravado por comando
+    diff ANTES DEPOIS           comandos cuja contagem mudou entre duas gravações
+    replay ARQUIVO [opções]     reexecuta ConsultarProtocolosFlow sobre a gravação
+                                e mede o tempo do framework (a rede vira zero)
+
+Uso:
+    python benchmarks/benchmark_replay.py resumo logs/recordings/despacho.jsonl.gz
+    python benchmarks/benchmark_replay.py diff antes.jsonl.gz depois.jsonl.gz
+    python benchmarks/benchmark_replay.py replay despacho.jsonl.gz --fluxo despacho
+        [--repeat 5] [--speed 0] [--strict] [--usuario USUARIO] [--profile]
+
+O replay precisa seguir o mesmo caminho de código da gravação: mesmo fluxo,
+mesmo usuário e a mesma URL de login (lida do primeiro "get" gravado). As
+divergências aparecem no final; com --strict a primeira delas é um erro.
+"""
+
+import os
+import sys
+
+sys.path.append(
+    os.path.dirname(os.path.dirname(__file__))
+)
+
+import argparse
+import statistics
+import time
+from core.browser_manager import Browser
+from core.command_replay import diff_summaries, read_recording, summarize
+from core.driver_backends import ReplayBackend
+from flows.consultar_protocolos_flow import ConsultarProtocolosFlow
+from pages.login_page import LoginPage
+from utils.logger import setup_logger
+
+
+logger = setup_logger()
+
+FLUXOS = {
+    "despacho": "executar_fluxo_despacho",
+    "fiscalizacao": "executar_fluxo_fiscalizacao",
+    "pre_envio": "executar_fluxo_pre_envio_camaras",
+}
+
+
+def resumo(args):
+    header, records = read_recording(args.arquivo)
+    linhas = [f"{'comando':<32} {'qtd':>6} {'ms':>10}"]
+    for comando, item in summarize(args.arquivo).items():
+        linhas.append(f"{comando:<32} {item['count']:>6} {item['ms']:>10.1f}")
+    total = sum(r.get("ms", 0) for r in records)
+    logger.info(
+        "%s (%s, %s comandos, %.2fs no driver):\n%s",
+        args.arquivo, header["capabilities"].get("browserName"), len(records), total / 1000, "\n".join(linhas),
+    )
+
+
+def diff(args):
+    antes, depois = summarize(args.antes), summarize(args.depois)
+    linhas = [
+        f"{comando:<32} {a['count']:>6} → {b['count']:<6} ({a['ms']:.1f}ms → {b['ms']:.1f}ms)"
+        for comando, a, b in diff_summaries(antes, depois)
+    ]
+    total_antes = sum(item["count"] for item in antes.values())
+    total_depois = sum(item["count"] for item in depois.values())
+    logger.info(
+        "Comandos: %s → %s\n%s", total_antes, total_depois, "\n".join(linhas) or "(mesma contagem por comando)"
+    )
+
+
+def url_de_login(arquivo: str) -> str:
+    _, records = read_recording(arquivo)
+    return next((r["params"]["url"] for r in records if r["cmd"] == "get"), LoginPage.URL)
+
+
+def replay(args):
+    LoginPage.URL = args.login_url or url_de_login(args.arquivo)
+    metodo = FLUXOS[args.fluxo]
+
+    tempos = []
+    for _ in range(args.repeat):
+        nav = Browser(
+            backend=ReplayBackend(args.arquivo, speed=args.speed, strict=args.strict),
+            profile=args.profile,
+        )
+        try:
+            inicio = time.perf_counter()
+            getattr(ConsultarProtocolosFlow(nav), metodo)(args.usuario, args.senha)
+            tempos.append(time.perf_counter() - inicio)
+            conexao = nav.driver.connection
+            divergencias, restantes = conexao.divergences, conexao.remaining
+        finally:
+            nav.quit()
+
+    logger.info(
+        "Replay de %s (%s x): mediana %.3fs, mín %.3fs; %s divergências, %s comandos gravados não usados",
+        args.fluxo, args.repeat, statistics.median(tempos), min(tempos), len(divergencias), restantes,
+    )
+    for item in divergencias[:20]:
+        logger.warning("Divergência: %s", item)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    sub = parser.add_subparsers(dest="comando", required=True)
+
+    p = sub.add_parser("resumo")
+    p.add_argument("arquivo")
+    p.set_defaults(func=resumo)
+
+    p = sub.add_parser("diff")
+    p.add_argument("antes")
+    p.add_argument("depois")
+    p.set_defaults(func=diff)
+
+    p = sub.add_parser("replay")
+    p.add_argument("arquivo")
+    p.add_argument("--fluxo", choices=sorted(FLUXOS), default="despacho")
+    p.add_argument("--usuario", default="benchmark")
+    p.add_argument("--senha", default="replay", help="qualquer valor: a senha gravada está redigida")
+    p.add_argument("--login-url", help="padrão: URL do primeiro 'get' da gravação")
+    p.add_argument("--repeat", type=int, default=5)
+    p.add_argument("--speed", type=float, default=0.0, help="1.0 reproduz a latência gravada")
+    p.add_argument("--strict", action="store_true")
+    p.add_argument("--profile", action="store_true")
+    p.set_defaults(func=replay)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
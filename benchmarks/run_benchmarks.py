@@ -0,0 +1,205 @@
+"""
+Benchmarks de ponta a ponta contra a réplica local do SITAC (sitac_server.py).
+
+Cenários, repetidos --repeat vezes no mesmo navegador:
+    login        ConsultarProtocolosFlow.login (formulário + modal de notícias)
+    categoria    Protocolos → A receber → Aguardando resposta de despacho
+    paginacao    Paginator.iter_pages em todas as páginas da tabela .display
+    http         as mesmas páginas via Browser.fetch_table (sem navegador)
+
+Para cada cenário: tempo de parede (mediana), comandos WebDriver enviados
+(mediana) e pico de memória do processo Python (tracemalloc).
+
+--backend fake roda os mesmos cenários (menos o http) no FakeDriver em
+memória: sem navegador nem rede, sobra só o custo do framework.
+
+Uso:
+    python benchmarks/run_benchmarks.py [--rows 500] [--page-size 50] [--latency 0.05]
+        [--repeat 3] [--browser chrome] [--backend selenium|fake] [--lean] [--profile]
+        [--json resultado.json] [--baseline anterior.json] [--record sessao.jsonl.gz]
+
+Com --baseline, mostra a variação em relação a um --json gravado antes
+(ex: no commit anterior). --record grava os comandos WebDriver da execução
+para benchmark_replay.py.
+"""
+
+import os
+import sys
+
+sys.path.append(
+    os.path.dirname(os.path.dirname(__file__))
+)
+
+import argparse
+import json
+import statistics
+import time
+import tracemalloc
+from selenium.webdriver.common.by import By
+from benchmarks.sitac_server import SitacServer, LOGIN_PATH
+from components.paginator import Paginator
+from core.browser_manager import Browser
+from core.driver_backends import FakeBackend
+from flows.consultar_protocolos_flow import ConsultarProtocolosFlow
+from pages.login_page import LoginPage
+from utils.command_counter import CommandCounter
+from utils.logger import setup_logger
+
+
+logger = setup_logger()
+
+USUARIO = "benchmark"
+SENHA = "benchmark-senha"
+TABELA = (By.CSS_SELECTOR, ".display")
+PAGINAS = (By.CSS_SELECTOR, "[id^='Paginator_ProtocolosSetorFilial'] > label:nth-child(1) > a:nth-child({page})")
+FAKE_URL = "http://sitac.local"
+
+
+def medir(func, counter: CommandCounter) -> dict:
+    """Executa ``func`` medindo tempo, comandos WebDriver e pico de memória."""
+    tracemalloc.start()
+    try:
+        with counter.delta() as comandos:
+            inicio = time.perf_counter()
+            linhas = func()
+            tempo = time.perf_counter() - inicio
+        _, pico = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {
+        "wall": tempo,
+        "commands": sum(comandos.values()),
+        "peak_mib": pico / 1024 / 1024,
+        "rows": linhas if isinstance(linhas, int) else None,
+    }
+
+
+def cenarios(nav: Browser, server: SitacServer, http: bool = True):
+    flow = ConsultarProtocolosFlow(nav)
+
+    def login():
+        flow.login(USUARIO, SENHA)
+
+    def categoria():
+        flow.acessar_protocolos_aguardando_resposta_despacho()
+        nav.wait_for(TABELA[1])
+
+    def paginacao():
+        paginator = Paginator(nav, table=TABELA, page_locator=PAGINAS)
+        return sum(len(rows) for rows in paginator.iter_pages())
+
+    def fetch():
+        return sum(
+            len(nav.fetch_table(server.protocolos_url(0, page), TABELA[1], fallback=False) or [])
+            for page in range(1, server.pages() + 1)
+        )
+
+    lista = [("login", login), ("categoria", categoria), ("paginacao", paginacao)]
+    return lista + [("http", fetch)] if http else lista
+
+
+def executar(args) -> dict:
+    with SitacServer(args.rows, args.page_size, args.latency) as server:
+        fake = args.backend == "fake"
+        if fake:
+            LoginPage.URL = FAKE_URL + LOGIN_PATH + "#!"
+            backend = FakeBackend(server.fake_driver(FAKE_URL))
+        else:
+            LoginPage.URL = server.login_url
+            backend = args.backend
+
+        inicio = time.perf_counter()
+        nav = Browser(
+            browser=args.browser, headless=not args.headed, lean=args.lean,
+            profile=args.profile, backend=backend, record=args.record,
+        )
+        startup = time.perf_counter() - inicio
+
+        amostras = {}
+        try:
+            counter = CommandCounter(nav.driver)
+            for _ in range(args.repeat):
+                for nome, func in cenarios(nav, server, http=not fake):
+                    amostras.setdefault(nome, []).append(medir(func, counter))
+            por_comando = counter.by_command()
+            counter.detach()
+        finally:
+            nav.quit()
+
+    resultados = {
+        nome: {
+            "wall": statistics.median(a["wall"] for a in lista),
+            "commands": statistics.median(a["commands"] for a in lista),
+            "peak_mib": max(a["peak_mib"] for a in lista),
+            "rows": lista[-1]["rows"],
+        }
+        for nome, lista in amostras.items()
+    }
+    return {
+        "params": {
+            "browser": args.browser, "backend": args.backend, "rows": args.rows, "page_size": args.page_size,
+            "latency": args.latency, "repeat": args.repeat, "lean": args.lean,
+        },
+        "startup": startup,
+        "scenarios": resultados,
+        "commands_by_name": por_comando,
+    }
+
+
+def variacao(atual: float, anterior) -> str:
+    if not anterior:
+        return ""
+    return f" ({(atual - anterior) / anterior * 100:+.0f}%)"
+
+
+def relatorio(resultado: dict, baseline: dict = None) -> str:
+    anteriores = (baseline or {}).get("scenarios", {})
+    linhas = [
+        f"Inicialização do navegador: {resultado['startup']:.2f}s",
+        f"{'cenário':<10} {'tempo':>16} {'comandos':>16} {'pico MiB':>9} {'linhas':>7}",
+    ]
+    for nome, r in resultado["scenarios"].items():
+        antes = anteriores.get(nome, {})
+        tempo = f"{r['wall']:.3f}s{variacao(r['wall'], antes.get('wall'))}"
+        comandos = f"{r['commands']:g}{variacao(r['commands'], antes.get('commands'))}"
+        linhas_tabela = "" if r["rows"] is None else r["rows"]
+        linhas.append(
+            f"{nome:<10} {tempo:>16} {comandos:>16} {r['peak_mib']:>9.2f} {linhas_tabela:>7}"
+        )
+    mais_usados = list(resultado["commands_by_name"].items())[:8]
+    linhas.append("Comandos mais enviados: " + ", ".join(f"{c}={n}" for c, n in mais_usados))
+    return "\n".join(linhas)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=500)
+    parser.add_argument("--page-size", type=int, default=50)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--browser", default="chrome")
+    parser.add_argument("--backend", default="selenium", choices=("selenium", "fake"))
+    parser.add_argument("--headed", action="store_true")
+    parser.add_argument("--lean", action="store_true")
+    parser.add_argument("--profile", action="store_true", help="gera também o relatório do Profiler")
+    parser.add_argument("--json", help="grava o resultado neste arquivo")
+    parser.add_argument("--baseline", help="resultado anterior (--json) para comparação")
+    parser.add_argument("--record", help="grava os comandos WebDriver neste arquivo (.jsonl.gz)")
+    args = parser.parse_args()
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+
+    resultado = executar(args)
+    logger.info("Benchmarks SITAC local:\n%s", relatorio(resultado, baseline))
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(resultado, f, ensure_ascii=False, indent=2)
+        logger.info("Resultado gravado em %s", args.json)
+
+
+if __name__ == "__main__":
+    main()
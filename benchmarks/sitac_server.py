@@ -0,0 +1,434 @@
+"""
+SitacServer — réplica local do SITAC para benchmarks
+----------------------------------------------------
+Inclui:
+- Página de login com os mesmos locators de ``LoginPage`` (#username,
+  #password, #submit) e sessão por cookie
+- Home com #welcome_avatar, o #modal-noticias (carregado por fetch após o
+  login, como no site) e o menu lateral usado por ``UserHomePage``
+- Tabelas ``.display`` paginadas por AJAX, com o paginador do SITAC
+  (``#Paginator_ProtocolosSetorFilial<id> > label > a``, um link por página) e
+  quantidade de linhas e tamanho de página configuráveis
+- Latência artificial por requisição, para simular a rede
+- ``fake_driver()``: as mesmas páginas num ``FakeDriver`` em memória, com
+  o JavaScript da home reproduzido por handlers de clique
+
+Só as estruturas que o framework toca são reproduzidas; o visual não.
+
+Uso:
+    python benchmarks/sitac_server.py [--port 8765] [--rows 500] [--page-size 50] [--latency 0.05]
+
+Exemplo:
+    with SitacServer(rows=500, latency=0.05) as server:
+        LoginPage.URL = server.login_url
+        ...
+"""
+
+import os
+import sys
+
+sys.path.append(
+    os.path.dirname(os.path.dirname(__file__))
+)
+
+import argparse
+import html
+import secrets
+import threading
+import time
+from http.cookies import SimpleCookie
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+
+LOGIN_PATH = "/app/view/pages/login/login.php"
+LOGIN_POST_PATH = "/app/login.php"
+HOME_PATH = "/app/view/pages/home/home.php"
+NOTICIAS_PATH = "/app/api/noticias.php"
+PROTOCOLOS_PATH = "/app/api/protocolos.php"
+SESSION_COOKIE = "PHPSESSID"
+
+# id do paginador da tabela do setor N: #Paginator_ProtocolosSetorFilial<FILIAL + N>
+FILIAL = 2144
+
+# Categorias do menu "A receber" (índice de UserHomePage.CATEGORIAS)
+SETORES = (
+    "Aguardando resposta de despacho",
+    "Departamento de fiscalização",
+    "Pré-envio para câmaras",
+)
+COLUNAS = ("Protocolo", "Interessado", "Assunto", "Data", "Situação")
+
+_INTERESSADOS = ("Maria da Silva", "Construtora Alfa LTDA", "João Pereira", "Engenharia Beta S/A")
+_ASSUNTOS = ("Registro profissional", "Anotação de responsabilidade técnica", "Certidão", "Baixa de ART")
+
+
+LOGIN_HTML = """<!DOCTYPE html>
+<html lang="pt-br">
+<head><meta charset="utf-8"><title>SITAC — Login</title></head>
+<body>
+    <form id="form-login" method="post" action="{action}">
+        <input id="username" name="username" type="text">
+        <input id="password" name="password" type="password">
+        <button id="submit" type="submit">Entrar</button>
+        {erro}
+    </form>
+</body>
+</html>
+"""
+
+# O menu "Protocolos" precisa ser o 5º filho de .cad_conteudo
+# (UserHomePage.MENU_PROTOCOLOS); os submenus só aparecem após o clique.
+HOME_HTML = """<!DOCTYPE html>
+<html lang="pt-br">
+<head>
+    <meta charset="utf-8">
+    <title>SITAC — Início</title>
+    <style>
+        .oculto {{ display: none; }}
+        #modal-noticias {{ position: fixed; inset: 0; z-index: 10; background: rgba(0, 0, 0, .5); }}
+    </style>
+</head>
+<body>
+    <header><span id="welcome_avatar">{usuario}</span></header>
+
+    <div id="modal-noticias" class="iziModal oculto">
+        <div class="iziModal-header">
+            <button class="iziModal-button iziModal-button-close" type="button">×</button>
+        </div>
+        <div class="iziModal-content"></div>
+    </div>
+
+    <div id="conteudo">
+        <div class="cad_conteudo">
+            <div class="menu">Início</div>
+            <div class="menu">Cadastro</div>
+            <div class="menu">Financeiro</div>
+            <div class="menu">Documentos</div>
+            <div class="menu" id="menu-protocolos">Protocolos</div>
+            <div id="submenu-protocolos" class="oculto">
+                <a href="#" id="mostrarProtocolosAReceber">A receber</a>
+            </div>
+            <div id="setores" class="oculto">
+                {setores}
+            </div>
+        </div>
+        <div id="resultado"></div>
+    </div>
+
+    <script>
+        const $ = (selector) => document.querySelector(selector);
+        const show = (selector) => $(selector).classList.remove("oculto");
+        let setor = null;
+
+        fetch("{noticias}").then((r) => r.text()).then((conteudo) => {{
+            $("#modal-noticias .iziModal-content").innerHTML = conteudo;
+            show("#modal-noticias");
+        }});
+        $("#modal-noticias .iziModal-button-close").addEventListener("click", () => {{
+            $("#modal-noticias").classList.add("oculto");
+        }});
+
+        const carregar = (pagina) =>
+            fetch(`{protocolos}?setor=${{setor}}&page=${{pagina}}`)
+                .then((r) => r.text())
+                .then((conteudo) => {{ $("#resultado").innerHTML = conteudo; }});
+
+        $("#menu-protocolos").addEventListener("click", () => show("#submenu-protocolos"));
+        $("#mostrarProtocolosAReceber").addEventListener("click", (e) => {{
+            e.preventDefault();
+            show("#setores");
+        }});
+        document.querySelectorAll("#setores a").forEach((link) => {{
+            link.addEventListener("click", (e) => {{
+                e.preventDefault();
+                setor = link.dataset.setor;
+                carregar(1);
+            }});
+        }});
+        $("#resultado").addEventListener("click", (e) => {{
+            const link = e.target.closest("[id^='Paginator_ProtocolosSetorFilial'] a");
+            if (!link) return;
+            e.preventDefault();
+            carregar(link.dataset.page);
+        }});
+    </script>
+</body>
+</html>
+"""
+
+
+class SitacServer:
+    def __init__(
+        self,
+        rows: int = 200,
+        page_size: int = 50,
+        latency: float = 0.0,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        """
+        ``rows`` linhas por categoria, ``page_size`` por página e
+        ``latency`` segundos de atraso em toda resposta. ``port=0`` usa
+        uma porta livre (veja ``base_url``).
+        """
+        self.rows = rows
+        self.page_size = page_size
+        self.latency = latency
+        self.requests = 0
+        self._sessions = {}
+        self._lock = threading.Lock()
+
+        handler = type("Handler", (_SitacHandler,), {"sitac": self})
+        self.httpd = ThreadingHTTPServer((host, port), handler)
+        self.httpd.daemon_threads = True
+        self._thread = None
+
+    # ------------------------------------------------------------------
+    # URLs
+    # ------------------------------------------------------------------
+    @property
+    def base_url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def url(self, path: str) -> str:
+        return self.base_url + path
+
+    @property
+    def login_url(self) -> str:
+        """Equivalente local de ``LoginPage.URL``."""
+        return self.url(LOGIN_PATH + "#!")
+
+    def protocolos_url(self, setor: int, page: int = 1) -> str:
+        """URL do fragmento com a tabela de uma página (usada pelo AJAX da home)."""
+        return self.url(f"{PROTOCOLOS_PATH}?setor={setor}&page={page}")
+
+    def pages(self) -> int:
+        return max(1, -(-self.rows // self.page_size))
+
+    # ------------------------------------------------------------------
+    # Ciclo de vida
+    # ------------------------------------------------------------------
+    def start(self) -> "SitacServer":
+        self._thread = threading.Thread(target=self.httpd.serve_forever, name="sitac-server", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+    # ------------------------------------------------------------------
+    # Sessões e conteúdo
+    # ------------------------------------------------------------------
+    def _new_session(self, usuario: str) -> str:
+        token = secrets.token_hex(16)
+        with self._lock:
+            self._sessions[token] = usuario
+        return token
+
+    def _user_of(self, token: str):
+        with self._lock:
+            return self._sessions.get(token)
+
+    def row(self, setor: int, index: int) -> dict:
+        """Linha ``index`` da categoria ``setor`` (determinística)."""
+        numero = 2_100_000 + setor * 100_000 + index
+        return {
+            "Protocolo": f"{numero}/2025",
+            "Interessado": _INTERESSADOS[index % len(_INTERESSADOS)],
+            "Assunto": _ASSUNTOS[index % len(_ASSUNTOS)],
+            "Data": f"{index % 28 + 1:02d}/{index % 12 + 1:02d}/2025",
+            "Situação": SETORES[setor],
+        }
+
+    def home_html(self, usuario: str) -> str:
+        setores = "\n                ".join(
+            f'<a href="#" id="mostrarProtocoloSetorFilial{i}" data-setor="{i}">{html.escape(nome)}</a>'
+            for i, nome in enumerate(SETORES)
+        )
+        return HOME_HTML.format(
+            usuario=html.escape(usuario),
+            setores=setores,
+            noticias=NOTICIAS_PATH,
+            protocolos=PROTOCOLOS_PATH,
+        )
+
+    def table_html(self, setor: int, page: int) -> str:
+        inicio = (page - 1) * self.page_size
+        fim = min(inicio + self.page_size, self.rows)
+
+        linhas = []
+        for i in range(inicio, fim):
+            row = self.row(setor, i)
+            numero = row["Protocolo"].split("/")[0]
+            celulas = [f'<td><a href="detalhe.php?id={numero}">{row["Protocolo"]}</a></td>']
+            celulas += [f"<td>{html.escape(row[col])}</td>" for col in COLUNAS[1:]]
+            linhas.append(f"<tr>{''.join(celulas)}</tr>")
+
+        cabecalho = "".join(f"<th>{col}</th>" for col in COLUNAS)
+        # Paginador como o do SITAC: um link por página dentro de
+        # #Paginator_ProtocolosSetorFilial<id> > label
+        atual = ' class="atual"'
+        links = "".join(
+            f'<a href="#"{atual if n == page else ""} data-page="{n}">{n}</a>'
+            for n in range(1, self.pages() + 1)
+        )
+        return (
+            '<table class="display">'
+            f"<thead><tr>{cabecalho}</tr></thead>"
+            f"<tbody>{''.join(linhas)}</tbody>"
+            "</table>"
+            f'<div id="Paginator_ProtocolosSetorFilial{FILIAL + setor}"><label>{links}</label></div>'
+        )
+
+
+    # ------------------------------------------------------------------
+    # Versão em memória (sem servidor nem navegador)
+    # ------------------------------------------------------------------
+    def fake_driver(self, base_url: str = "http://sitac.local"):
+        """
+        ``FakeDriver`` com as páginas deste servidor sob ``base_url``; o
+        login leva direto à home. Use ``LoginPage.URL = base_url + LOGIN_PATH``.
+        """
+        from core.fake_driver import FakeDriver
+
+        # no fake só style/hidden escondem: os menus "ocultos" começam com hidden
+        home = self.home_html("benchmark")
+        for menu in ("submenu-protocolos", "setores"):
+            home = home.replace(f'id="{menu}" class="oculto"', f'id="{menu}" class="oculto" hidden')
+
+        driver = FakeDriver(pages={
+            base_url + LOGIN_PATH: LOGIN_HTML.format(action=LOGIN_POST_PATH, erro=""),
+            base_url + LOGIN_POST_PATH: home,
+        })
+        estado = {"setor": 0}
+
+        def carregar(page, pagina):
+            page.set_inner_html("#resultado", self.table_html(estado["setor"], pagina))
+
+        def abrir_setor(page, link):
+            estado["setor"] = int(link.get("data-setor"))
+            carregar(page, 1)
+
+        def paginar(page, link):
+            carregar(page, int(link.get("data-page")))
+
+        driver.on_click(".iziModal-button-close", lambda page, el: page.hide("#modal-noticias"))
+        driver.on_click("#menu-protocolos", lambda page, el: page.show("#submenu-protocolos"))
+        driver.on_click("#mostrarProtocolosAReceber", lambda page, el: page.show("#setores"))
+        driver.on_click("#setores a", abrir_setor)
+        driver.on_click("[id^='Paginator_ProtocolosSetorFilial'] a", paginar)
+        return driver
+
+
+class _SitacHandler(BaseHTTPRequestHandler):
+    sitac: SitacServer = None
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        self._delay()
+        parts = urlsplit(self.path)
+        query = parse_qs(parts.query)
+
+        if parts.path in ("/", LOGIN_PATH):
+            erro = '<p class="erro">Usuário ou senha inválidos.</p>' if "erro" in query else ""
+            return self._send(200, LOGIN_HTML.format(action=LOGIN_POST_PATH, erro=erro))
+
+        usuario = self.sitac._user_of(self._session_token())
+        if usuario is None:
+            if parts.path == HOME_PATH:
+                return self._redirect(LOGIN_PATH)
+            return self._send(401, "Sessão expirada.")
+
+        if parts.path == HOME_PATH:
+            return self._send(200, self.sitac.home_html(usuario))
+        if parts.path == NOTICIAS_PATH:
+            return self._send(200, "<h3>Notícias</h3><p>Manutenção programada no sábado.</p>")
+        if parts.path == PROTOCOLOS_PATH:
+            try:
+                setor = int(query.get("setor", ["0"])[0])
+                page = int(query.get("page", ["1"])[0])
+            except ValueError:
+                return self._send(400, "Parâmetros inválidos.")
+            if not 0 <= setor < len(SETORES) or not 1 <= page <= self.sitac.pages():
+                return self._send(404, "Página inexistente.")
+            return self._send(200, self.sitac.table_html(setor, page))
+        return self._send(404, "Não encontrado.")
+
+    def do_POST(self):
+        self._delay()
+        if urlsplit(self.path).path != LOGIN_POST_PATH:
+            return self._send(404, "Não encontrado.")
+
+        length = int(self.headers.get("Content-Length") or 0)
+        form = parse_qs(self.rfile.read(length).decode("utf-8"))
+        usuario = form.get("username", [""])[0]
+        senha = form.get("password", [""])[0]
+        if not usuario or not senha:
+            return self._redirect(LOGIN_PATH + "?erro=1")
+
+        token = self.sitac._new_session(usuario)
+        self._redirect(HOME_PATH, cookie=f"{SESSION_COOKIE}={token}; Path=/; HttpOnly")
+
+    # ------------------------------------------------------------------
+    # Auxiliares
+    # ------------------------------------------------------------------
+    def _delay(self):
+        with self.sitac._lock:
+            self.sitac.requests += 1
+        if self.sitac.latency:
+            time.sleep(self.sitac.latency)
+
+    def _session_token(self) -> str:
+        cookie = SimpleCookie(self.headers.get("Cookie", ""))
+        morsel = cookie.get(SESSION_COOKIE)
+        return morsel.value if morsel else ""
+
+    def _send(self, status: int, body: str):
+        data = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _redirect(self, location: str, cookie: str = None):
+        self.send_response(303)
+        self.send_header("Location", location)
+        if cookie:
+            self.send_header("Set-Cookie", cookie)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--rows", type=int, default=500)
+    parser.add_argument("--page-size", type=int, default=50)
+    parser.add_argument("--latency", type=float, default=0.05)
+    args = parser.parse_args()
+
+    server = SitacServer(args.rows, args.page_size, args.latency, args.host, args.port)
+    print(f"SITAC local em {server.login_url} (Ctrl+C para encerrar)")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
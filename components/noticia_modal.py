@@ -1,5 +1,6 @@
 from selenium.webdriver.common.by import By
 from core.base_page import BasePage
+from utils.decorators import time_it
 
 
 class NoticiaModal(BasePage):
@@ -14,12 +15,9 @@ class NoticiaModal(BasePage):
         """
         Retorna True se o modal estiver visível.
         """
-        try:
-            el = self.wait_for(self.MODAL, timeout=timeout)
-            return el.is_displayed()
-        except:
-            return False
+        return self.is_element_visible(self.MODAL, timeout=timeout)
 
+    @time_it(kind="step")
     def fechar(self):
         """
         Fecha o modal, caso esteja visível.
@@ -0,0 +1,140 @@
+from typing import Iterator, List, Optional, Tuple
+
+from selenium.common.exceptions import TimeoutException
+
+from core.base_page import BasePage
+from core.wait_engine import Condition
+from utils.decorators import time_it
+
+
+# Assinatura barata do conteúdo da tabela (nº de linhas + hash do texto),
+# calculada no navegador em um único round trip.
+TABLE_SIGNATURE_JS = """
+const table = arguments[0];
+const text = table.innerText || table.textContent || "";
+let hash = 5381;
+for (let i = 0; i < text.length; i++) {
+    hash = ((hash << 5) + hash + text.charCodeAt(i)) | 0;
+}
+return table.querySelectorAll("tr").length + ":" + hash;
+"""
+
+
+class Paginator(BasePage):
+    """
+    Componente que percorre uma tabela paginada, página a página.
+
+    A navegação usa um link de "próxima página" (``next_locator``) ou um
+    locator por número de página (``page_locator``, com ``{page}`` no seletor).
+    A troca de página é detectada pela assinatura do DOM da tabela, sem sleeps.
+
+    Exemplo:
+        paginator = Paginator(
+            browser,
+            table=(By.CSS_SELECTOR, ".display"),
+            page_locator=(By.CSS_SELECTOR, "#Paginator_ProtocolosSetorFilial2144 > label:nth-child(1) > a:nth-child({page})"),
+        )
+        with open_sink("saida.csv") as sink:
+            paginator.export(sink)
+    """
+
+    def __init__(
+        self,
+        browser,
+        table: Tuple[str, str],
+        next_locator: Optional[Tuple[str, str]] = None,
+        page_locator: Optional[Tuple[str, str]] = None,
+        max_pages: Optional[int] = None,
+        page_timeout: Optional[int] = None,
+    ):
+        super().__init__(browser)
+        if not next_locator and not page_locator:
+            raise ValueError("Paginator precisa de next_locator ou page_locator.")
+        self.table = table
+        self.next_locator = next_locator
+        self.page_locator = page_locator
+        self.max_pages = max_pages
+        self.page_timeout = page_timeout
+        self.current_page = 1
+
+    # ------------------------------------------------------------------
+    # Iteração
+    # ------------------------------------------------------------------
+    def iter_pages(self, start_page: int = 1) -> Iterator[List[dict]]:
+        """
+        Gera as linhas de cada página (uma lista por página), a partir de
+        ``start_page``. As páginas anteriores são puladas sem extração.
+        """
+        self.current_page = 1
+        while self.current_page < start_page:
+            if not self._next_page():
+                return
+
+        while True:
+            by, selector = self.table
+            yield self.browser.extract_table(selector, by=by)
+
+            if self.max_pages and self.current_page >= self.max_pages:
+                return
+            if not self._next_page():
+                return
+
+    def iter_rows(self, start_page: int = 1) -> Iterator[dict]:
+        """Gera as linhas de todas as páginas, uma a uma."""
+        for rows in self.iter_pages(start_page=start_page):
+            yield from rows
+
+    def export(self, sink, start_page: int = 1) -> int:
+        """Envia cada página ao sink assim que é extraída; retorna o total de linhas."""
+        total = 0
+        for rows in self.iter_pages(start_page=start_page):
+            total += sink.write_rows(rows)
+        return total
+
+    # ------------------------------------------------------------------
+    # Navegação
+    # ------------------------------------------------------------------
+    def signature(self) -> str:
+        """Assinatura do conteúdo atual da tabela."""
+        return self._with_element(
+            self.table, lambda table: self.execute_js(TABLE_SIGNATURE_JS, table)
+        )
+
+    @time_it(kind="step")
+    def _next_page(self) -> bool:
+        """Vai para a próxima página; False se não houver próxima."""
+        link = self._next_link()
+        if link is None:
+            return False
+
+        before = self.signature()
+        self.click(link)
+        try:
+            self.browser.wait_until(
+                Condition(lambda _: self.signature() != before, "table changed"),
+                timeout=self.page_timeout,
+            )
+        except TimeoutException:
+            self.browser.logger.warning(
+                "Tabela não mudou após ir para a página %s; encerrando paginação.", self.current_page + 1
+            )
+            return False
+
+        self.current_page += 1
+        return True
+
+    def _next_link(self) -> Optional[Tuple[str, str]]:
+        if self.page_locator:
+            by, selector = self.page_locator
+            locator = (by, selector.format(page=self.current_page + 1))
+            return locator if self.is_element_present(locator) else None
+
+        if not self.is_element_visible(self.next_locator):
+            return None
+        classes, aria_disabled = self._with_element(
+            self.next_locator,
+            lambda link: (link.get_attribute("class"), link.get_attribute("aria-disabled")),
+        )
+        if "disabled" in (classes or "").split() or aria_disabled == "true":
+            return None
+        return self.next_locator
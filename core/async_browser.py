@@ -0,0 +1,365 @@
+"""
+AsyncBrowser — front-end asyncio para o Browser
+-----------------------------------------------
+Inclui:
+- Chamadas ao driver executadas em um ThreadPoolExecutor compartilhado
+  (ASYNC_EXECUTOR_WORKERS); a thread só fica ocupada durante o round trip
+- Esperas feitas com polling + ``asyncio.sleep``: uma sessão esperando
+  um elemento não prende nenhuma thread
+- Mesma API do Browser (go_to, wait_for, click, type, extract_table,
+  abas e frames), com retry e captura de evidências equivalentes
+
+Exemplo:
+    async def consultar(url):
+        async with await AsyncBrowser.create(headless=True) as browser:
+            await browser.go_to(url)
+            return await browser.extract_table(".display")
+
+    async def main():
+        return await asyncio.gather(*(consultar(u) for u in urls))
+
+    resultados = asyncio.run(main())
+"""
+
+import asyncio
+import contextvars
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Awaitable, Callable, List, Optional, Union
+
+from selenium.common.exceptions import (
+    TimeoutException,
+    StaleElementReferenceException,
+)
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webelement import WebElement
+
+from core.browser_manager import (
+    Browser,
+    CLICK_ERRORS,
+    STALE_ERRORS,
+    StaleCachedElementError,
+)
+from core.config_manager import ConfigManager
+from core.wait_engine import Condition, CONDITIONS, present, visible
+from utils.decorators import RetryPolicy
+from utils.error_handler import capture_evidence, is_dead_session
+from utils.logger import REDACTED, register_secret
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+# Deadline de retry da task atual (equivalente assíncrono do estado thread-local
+# de ``retry_on_fail``): chamadas aninhadas nunca o estendem.
+_retry_deadline: contextvars.ContextVar = contextvars.ContextVar("async_retry_deadline", default=None)
+# Profundidade de chamadas aninhadas: só a mais externa captura evidências
+_call_depth: contextvars.ContextVar = contextvars.ContextVar("async_call_depth", default=0)
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """Executor compartilhado por todas as sessões assíncronas do processo."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=ConfigManager.get("ASYNC_EXECUTOR_WORKERS", 32, cast=int),
+                thread_name_prefix="async-browser",
+            )
+        return _executor
+
+
+# Mesmas políticas dos métodos equivalentes do Browser
+CLICK_POLICY = RetryPolicy(retries=3, delay=0.5, retry_on=CLICK_ERRORS, give_up_on=(StaleCachedElementError,))
+TYPE_POLICY = RetryPolicy(retries=3, delay=0.5, retry_on=STALE_ERRORS, give_up_on=(StaleCachedElementError,))
+WAIT_POLICY = RetryPolicy(retries=3, delay=0.5, retry_on=STALE_ERRORS)
+TABLE_POLICY = RetryPolicy(retries=2, delay=1.0, retry_on=STALE_ERRORS)
+
+
+class AsyncBrowser:
+    def __init__(self, browser: Browser):
+        """Envolve um Browser já iniciado. Para criar um novo, use ``await AsyncBrowser.create()``."""
+        self.browser = browser
+        self.driver = browser.driver
+        self.logger = browser.logger
+        self.explicit_timeout = browser.explicit_timeout
+        self.poll_interval = browser.waits.poll_interval
+
+    @classmethod
+    async def create(cls, **browser_kwargs) -> "AsyncBrowser":
+        """Inicia um ``Browser(**browser_kwargs)`` no executor, sem bloquear o loop."""
+        browser = await asyncio.get_running_loop().run_in_executor(
+            get_executor(), functools.partial(Browser, **browser_kwargs)
+        )
+        return cls(browser)
+
+    async def _run(self, func: Callable, *args, **kwargs):
+        """Executa uma chamada bloqueante (round trip ao driver) no executor."""
+        return await asyncio.get_running_loop().run_in_executor(
+            get_executor(), functools.partial(func, *args, **kwargs)
+        )
+
+    def _remaining_budget(self) -> Optional[float]:
+        deadline = _retry_deadline.get()
+        if deadline is None:
+            return None
+        return max(0.0, deadline - asyncio.get_running_loop().time())
+
+    async def _retrying(
+        self,
+        policy: RetryPolicy,
+        name: str,
+        attempt_fn: Callable[[], Awaitable],
+        timeout: Optional[float] = None,
+    ):
+        """
+        Equivalente assíncrono de ``retry_on_fail`` + ``capture_failures``:
+        repete ``attempt_fn`` segundo a política, dentro do orçamento de
+        retry (como ``_action_budget``), e captura evidências uma única vez
+        se a chamada falhar de vez.
+        """
+        loop = asyncio.get_running_loop()
+        outer = _retry_deadline.get()
+        deadline = loop.time() + max(self.browser.retry_budget, timeout or 0)
+        if outer is not None:
+            deadline = min(outer, deadline)
+        depth = _call_depth.get()
+        token = _retry_deadline.set(deadline)
+        depth_token = _call_depth.set(depth + 1)
+        try:
+            for attempt in range(1, policy.retries + 1):
+                try:
+                    return await attempt_fn()
+                except policy.retry_on as e:
+                    remaining = deadline - loop.time()
+                    if attempt == policy.retries or remaining <= 0 or isinstance(e, policy.give_up_on):
+                        raise
+                    pause = min(policy.pause_for(attempt), remaining)
+                    self.logger.warning(
+                        "Tentativa %s/%s de %s falhou: "
+                        "%s; nova tentativa em %.2fs",
+                        attempt, policy.retries, name, e.__class__.__name__, pause
+                    )
+                    await asyncio.sleep(pause)
+        except Exception as e:
+            if depth == 0 and not getattr(e, "_evidence_captured", False) and not is_dead_session(e):
+                await self._run(capture_evidence, self.driver, name)
+                try:
+                    e._evidence_captured = True
+                except AttributeError:
+                    pass
+                self.logger.error("Exceção capturada em %s: %s: %s", name, e.__class__.__name__, e)
+            raise
+        finally:
+            _call_depth.reset(depth_token)
+            _retry_deadline.reset(token)
+
+    # ------------------------------------------------------------------
+    # Navegação e Esperas
+    # ------------------------------------------------------------------
+    async def go_to(self, url: str):
+        await self._run(self.browser.go_to, url)
+
+    async def until(
+        self,
+        condition: Condition,
+        timeout: Optional[float] = None,
+        poll_interval: Optional[float] = None,
+    ):
+        """
+        Como ``WaitEngine.until``: cada avaliação da condição vai ao
+        executor e o intervalo entre elas é um ``asyncio.sleep``.
+        """
+        check = self.browser.waits.check
+        result = await self._run(check, condition)
+        if result:
+            return result
+
+        loop = asyncio.get_running_loop()
+        timeout = self.explicit_timeout if timeout is None else timeout
+        remaining_budget = self._remaining_budget()
+        if remaining_budget is not None:
+            timeout = min(timeout, remaining_budget)
+        poll = poll_interval or self.poll_interval
+        deadline = loop.time() + timeout
+
+        while True:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                raise TimeoutException(f"Condição não satisfeita em {timeout}s: {condition}")
+            await asyncio.sleep(min(poll, remaining))
+            result = await self._run(check, condition)
+            if result:
+                return result
+
+    async def wait_for(
+        self,
+        selector: str,
+        by: By = By.CSS_SELECTOR,
+        timeout: int = None,
+        condition: str = "present",
+    ):
+        """Espera o elemento satisfazer ``condition`` (ver ``Browser.wait_for``)."""
+        async def attempt():
+            self.logger.debug("Aguardando elemento (%s): %s", condition, selector)
+            try:
+                return await self.until(CONDITIONS[condition]((by, selector)), timeout=timeout)
+            except TimeoutException:
+                self.logger.error(
+                    "Timeout: elemento '%s' não ficou %s em %ss.",
+                    selector, condition, self.explicit_timeout if timeout is None else timeout
+                )
+                raise
+
+        return await self._retrying(WAIT_POLICY, "wait_for", attempt, timeout)
+
+    async def wait_until(self, condition: Condition, timeout: int = None):
+        return await self.until(condition, timeout=timeout)
+
+    async def wait_absent(self, selector: str, by: By = By.CSS_SELECTOR, timeout: int = None):
+        return await self.wait_for(selector, by=by, timeout=timeout, condition="absent")
+
+    async def is_present(self, selector: str, by: By = By.CSS_SELECTOR, timeout: float = 0) -> bool:
+        try:
+            return bool(await self.until(present((by, selector)), timeout=timeout))
+        except TimeoutException:
+            return False
+
+    async def is_visible(self, selector: str, by: By = By.CSS_SELECTOR, timeout: float = 0) -> bool:
+        try:
+            return bool(await self.until(visible((by, selector)), timeout=timeout))
+        except TimeoutException:
+            return False
+
+    # ------------------------------------------------------------------
+    # Abas e frames
+    # ------------------------------------------------------------------
+    async def new_tab(self, url: str = None):
+        await self._run(self.browser.new_tab, url)
+
+    async def tabs_count(self) -> int:
+        return await self._run(self.browser.tabs_count)
+
+    async def switch_to_tab(self, index: int):
+        await self._run(self.browser.switch_to_tab, index)
+
+    async def current_tab(self) -> int:
+        return await self._run(self.browser.current_tab)
+
+    async def close_tab(self):
+        await self._run(self.browser.close_tab)
+
+    async def close_all_other_tabs(self):
+        await self._run(self.browser.close_all_other_tabs)
+
+    async def switch_to_frame(self, selector: str, by=By.CSS_SELECTOR, timeout: int = None):
+        element = await self.wait_for(selector, by=by, timeout=timeout)
+        self.logger.info("Alternando para frame: %s", selector)
+        self.browser.context_epoch += 1
+        await self._run(self.driver.switch_to.frame, element)
+
+    async def switch_to_frame_by_index(self, index: int):
+        await self._run(self.browser.switch_to_frame_by_index, index)
+
+    async def switch_to_default(self):
+        await self._run(self.browser.switch_to_default)
+
+    # ------------------------------------------------------------------
+    # Ações de interação
+    # ------------------------------------------------------------------
+    async def _resolve(self, selector: Union[str, WebElement], by: By, timeout: int = None) -> WebElement:
+        if isinstance(selector, WebElement):
+            return selector
+        return await self.wait_for(selector, by=by, timeout=timeout)
+
+    async def click(self, selector: Union[str, WebElement], by: By = By.CSS_SELECTOR, timeout: int = None):
+        async def attempt():
+            element = await self._resolve(selector, by, timeout)
+            try:
+                await self._run(element.click)
+            except CLICK_ERRORS as e:
+                Browser._raise_if_cached_stale(selector, e)
+                raise
+            self.logger.info("Clique realizado com sucesso em '%s'", selector)
+
+        await self._retrying(CLICK_POLICY, "click", attempt, timeout)
+
+    async def type(
+        self,
+        selector: Union[str, WebElement],
+        text: str,
+        by: By = By.CSS_SELECTOR,
+        timeout: int = None,
+        clear_first: bool = True,
+        secret: bool = False,
+    ):
+        """Como ``Browser.type``: com ``secret=True`` o valor nunca aparece nos logs."""
+        if secret:
+            register_secret(text)
+        shown = REDACTED if secret else text
+
+        def send(element):
+            if clear_first:
+                element.clear()
+            element.send_keys(text)
+
+        async def attempt():
+            element = await self._resolve(selector, by, timeout)
+            try:
+                await self._run(send, element)
+            except StaleElementReferenceException as e:
+                Browser._raise_if_cached_stale(selector, e)
+                raise
+            self.logger.info("Texto '%s' inserido com sucesso em '%s'", shown, selector)
+
+        await self._retrying(TYPE_POLICY, "type", attempt, timeout)
+
+    async def get_text(self, selector: Union[str, WebElement], by: By = By.CSS_SELECTOR, timeout: int = None) -> str:
+        element = await self._resolve(selector, by, timeout)
+        try:
+            return await self._run(lambda: element.text)
+        except StaleElementReferenceException as e:
+            Browser._raise_if_cached_stale(selector, e)
+            raise
+
+    async def execute_script(self, script: str, *args):
+        return await self._run(self.browser.execute_script, script, *args)
+
+    # ------------------------------------------------------------------
+    # Extração de dados
+    # ------------------------------------------------------------------
+    async def extract_table(
+        self,
+        table_selector: str,
+        by: By = By.CSS_SELECTOR,
+        header: bool = True,
+        bulk: bool = True,
+        attributes: Optional[List[str]] = None,
+    ) -> List[dict]:
+        """Mesmo resultado de ``Browser.extract_table``."""
+        async def attempt():
+            self.logger.info("Extraindo tabela: %s", table_selector)
+            table = await self.wait_for(table_selector, by=by)
+            if bulk:
+                data = await self._run(self.browser._extract_table_bulk, table, header, attributes or [])
+            else:
+                data = await self._run(self.browser._extract_table_per_cell, table, header)
+            self.logger.info("Tabela extraída com %s linhas.", len(data))
+            return data
+
+        return await self._retrying(TABLE_POLICY, "extract_table", attempt)
+
+    # ------------------------------------------------------------------
+    # Utilitários
+    # ------------------------------------------------------------------
+    async def capture_evidence(self, name: str):
+        await self._run(self.browser.capture_evidence, name)
+
+    async def quit(self):
+        await self._run(self.browser.quit)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.quit()
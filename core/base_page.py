@@ -2,9 +2,17 @@
 BasePage — classe para o padrão Page Object Model (POM).
 """
 
+from selenium.common.exceptions import StaleElementReferenceException
 from selenium.webdriver.remote.webelement import WebElement
-from typing import Tuple
+from typing import Callable, Dict, Iterable, Tuple
 from core.browser_manager import Browser
+from utils.decorators import time_it
+
+
+def _label(locator: Tuple[str, str]) -> str:
+    """Locator (By, seletor) como texto para logs e profiler."""
+    by, selector = locator
+    return f"{by}={selector}"
 
 
 class BasePage:
@@ -13,6 +21,12 @@ class BasePage:
     Todas as páginas concretas devem herdar desta classe.
     Fornece métodos utilitários padronizados usando o
     BrowserManager como backend.
+
+    Os WebElements resolvidos ficam em cache por locator, no contexto
+    (URL/aba/frame) atual do Browser: uma página que toca o mesmo elemento
+    várias vezes não o procura de novo. O cache é descartado quando o
+    Browser navega ou troca de aba/frame, e a entrada é refeita quando o
+    elemento fica obsoleto (StaleElementReferenceException).
     """
 
     def __init__(self, browser: Browser):
@@ -23,48 +37,148 @@ class BasePage:
             raise TypeError("BasePage espera uma instância de Browser.")
         self.browser = browser
 
+        self._element_cache: Dict[Tuple[str, str], WebElement] = {}
+        self._cache_epoch = browser.context_epoch
+        self.cache_stats = {"hits": 0, "misses": 0, "invalidations": 0}
+
+    # ----------------------------------------------------------------------
+    # Cache de elementos
+    # ----------------------------------------------------------------------
+
+    def _cached_element(self, locator: Tuple[str, str], timeout: int = 10) -> WebElement:
+        if self._cache_epoch != self.browser.context_epoch:
+            self.clear_element_cache()
+            self._cache_epoch = self.browser.context_epoch
+
+        element = self._element_cache.get(locator)
+        if element is not None:
+            self.cache_stats["hits"] += 1
+            return element
+
+        self.cache_stats["misses"] += 1
+        by, selector = locator
+        element = self.browser.wait_for(selector, by=by, timeout=timeout)
+        self._element_cache[locator] = element
+        return element
+
+    def _with_element(self, locator: Tuple[str, str], action: Callable[[WebElement], object], timeout: int = 10):
+        """
+        Executa ``action(elemento)`` com o elemento em cache; se ele estiver
+        obsoleto, invalida a entrada, resolve o locator de novo e repete uma vez.
+        """
+        element = self._cached_element(locator, timeout)
+        try:
+            return action(element)
+        except StaleElementReferenceException:
+            self.invalidate_element(locator)
+            return action(self._cached_element(locator, timeout))
+
+    def invalidate_element(self, locator: Tuple[str, str]):
+        if self._element_cache.pop(locator, None) is not None:
+            self.cache_stats["invalidations"] += 1
+
+    def clear_element_cache(self):
+        self.cache_stats["invalidations"] += len(self._element_cache)
+        self._element_cache.clear()
+
     # ----------------------------------------------------------------------
     # Métodos de ações
     # ----------------------------------------------------------------------
 
+    @time_it
     def click(self, locator: Tuple[str, str], timeout: int = 10):
         """
         Clica em um elemento localizado pelo tuple (By, selector).
         """
-        by, selector = locator
-        return self.browser.click(selector, by=by, timeout=timeout)
+        return self._with_element(
+            locator, lambda el: self.browser.click(el, timeout=timeout, locator=_label(locator)), timeout
+        )
 
-    def type(self, locator: Tuple[str, str], text: str, clear_first: bool = True, timeout: int = 10):
+    @time_it
+    def type(self, locator: Tuple[str, str], text: str, clear_first: bool = True, timeout: int = 10, secret: bool = False):
         """
-        Digita texto em um elemento (By, selector).
+        Digita texto em um elemento (By, selector). ``secret=True`` omite o valor dos logs.
         """
-        by, selector = locator
-        return self.browser.type(
-            selector,
-            text,
-            by=by,
-            timeout=timeout,
-            clear_first=clear_first,
+        return self._with_element(
+            locator,
+            lambda el: self.browser.type(
+                el, text, timeout=timeout, clear_first=clear_first, secret=secret, locator=_label(locator)
+            ),
+            timeout,
         )
 
+    @time_it
+    def fill_form(
+        self,
+        fields: Dict[Tuple[str, str], object],
+        keystrokes: Iterable[Tuple[str, str]] = (),
+        timeout: int = 10,
+        secrets: Iterable[Tuple[str, str]] = (),
+    ):
+        """
+        Preenche vários campos {(By, selector): valor} em um único round trip.
+        Locators em ``keystrokes`` são digitados tecla a tecla; os valores dos
+        locators em ``secrets`` nunca aparecem nos logs.
+        """
+        return self.browser.fill_many(fields, keystrokes=keystrokes, timeout=timeout, secrets=secrets)
+
+    @time_it
     def get_text(self, locator: Tuple[str, str], timeout: int = 10) -> str:
         """
         Retorna o texto de um elemento localizado.
         """
-        by, selector = locator
-        return self.browser.wait_for(selector, by=by, timeout=timeout)
+        return self._with_element(
+            locator, lambda el: self.browser.get_text(el, timeout=timeout, locator=_label(locator)), timeout
+        )
 
-    def wait_for(self, locator: Tuple[str, str], timeout: int = 10) -> WebElement:
+    @time_it(kind="wait")
+    def wait_for(self, locator: Tuple[str, str], timeout: int = 10, condition: str = "present") -> WebElement:
         """
         Atalho: espera e retorna o WebElement.
+        ``condition``: "present", "visible", "clickable", "absent" ou "invisible".
+        Apenas "present" usa o cache de elementos.
+        """
+        if condition == "present":
+            return self._cached_element(locator, timeout)
+        by, selector = locator
+        return self.browser.wait_for(selector, by=by, timeout=timeout, condition=condition)
+
+    def wait_absent(self, locator: Tuple[str, str], timeout: int = 10):
+        """
+        Espera o elemento sair do DOM.
+        """
+        by, selector = locator
+        return self.browser.wait_absent(selector, by=by, timeout=timeout)
+
+    def wait_until_idle(self, timeout: int = None) -> bool:
+        """
+        Espera a página terminar requisições AJAX e mutações do DOM.
+        """
+        return self.browser.wait_until_idle(timeout=timeout)
+
+    # ----------------------------------------------------------------------
+    # Verificações (sem exceção)
+    # ----------------------------------------------------------------------
+
+    def is_element_present(self, locator: Tuple[str, str], timeout: float = 0) -> bool:
+        """
+        True se o elemento estiver no DOM em até ``timeout`` segundos.
         """
         by, selector = locator
-        return self.browser.wait_for(selector, by=by, timeout=timeout)
+        return self.browser.is_present(selector, by=by, timeout=timeout)
+
+    def is_element_visible(self, locator: Tuple[str, str], timeout: float = 0) -> bool:
+        """
+        True se o elemento estiver visível em até ``timeout`` segundos.
+        """
+        by, selector = locator
+        return self.browser.is_visible(selector, by=by, timeout=timeout)
 
     # ----------------------------------------------------------------------
     # Navegação (opcional por página)
     # ----------------------------------------------------------------------
 
+    @time_it
     def open(self, url: str):
         """Abre uma URL diretamente."""
         self.browser.go_to(url)
@@ -74,8 +188,9 @@ class BasePage:
     # ----------------------------------------------------------------------
     
     def scroll_to(self, locator: Tuple[str, str], timeout: int = 10):
-        by, selector = locator
-        return self.browser.scroll_to_element(selector, by=by, timeout=timeout)
+        return self._with_element(
+            locator, lambda el: self.browser.scroll_to_element(el, timeout=timeout), timeout
+        )
     
     def execute_js(self, script: str, *args):
         return self.browser.execute_script(script, *args)
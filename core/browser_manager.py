@@ -10,23 +10,233 @@ Inclui:
 
 import os
 import time
-from typing import Optional, List, Union
+import uuid
+import logging
+from urllib.parse import urljoin
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
 from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import (
     TimeoutException,
     StaleElementReferenceException,
     ElementClickInterceptedException,
     NoSuchElementException,
+    SessionNotCreatedException,
+    JavascriptException,
+    WebDriverException,
 )
 from selenium.webdriver import ActionChains
+from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.common.keys import Keys
-from core.config_manager import ConfigManager
-from utils.logger import setup_logger
-from utils.decorators import retry_on_fail
-from utils.error_handler import capture_failures
+from core.config_manager import ConfigManager, to_bool, to_list
+from core.driver_resolver import DriverResolver
+from core.driver_backends import DriverBackend, resolve_backend
+from core.wait_engine import WaitEngine, Condition, CONDITIONS, present, visible
+from utils.logger import setup_logger, register_secret, REDACTED
+from utils.decorators import retry_on_fail, remaining_budget, time_it
+from utils.error_handler import capture_failures, capture_evidence, flush_evidence
+from utils.profiler import Profiler
+
+
+# Recursos bloqueados no perfil "lean" (padrões do Network.setBlockedURLs)
+DEFAULT_LEAN_BLOCK_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico",
+    "*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot",
+    "*.mp4", "*.webm", "*.mp3", "*.ogg",
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+    "*facebook.net*", "*hotjar.com*",
+]
+
+# Exceções transitórias que justificam nova tentativa. TimeoutException não
+# entra aqui: a espera explícita já consome o tempo todo, repetir só multiplica.
+STALE_ERRORS = (StaleElementReferenceException,)
+CLICK_ERRORS = (StaleElementReferenceException, ElementClickInterceptedException)
+
+
+class StaleCachedElementError(StaleElementReferenceException):
+    """
+    WebElement recebido pronto (ex: do cache da BasePage) ficou obsoleto.
+    Não é repetido nem gera evidências: quem passou o elemento deve
+    resolver o locator de novo.
+    """
+
+    _evidence_captured = True
+
+
+def _action_budget(browser, *args, timeout: int = None, **kwargs) -> float:
+    """Orçamento total (s) de uma ação do Browser, incluindo chamadas aninhadas."""
+    return max(browser.retry_budget, timeout or 0)
+
+
+# Lê a tabela inteira (th/td + atributos opcionais) em um único round trip.
+# Replica a semântica do caminho célula a célula: todos os <tr> descendentes,
+# e para cada um os <th>/<td> descendentes, com o texto renderizado (innerText).
+EXTRACT_TABLE_JS = """
+const table = arguments[0];
+const attributes = arguments[1] || [];
+const text = (el) => (el.innerText !== undefined ? el.innerText : el.textContent) || "";
+const attrsOf = (cell) => {
+    const out = {};
+    for (const name of attributes) {
+        let value = cell.getAttribute(name);
+        if (value === null) {
+            const child = cell.querySelector("[" + name + "]");
+            value = child ? child.getAttribute(name) : null;
+        }
+        if (value !== null) {
+            out[name] = value;
+        }
+    }
+    return out;
+};
+const rows = [];
+for (const tr of table.querySelectorAll("tr")) {
+    const tds = Array.from(tr.querySelectorAll("td"));
+    rows.push({
+        th: Array.from(tr.querySelectorAll("th"), text),
+        td: tds.map(text),
+        attrs: attributes.length ? tds.map(attrsOf) : [],
+    });
+}
+return {rows: rows};
+"""
+
+# Instrumentação de "página ociosa": conta fetch/XHR pendentes e registra o
+# instante da última mutação do DOM. Idempotente por documento; retorna o
+# estado atual, então cada polling custa um único round trip.
+IDLE_PROBE_JS = """
+if (!window.__wafIdle) {
+    const state = {pending: 0, lastMutation: performance.now()};
+    window.__wafIdle = state;
+    const done = () => { state.pending = Math.max(0, state.pending - 1); };
+    if (window.fetch) {
+        const originalFetch = window.fetch;
+        window.fetch = function () {
+            state.pending++;
+            return originalFetch.apply(this, arguments).finally(done);
+        };
+    }
+    const originalSend = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function () {
+        state.pending++;
+        this.addEventListener("loadend", done, {once: true});
+        return originalSend.apply(this, arguments);
+    };
+    new MutationObserver(() => { state.lastMutation = performance.now(); })
+        .observe(document, {childList: true, subtree: true, attributes: true, characterData: true});
+}
+const s = window.__wafIdle;
+return {
+    ready: document.readyState,
+    pending: s.pending,
+    quiet: performance.now() - s.lastMutation,
+};
+"""
+
+# Preenche vários campos em um único round trip. Cada campo é
+# [by, selector, valor]; retorna um status por campo: "ok", "not_found",
+# "unsupported" (campos que precisam de digitação real) ou "error".
+FILL_MANY_JS = """
+const find = (by, selector) => {
+    switch (by) {
+        case "css selector": return document.querySelector(selector);
+        case "id": return document.getElementById(selector);
+        case "name": return document.getElementsByName(selector)[0] || null;
+        case "xpath":
+            return document.evaluate(
+                selector, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null
+            ).singleNodeValue;
+        default: return undefined;
+    }
+};
+const fire = (el) => {
+    el.dispatchEvent(new Event("input", {bubbles: true}));
+    el.dispatchEvent(new Event("change", {bubbles: true}));
+};
+const fill = (by, selector, value) => {
+    const el = find(by, selector);
+    if (el === undefined) return "unsupported";
+    if (el === null) return "not_found";
+    if (el.disabled || el.readOnly) return "unsupported";
+
+    const tag = el.tagName.toLowerCase();
+    const type = (el.type || "").toLowerCase();
+    // arquivo só aceita caminho via send_keys
+    if (tag === "input" && type === "file") return "unsupported";
+    if (tag === "input" && (type === "checkbox" || type === "radio")) {
+        el.checked = Boolean(value);
+        fire(el);
+        return "ok";
+    }
+    if (tag === "select") {
+        if (!Array.from(el.options).some((o) => o.value === String(value))) return "unsupported";
+        el.value = String(value);
+        fire(el);
+        return "ok";
+    }
+    if (tag === "input" || tag === "textarea") {
+        // setter nativo: frameworks (React etc.) observam o valor por ele
+        const setter = Object.getOwnPropertyDescriptor(Object.getPrototypeOf(el), "value").set;
+        el.focus();
+        setter.call(el, String(value));
+        fire(el);
+        el.blur();
+        return "ok";
+    }
+    return "unsupported";
+};
+// Um campo com erro (seletor inválido, controle que recusa o valor) não
+// derruba o lote: ele volta como "error" e é digitado campo a campo.
+return arguments[0].map(([by, selector, value]) => {
+    try {
+        return fill(by, selector, value);
+    } catch (e) {
+        return "error";
+    }
+});
+"""
+
+
+# Navegação sem bloquear: marca o documento atual e troca a URL. A aba está
+# pronta quando o documento novo (sem a marca) termina de carregar.
+TAB_NAVIGATE_JS = """
+window.__wafTabPending = true;
+window.location.href = arguments[0];
+"""
+TAB_READY_JS = "return !window.__wafTabPending && document.readyState === 'complete';"
+
+
+def table_rows_to_dicts(rows: List[dict], header: bool = True) -> List[dict]:
+    """
+    Converte as linhas no formato de ``EXTRACT_TABLE_JS`` (``{th, td, attrs}``)
+    na lista de dicionários de ``Browser.extract_table``.
+    """
+    data = []
+    headers = []
+
+    if header and rows:
+        first = rows[0]
+        if first["th"]:
+            headers = [th.strip() for th in first["th"]]
+            rows = rows[1:]
+        else:
+            headers = [f"col_{i}" for i in range(len(first["td"]))]
+
+    for r in rows:
+        values = [c.strip() for c in r["td"]]
+        if not values:
+            continue
+        row_obj = {
+            headers[i] if i < len(headers) else f"col_{i}": values[i]
+            for i in range(len(values))
+        }
+        for i, attrs in enumerate(r["attrs"]):
+            col = headers[i] if i < len(headers) else f"col_{i}"
+            for name, value in attrs.items():
+                row_obj[f"{col}_{name}"] = value
+        data.append(row_obj)
+
+    return data
 
 
 class Browser:
@@ -38,23 +248,85 @@ class Browser:
         implicit_wait: int = None,
         explicit_timeout: int = None,
         log_level: Union[str, int] = None,
+        lean: bool = None,
+        profile: bool = None,
+        backend: Union[str, DriverBackend] = None,
+        record: str = None,
     ):
-        
+        """
+        ``lean=True`` (ou LEAN_PROFILE na config) inicia o navegador com um
+        perfil enxuto para scraping de texto: sem imagens/mídia/fontes,
+        sem extensões e rede em background, viewport fixo (LEAN_VIEWPORT)
+        e, no Chrome, bloqueio por padrão de URL (LEAN_BLOCK_PATTERNS).
+
+        ``profile=True`` (ou PROFILE_ENABLED na config) mede cada ação,
+        espera e passo de fluxo; o relatório (JSON em PROFILE_DIR + tabela
+        top-N no log) é gerado no ``quit()``.
+
+        ``backend`` define de onde vem o driver: "selenium" (padrão, ou
+        DRIVER_BACKEND na config), "fake" ou uma instância de
+        ``DriverBackend`` (ex: ``FakeBackend(pages=...)``).
+
+        ``record`` (ou RECORD_COMMANDS na config) grava todos os comandos
+        enviados ao driver, com resposta e duração, nesse arquivo
+        (.jsonl.gz), para replay com ``ReplayBackend``.
+        """
         cfg = ConfigManager
 
-        self.browser_name = browser.lower() or cfg.get("BROWSER", "chrome")
-        self.headless = headless if headless is not None else ctg.get("HEADLESS", True, cast=bool)
-        # self.driver_path = driver_path
-        self.implicit_wait = implicit_wait or cfg.get("IMPLICIT_WAIT", 5, cast=int)
+        self.browser_name = (browser or cfg.get("BROWSER", "chrome")).lower()
+        self.headless = headless if headless is not None else cfg.get("HEADLESS", True, cast=to_bool)
+        self.driver_path = driver_path
+        # Implicit wait fica sempre em 0: somado às esperas explícitas, ele
+        # atrasava verificações negativas. O parâmetro é mantido por compatibilidade.
+        self.implicit_wait = 0
         self.explicit_timeout = explicit_timeout or cfg.get("EXPLICIT_TIMEOUT", 10, cast=int)
+        self.retry_budget = cfg.get("RETRY_BUDGET", self.explicit_timeout * 2, cast=float)
         self.log_level = log_level or cfg.get("LOG_LEVEL", "INFO")
+        self.lean = lean if lean is not None else cfg.get("LEAN_PROFILE", False, cast=to_bool)
+        self.lean_block_patterns = cfg.get("LEAN_BLOCK_PATTERNS", DEFAULT_LEAN_BLOCK_PATTERNS, cast=to_list)
+        self.viewport = tuple(int(v) for v in cfg.get("LEAN_VIEWPORT", [1280, 800], cast=to_list))
         
-        self.logger = setup_logger("browser", level=self.log_level)
+        # Identifica a sessão nos logs (campo session_id) quando há vários Browsers
+        self.session_id = uuid.uuid4().hex[:8]
+        self.logger = logging.LoggerAdapter(
+            setup_logger("browser", level=self.log_level), {"session_id": self.session_id}
+        )
+        self.profiler = Profiler(
+            enabled=profile if profile is not None else cfg.get("PROFILE_ENABLED", False, cast=to_bool)
+        )
+        self.profile_dir = cfg.get("PROFILE_DIR", "logs/profiles")
+        self.profile_top_n = cfg.get("PROFILE_TOP_N", 15, cast=int)
+
+        self.backend = resolve_backend(backend)
 
-        self.logger.info(f"Iniciando navegador: {self.browser_name} (headless={self.headless})")
-        self.driver = self._start_driver()
+        self.logger.info(
+            "Iniciando navegador: %s (headless=%s, lean=%s, backend=%s)",
+            self.browser_name, self.headless, self.lean, self.backend.name
+        )
+        start = time.perf_counter()
+        self.driver_resolve_time = 0.0
+        self.driver = self.backend.start(self)
+        self.recorder = None
+        record = record or cfg.get("RECORD_COMMANDS")
+        if record:
+            from core.command_replay import RecordingConnection
+
+            self.recorder = RecordingConnection.attach(self.driver, record)
+            self.logger.info("Gravando comandos do driver em %s", record)
         self.driver.implicitly_wait(self.implicit_wait)
-        self.logger.info("WebDriver inicializado com sucesso.")
+        self.waits = WaitEngine(self.driver, timeout=self.explicit_timeout)
+        self.idle_quiet_ms = cfg.get("IDLE_QUIET_MS", 300, cast=int)
+        self.tab_fanout = cfg.get("TAB_FANOUT", 4, cast=int)
+        self._http = None  # HttpSession criada no primeiro fetch_table
+        # Incrementado a cada navegação/troca de aba ou frame; invalida caches de elementos
+        self.context_epoch = 0
+        self._install_idle_probe()
+        self.startup_time = time.perf_counter() - start
+        self.logger.info(
+            "WebDriver inicializado com sucesso em %.2fs "
+            "(resolução do driver: %.2fs).",
+            self.startup_time, self.driver_resolve_time
+        )
 
     # ------------------------------------------------------------------
     # Inicialização do driver
@@ -63,58 +335,251 @@ class Browser:
         if self.browser_name == "chrome":
             from selenium.webdriver.chrome.options import Options
             from selenium.webdriver.chrome.service import Service as ChromeService
-            from webdriver_manager.chrome import ChromeDriverManager
 
             options = Options()
             if self.headless:
                 options.add_argument("--headless=new")
             options.add_argument("--no-sandbox")
             options.add_argument("--disable-dev-shm-usage")
+            if self.lean:
+                self._apply_lean_chrome(options)
 
-            driver_path = ChromeDriverManager().install()
-            self.logger.info(f"ChromeDriver obtido em: {driver_path}")
-            
-            service = ChromeService(driver_path)
-            return webdriver.Chrome(service=service, options=options)
+            driver = self._launch_driver(webdriver.Chrome, ChromeService, options)
+            if self.lean:
+                self._block_urls_chrome(driver)
+            return driver
 
         elif self.browser_name == "firefox":
             from selenium.webdriver.firefox.options import Options
             from selenium.webdriver.firefox.service import Service as FirefoxService
-            from webdriver_manager.firefox import GeckoDriverManager
 
             options = Options()
-            options.headless = self.headless
-            
-            driver_path = GeckoDriverManager().install()
-            self.logger.info(f"GeckoDriver obtido em: {driver_path}")
-            
-            service = FirefoxService(driver_path)
-            return webdriver.Firefox(service=service, options=options)
+            if self.headless:
+                options.add_argument("-headless")
+            if self.lean:
+                self._apply_lean_firefox(options)
+
+            return self._launch_driver(webdriver.Firefox, FirefoxService, options)
 
         else:
             raise ValueError(f"Browser '{self.browser_name}' não suportado.")
 
+    # ------------------------------------------------------------------
+    # Perfil "lean" (scraping de texto)
+    # ------------------------------------------------------------------
+    def _apply_lean_chrome(self, options):
+        width, height = self.viewport
+        for arg in (
+            "--disable-extensions",
+            "--disable-background-networking",
+            "--disable-component-update",
+            "--disable-default-apps",
+            "--disable-sync",
+            "--mute-audio",
+            "--blink-settings=imagesEnabled=false",
+            f"--window-size={width},{height}",
+        ):
+            options.add_argument(arg)
+        options.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2,
+            "profile.default_content_setting_values.notifications": 2,
+        })
+
+    def _block_urls_chrome(self, driver):
+        """Bloqueia fontes, mídia e analytics por padrão de URL (via CDP)."""
+        try:
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": self.lean_block_patterns})
+        except Exception as e:
+            self.logger.warning("Não foi possível bloquear URLs via CDP: %s", e)
+
+    def _apply_lean_firefox(self, options):
+        width, height = self.viewport
+        options.add_argument(f"--width={width}")
+        options.add_argument(f"--height={height}")
+        for key, value in {
+            "permissions.default.image": 2,
+            "media.autoplay.default": 5,
+            "media.autoplay.blocking_policy": 2,
+            "gfx.downloadable_fonts.enabled": False,
+            "browser.display.use_document_fonts": 0,
+            "network.prefetch-next": False,
+            "network.dns.disablePrefetch": True,
+            "network.http.speculative-parallel-limit": 0,
+            "extensions.update.enabled": False,
+            "app.update.auto": False,
+            "browser.safebrowsing.malware.enabled": False,
+            "browser.safebrowsing.phishing.enabled": False,
+            "datareporting.healthreport.uploadEnabled": False,
+            "toolkit.telemetry.enabled": False,
+        }.items():
+            options.set_preference(key, value)
+
+    def _launch_driver(self, driver_cls, service_cls, options):
+        """Resolve o binário do driver (cache/pin/webdriver-manager) e inicia a sessão."""
+        resolver = DriverResolver()
+
+        start = time.perf_counter()
+        driver_path, source = resolver.resolve(self.browser_name, self.driver_path)
+        self.driver_resolve_time = time.perf_counter() - start
+        self.logger.info(
+            "Driver de %s obtido em: %s "
+            "(origem: %s, %.2fs)",
+            self.browser_name, driver_path, source, self.driver_resolve_time
+        )
+
+        try:
+            driver = driver_cls(service=service_cls(driver_path), options=options)
+        except SessionNotCreatedException:
+            if source != "cache":
+                raise
+            # Navegador foi atualizado e o driver em cache ficou incompatível
+            self.logger.warning("Driver em cache incompatível com o navegador, resolvendo novamente...")
+            resolver.invalidate(self.browser_name)
+            driver_path, source = resolver.resolve(self.browser_name)
+            driver = driver_cls(service=service_cls(driver_path), options=options)
+
+        resolver.record_browser_version(
+            self.browser_name, driver.capabilities.get("browserVersion")
+        )
+        return driver
+
+    def _install_idle_probe(self):
+        """
+        No Chrome, registra a instrumentação de ociosidade para rodar no início
+        de todo documento novo (captura também as requisições do carregamento).
+        Nos demais navegadores ela é injetada sob demanda por wait_until_idle.
+        """
+        if not hasattr(self.driver, "execute_cdp_cmd"):
+            return
+        try:
+            self.driver.execute_cdp_cmd(
+                "Page.addScriptToEvaluateOnNewDocument", {"source": IDLE_PROBE_JS}
+            )
+        except Exception as e:
+            self.logger.debug("Instrumentação via CDP indisponível: %s", e)
+
     # ------------------------------------------------------------------
     # Navegação e Esperas
     # ------------------------------------------------------------------
+    @time_it
     def go_to(self, url: str):
-        self.logger.info(f"Acessando URL: {url}")
+        self.logger.info("Acessando URL: %s", url)
+        self.context_epoch += 1
         self.driver.get(url)
 
+    def page_load_time(self) -> Optional[float]:
+        """Tempo (s) de carregamento do documento atual, via Navigation Timing."""
+        ms = self.driver.execute_script(
+            "const nav = performance.getEntriesByType('navigation')[0];"
+            "return nav ? nav.loadEventEnd - nav.startTime : null;"
+        )
+        return ms / 1000 if ms else None
+
+    def _bounded_timeout(self, timeout: Optional[float]) -> float:
+        """Limita o timeout ao que resta do orçamento de retry ativo."""
+        timeout = self.explicit_timeout if timeout is None else timeout
+        remaining = remaining_budget()
+        if remaining is not None:
+            timeout = min(timeout, remaining)
+        return timeout
+
+    @time_it(kind="wait")
     @capture_failures
-    @retry_on_fail(retries=3, delay=1.5)
-    def wait_for(self, selector: str, by: By = By.CSS_SELECTOR, timeout: int = None):
-        self.logger.debug(f"Aguardando elemento: {selector}")
-        timeout = timeout or self.explicit_timeout
+    @retry_on_fail(retries=3, delay=0.5, retry_on=STALE_ERRORS, budget=_action_budget)
+    def wait_for(
+        self,
+        selector: str,
+        by: By = By.CSS_SELECTOR,
+        timeout: int = None,
+        condition: str = "present",
+    ):
+        """
+        Espera o elemento satisfazer ``condition`` ("present", "visible",
+        "clickable", "absent" ou "invisible") e retorna o WebElement
+        (ou True para as condições negativas).
+        """
+        self.logger.debug("Aguardando elemento (%s): %s", condition, selector)
+        timeout = self._bounded_timeout(timeout)
         try:
-            wait = WebDriverWait(self.driver, timeout)
-            element = wait.until(EC.presence_of_element_located((by, selector)))
-            self.logger.debug(f"Elemento localizado: {selector}")
-            return element
+            result = self.waits.until(CONDITIONS[condition]((by, selector)), timeout=timeout)
+            self.logger.debug("Elemento localizado: %s", selector)
+            return result
         except TimeoutException as e:
-            self.logger.error(f"Timeout: elemento '{selector}' não encontrado em {timeout}s.")
+            self.logger.error("Timeout: elemento '%s' não ficou %s em %ss.", selector, condition, timeout)
             raise e
 
+    @time_it(kind="wait")
+    def wait_until(self, condition: Condition, timeout: int = None):
+        """Espera uma condição composta do WaitEngine (ex: any_of(...))."""
+        return self.waits.until(condition, timeout=self._bounded_timeout(timeout))
+
+    def wait_absent(self, selector: str, by: By = By.CSS_SELECTOR, timeout: int = None):
+        """Espera o elemento sair do DOM."""
+        return self.wait_for(selector, by=by, timeout=timeout, condition="absent")
+
+    @time_it(kind="wait")
+    def wait_until_idle(
+        self,
+        timeout: float = None,
+        quiet_ms: int = None,
+        poll_interval: float = None,
+    ) -> bool:
+        """
+        Espera a página "assentar": documento carregado, nenhum fetch/XHR
+        pendente e nenhuma mutação do DOM há ``quiet_ms`` milissegundos.
+
+        Retorna False (sem exceção) se a página não ficar ociosa no timeout,
+        por exemplo em páginas com animações ou polling contínuos.
+        """
+        quiet_ms = self.idle_quiet_ms if quiet_ms is None else quiet_ms
+
+        def check(driver):
+            try:
+                state = driver.execute_script(IDLE_PROBE_JS)
+            except JavascriptException:
+                # documento trocando no meio da navegação
+                return False
+            return (
+                state["ready"] == "complete"
+                and state["pending"] == 0
+                and state["quiet"] >= quiet_ms
+            )
+
+        timeout = self._bounded_timeout(timeout)
+        start = time.perf_counter()
+        try:
+            self.waits.until(
+                Condition(check, "page idle"),
+                timeout=timeout,
+                poll_interval=poll_interval,
+            )
+        except TimeoutException:
+            self.logger.warning("Página não ficou ociosa em %ss, seguindo.", timeout)
+            return False
+
+        self.logger.debug("Página ociosa após %.2fs", time.perf_counter() - start)
+        return True
+
+    @time_it(kind="wait")
+    def is_present(self, selector: str, by: By = By.CSS_SELECTOR, timeout: float = 0) -> bool:
+        """
+        Verificação sem exceção e sem captura de evidências: True se o
+        elemento estiver presente em até ``timeout`` segundos (0 = checagem única).
+        """
+        try:
+            return bool(self.waits.until(present((by, selector)), timeout=timeout))
+        except TimeoutException:
+            return False
+
+    @time_it(kind="wait")
+    def is_visible(self, selector: str, by: By = By.CSS_SELECTOR, timeout: float = 0) -> bool:
+        """Como ``is_present``, mas exige que o elemento esteja visível."""
+        try:
+            return bool(self.waits.until(visible((by, selector)), timeout=timeout))
+        except TimeoutException:
+            return False
+
     # --------------------------------------------------------------
     # CONTROLE DE ABAS E JANELAS
     # --------------------------------------------------------------
@@ -129,6 +594,7 @@ class Browser:
     def tabs_count(self) -> int:
         return len(self.driver.window_handles)
 
+    @time_it
     @capture_failures
     def switch_to_tab(self, index: int):
         """Troca para a aba pelo índice."""
@@ -136,7 +602,8 @@ class Browser:
         if index < 0 or index >= len(handles):
             raise IndexError(f"Índice de aba inválido: {index}")
 
-        self.logger.info(f"Alterando para aba {index}")
+        self.logger.info("Alterando para aba %s", index)
+        self.context_epoch += 1
         self.driver.switch_to.window(handles[index])
 
     def current_tab(self) -> int:
@@ -146,6 +613,7 @@ class Browser:
     def close_tab(self):
         """Fecha a aba atual e muda para a última."""
         self.logger.info("Fechando aba atual")
+        self.context_epoch += 1
         self.driver.close()
         if self.tabs_count() > 0:
             self.switch_to_tab(self.tabs_count() - 1)
@@ -155,82 +623,262 @@ class Browser:
         current_handle = self.driver.current_window_handle
         all_handles = self.driver.window_handles
 
-        self.logger.info(f"Fechando demais abas")
+        self.logger.info("Fechando demais abas")
         for handle in all_handles:
             if handle != current_handle:
                 self.driver.switch_to.window(handle)
                 self.driver.close()
 
         self.logger.info("Retornando à aba atual")
+        self.context_epoch += 1
         self.driver.switch_to.window(current_handle)
 
+    @time_it
+    def fan_out_tabs(
+        self,
+        urls: List[str],
+        callback: Callable[["Browser", str], object],
+        max_tabs: int = None,
+        timeout: float = None,
+    ) -> list:
+        """
+        Abre ``urls`` em até ``max_tabs`` abas da sessão atual (mesmos
+        cookies/login) com os carregamentos em paralelo, e chama
+        ``callback(browser, url)`` em rodízio, na aba de cada URL, assim
+        que ela fica pronta. A aba liberada recebe a próxima URL da fila.
+
+        URLs relativas são resolvidas contra a página atual (as abas novas
+        começam em ``about:blank``). Retorna os resultados na ordem de
+        ``urls``; ``callback`` recebe a URL como foi passada. Ao final as abas
+        extras são fechadas e o foco volta à aba original. Uma aba que não
+        carregar em ``timeout`` segundos é processada assim mesmo (com aviso).
+        """
+        max_tabs = max_tabs or self.tab_fanout
+        timeout = self.explicit_timeout if timeout is None else timeout
+        origin = self.driver.current_window_handle
+        base = self.driver.current_url
+        results = [None] * len(urls)
+        queue = list(enumerate(urls))[::-1]
+        busy = []  # [handle, índice, início do carregamento]
+        opened = []
+
+        def navigate(handle, index):
+            self.driver.execute_script(TAB_NAVIGATE_JS, urljoin(base, urls[index]))
+            busy.append([handle, index, time.monotonic()])
+
+        self.logger.info("Abrindo %s URLs em até %s abas", len(urls), max_tabs)
+        try:
+            while queue and len(opened) < max_tabs:
+                self.driver.switch_to.new_window("tab")
+                handle = self.driver.current_window_handle
+                opened.append(handle)
+                navigate(handle, queue.pop()[0])
+
+            while busy:
+                progressed = False
+                for slot in list(busy):
+                    handle, index, started = slot
+                    self.context_epoch += 1
+                    self.driver.switch_to.window(handle)
+                    if not self._tab_ready():
+                        if time.monotonic() - started < timeout:
+                            continue
+                        self.logger.warning("Aba não carregou em %ss, seguindo: %s", timeout, urls[index])
+
+                    busy.remove(slot)
+                    progressed = True
+                    results[index] = callback(self, urls[index])
+                    if queue:
+                        navigate(handle, queue.pop()[0])
+
+                if not progressed:
+                    time.sleep(self.waits.poll_interval)
+        finally:
+            for handle in opened:
+                try:
+                    self.driver.switch_to.window(handle)
+                    self.driver.close()
+                except WebDriverException:
+                    pass
+            self.context_epoch += 1
+            self.driver.switch_to.window(origin)
+
+        return results
+
+    def _tab_ready(self) -> bool:
+        try:
+            return bool(self.driver.execute_script(TAB_READY_JS))
+        except JavascriptException:
+            # documento sendo trocado no meio da checagem
+            return False
+
     # --------------------------------------------------------------
     # CONTROLE DE FRAMES
     # --------------------------------------------------------------
+    @time_it
     @capture_failures
     def switch_to_frame(self, selector: str, by=By.CSS_SELECTOR, timeout: int = None):
         """Troca para um frame localizado por seletor CSS."""
-        self.logger.info(f"Alternando para frame: {selector}")
+        self.logger.info("Alternando para frame: %s", selector)
         timeout = timeout or self.explicit_timeout
         el = self.wait_for(selector, by=by, timeout=timeout)
+        self.context_epoch += 1
         self.driver.switch_to.frame(el)
 
     def switch_to_frame_by_index(self, index: int):
         """Troca para um frame pelo índice numérico."""
-        self.logger.info(f"Alternando para frame índice: {index}")
+        self.logger.info("Alternando para frame índice: %s", index)
+        self.context_epoch += 1
         self.driver.switch_to.frame(index)
 
     def switch_to_default(self):
         """Sai do frame e volta para o conteúdo principal."""
         self.logger.info("Retornando ao conteúdo principal (default content)")
+        self.context_epoch += 1
         self.driver.switch_to.default_content()
 
     # ------------------------------------------------------------------
     # Ações de interação
     # ------------------------------------------------------------------
+    @time_it
     @capture_failures
-    @retry_on_fail(retries=3, delay=2.0)
-    def click(self, selector: str, by: By = By.CSS_SELECTOR, timeout: int = None):
-        self.logger.debug(f"Tentando clicar em: {selector}")
-        timeout = timeout or self.explicit_timeout
-        element = self.wait_for(selector, by=by, timeout=timeout)
+    @retry_on_fail(retries=3, delay=0.5, retry_on=CLICK_ERRORS, give_up_on=(StaleCachedElementError,), budget=_action_budget)
+    def click(
+        self,
+        selector: Union[str, WebElement],
+        by: By = By.CSS_SELECTOR,
+        timeout: int = None,
+        locator: str = None,
+    ):
+        """
+        Clica no elemento. ``locator``: rótulo usado nos logs e no profiler
+        quando ``selector`` é um WebElement já resolvido.
+        """
+        label = locator or selector
+        self.logger.debug("Tentando clicar em: %s", label)
+        element = self._resolve(selector, by=by, timeout=timeout)
         try:
             element.click()
-            self.logger.info(f"Clique realizado com sucesso em '{selector}'")
+            self.logger.info("Clique realizado com sucesso em '%s'", label)
         except (ElementClickInterceptedException, StaleElementReferenceException) as e:
-            self.logger.warning(f"Falha ao clicar ({e.__class__.__name__}), tentando novamente...")
+            self._raise_if_cached_stale(selector, e)
+            self.logger.warning("Falha ao clicar (%s), tentando novamente...", e.__class__.__name__)
             raise e
 
+    @time_it
     @capture_failures
-    @retry_on_fail(retries=3, delay=1.5)
+    @retry_on_fail(retries=3, delay=0.5, retry_on=STALE_ERRORS, give_up_on=(StaleCachedElementError,), budget=_action_budget)
     def type(
         self,
-        selector: str,
+        selector: Union[str, WebElement],
         text: str,
         by: By = By.CSS_SELECTOR,
         timeout: int = None,
         clear_first: bool = True,
+        secret: bool = False,
+        locator: str = None,
     ):
-        self.logger.debug(f"Digitando em {selector}: '{text}'")
-        timeout = timeout or self.explicit_timeout
-        element = self.wait_for(selector, by=by, timeout=timeout)
+        """
+        Digita ``text`` no elemento. Com ``secret=True`` (senhas, tokens) o
+        valor é registrado para redação e nunca aparece nos logs.
+        ``locator`` como em ``click``.
+        """
+        if secret:
+            register_secret(text)
+        shown = REDACTED if secret else text
+        label = locator or selector
+        self.logger.debug("Digitando em %s: '%s'", label, shown)
+        element = self._resolve(selector, by=by, timeout=timeout)
         try:
             if clear_first:
                 element.clear()
             element.send_keys(text)
-            self.logger.info(f"Texto '{text}' inserido com sucesso em '{selector}'")
+            self.logger.info("Texto '%s' inserido com sucesso em '%s'", shown, label)
         except StaleElementReferenceException as e:
-            self.logger.warning(f"Falha ao digitar ({e.__class__.__name__}), tentando novamente...")
+            self._raise_if_cached_stale(selector, e)
+            self.logger.warning("Falha ao digitar (%s), tentando novamente...", e.__class__.__name__)
             raise e
 
+    @time_it
     @capture_failures
-    def get_text(self, selector: str, by: By = By.CSS_SELECTOR, timeout: int = None) -> str:
-        timeout = timeout or self.explicit_timeout
-        element = self.wait_for(selector, by=by, timeout=timeout)
-        text = element.text
-        self.logger.debug(f"Texto obtido de '{selector}': {text[:50]}")
+    def get_text(
+        self,
+        selector: Union[str, WebElement],
+        by: By = By.CSS_SELECTOR,
+        timeout: int = None,
+        locator: str = None,
+    ) -> str:
+        """Texto do elemento. ``locator`` como em ``click``."""
+        element = self._resolve(selector, by=by, timeout=timeout)
+        try:
+            text = element.text
+        except StaleElementReferenceException as e:
+            self._raise_if_cached_stale(selector, e)
+            raise
+        self.logger.debug("Texto obtido de '%s': %s", locator or selector, text[:50])
         return text
 
+    @time_it
+    @capture_failures
+    def fill_many(
+        self,
+        fields: Dict[Union[str, Tuple[str, str]], object],
+        by: By = By.CSS_SELECTOR,
+        keystrokes: Iterable[Union[str, Tuple[str, str]]] = (),
+        timeout: int = None,
+        secrets: Iterable[Union[str, Tuple[str, str]]] = (),
+    ):
+        """
+        Preenche vários campos de uma vez: ``{seletor ou (By, seletor): valor}``.
+
+        Os valores são atribuídos via JS em um único round trip, disparando
+        os eventos ``input`` e ``change``. Campos listados em ``keystrokes``,
+        não encontrados ainda ou não suportados pelo caminho JS (ex:
+        contenteditable, máscaras que exigem teclas) usam ``type`` campo a campo.
+        Valores dos campos em ``secrets`` são registrados para redação antes
+        do lote, como ``type(secret=True)``.
+        """
+        normalized = {
+            (key if isinstance(key, tuple) else (by, key)): value
+            for key, value in fields.items()
+        }
+        typed = {key if isinstance(key, tuple) else (by, key) for key in keystrokes}
+        hidden = {key if isinstance(key, tuple) else (by, key) for key in secrets}
+        for locator in hidden & normalized.keys():
+            register_secret(str(normalized[locator]))
+
+        batch = [
+            [field_by, selector, value if isinstance(value, bool) else str(value)]
+            for (field_by, selector), value in normalized.items()
+            if (field_by, selector) not in typed
+        ]
+        fallback = [locator for locator in normalized if locator in typed]
+
+        if batch:
+            self.logger.debug("Preenchendo %s campos via JS", len(batch))
+            statuses = self.driver.execute_script(FILL_MANY_JS, batch)
+            for (field_by, selector, _), status in zip(batch, statuses):
+                if status != "ok":
+                    self.logger.debug("Campo '%s' (%s) será digitado", selector, status)
+                    fallback.append((field_by, selector))
+
+        for field_by, selector in fallback:
+            value = normalized[(field_by, selector)]
+            self.type(selector, str(value), by=field_by, timeout=timeout, secret=(field_by, selector) in hidden)
+
+        self.logger.info("Formulário preenchido (%s campos, %s digitados)", len(normalized), len(fallback))
+
+    def _resolve(self, selector: Union[str, WebElement], by: By = By.CSS_SELECTOR, timeout: int = None) -> WebElement:
+        """Aceita um seletor (espera o elemento) ou um WebElement já resolvido."""
+        if isinstance(selector, WebElement):
+            return selector
+        return self.wait_for(selector, by=by, timeout=timeout)
+
+    @staticmethod
+    def _raise_if_cached_stale(selector, error: Exception):
+        if isinstance(selector, WebElement) and isinstance(error, StaleElementReferenceException):
+            raise StaleCachedElementError(str(error)) from error
+
     # --------------------------------------------------------------
     # INTERAÇÕES AVANÇADAS
     # --------------------------------------------------------------
@@ -241,35 +889,38 @@ class Browser:
 
     def move_to(self, selector: str, by=By.CSS_SELECTOR, timeout: int = None):
         """Move o mouse até o elemento."""
-        self.logger.info(f"Movendo mouse para {selector}")
+        self.logger.info("Movendo mouse para %s", selector)
         timeout = timeout or self.explicit_timeout
         el = self.wait_for(selector, by=by, timeout=timeout)
         ActionChains(self.driver).move_to_element(el).perform()
 
+    @time_it
     def hover(self, selector: str, by=By.CSS_SELECTOR, timeout: int = None):
         """Efetua um hover sobre o elemento."""
-        self.logger.info(f"Hover em {selector}")
+        self.logger.info("Hover em %s", selector)
         timeout = timeout or self.explicit_timeout
         el = self.wait_for(selector, by=by, timeout=timeout)
         ActionChains(self.driver).move_to_element(el).perform()
 
+    @time_it
     def double_click(self, selector: str, by=By.CSS_SELECTOR, timeout: int = None):
         """Dá um double-click no elemento."""
-        self.logger.info(f"Double-click em {selector}")
+        self.logger.info("Double-click em %s", selector)
         timeout = timeout or self.explicit_timeout
         el = self.wait_for(selector, by=by, timeout=timeout)
         ActionChains(self.driver).double_click(el).perform()
 
+    @time_it
     def right_click(self, selector: str, by=By.CSS_SELECTOR, timeout: int = None):
         """Clique com botão direito."""
-        self.logger.info(f"Right-click em {selector}")
+        self.logger.info("Right-click em %s", selector)
         timeout = timeout or self.explicit_timeout
         el = self.wait_for(selector, by=by, timeout=timeout)
         ActionChains(self.driver).context_click(el).perform()
 
     def click_and_hold(self, selector: str, by=By.CSS_SELECTOR, timeout: int = None):
         """Clique e segura o botão do mouse."""
-        self.logger.info(f"Click-and-hold em {selector}")
+        self.logger.info("Click-and-hold em %s", selector)
         timeout = timeout or self.explicit_timeout
         el = self.wait_for(selector, by=by, timeout=timeout)
         ActionChains(self.driver).click_and_hold(el).perform()
@@ -282,9 +933,10 @@ class Browser:
     # --------------------------------------------------------------
     # Drag & drop
     # --------------------------------------------------------------
+    @time_it
     def drag_and_drop(self, source_selector: str, target_selector: str, by=By.CSS_SELECTOR, timeout: int = None):
         """Arrasta um elemento e solta em outro."""
-        self.logger.info(f"Drag and drop: {source_selector} ➜ {target_selector}")
+        self.logger.info("Drag and drop: %s ➜ %s", source_selector, target_selector)
         timeout = timeout or self.explicit_timeout
 
         source = self.wait_for(source_selector, by=by, timeout=timeout)
@@ -294,7 +946,7 @@ class Browser:
 
     def drag_and_drop_offset(self, selector: str, x: int, y: int, by=By.CSS_SELECTOR, timeout: int = None):
         """Arrasta elemento por deslocamento (x, y)."""
-        self.logger.info(f"Drag by offset: {selector} ➜ ({x}, {y})")
+        self.logger.info("Drag by offset: %s ➜ (%s, %s)", selector, x, y)
         timeout = timeout or self.explicit_timeout
 
         element = self.wait_for(selector, by=by, timeout=timeout)
@@ -305,17 +957,17 @@ class Browser:
     # --------------------------------------------------------------
     def press_key(self, key: str):
         """Pressiona uma tecla única (ex: Keys.ENTER)."""
-        self.logger.info(f"Pressionando tecla: {key}")
+        self.logger.info("Pressionando tecla: %s", key)
         ActionChains(self.driver).send_keys(key).perform()
 
     def key_down(self, key: str):
         """Mantém tecla pressionada."""
-        self.logger.info(f"Key down: {key}")
+        self.logger.info("Key down: %s", key)
         ActionChains(self.driver).key_down(key).perform()
 
     def key_up(self, key: str):
         """Solta tecla pressionada."""
-        self.logger.info(f"Key up: {key}")
+        self.logger.info("Key up: %s", key)
         ActionChains(self.driver).key_up(key).perform()
 
     # --------------------------------------------------------------
@@ -323,27 +975,100 @@ class Browser:
     # --------------------------------------------------------------
     def scroll_by(self, x: int, y: int):
         """Scroll absoluto em coordenadas (x, y)."""
-        self.logger.info(f"Scrolling by ({x}, {y})")
+        self.logger.info("Scrolling by (%s, %s)", x, y)
         self.driver.execute_script(f"window.scrollBy({x}, {y});")
 
-    def scroll_to_element(self, selector: str, by=By.CSS_SELECTOR, timeout: int = None):
+    @time_it
+    def scroll_to_element(self, selector: Union[str, WebElement], by=By.CSS_SELECTOR, timeout: int = None):
         """Scroll até um elemento específico (scrollIntoView)."""
-        self.logger.info(f"Scroll até elemento: {selector}")
-        timeout = timeout or self.explicit_timeout
-        el = self.wait_for(selector, by=by, timeout=timeout)
+        self.logger.info("Scroll até elemento: %s", selector)
+        el = self._resolve(selector, by=by, timeout=timeout)
         self.driver.execute_script("arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});", el)
 
     # ------------------------------------------------------------------
     # Extração de dados
     # ------------------------------------------------------------------
+    @time_it
     @capture_failures
-    @retry_on_fail(retries=2, delay=2.0)
+    @retry_on_fail(retries=2, delay=1.0, retry_on=STALE_ERRORS, budget=_action_budget)
     def extract_table(
-        self, table_selector: str, by: By = By.CSS_SELECTOR, header: bool = True
+        self,
+        table_selector: str,
+        by: By = By.CSS_SELECTOR,
+        header: bool = True,
+        bulk: bool = True,
+        attributes: Optional[List[str]] = None,
     ) -> List[dict]:
-        """Extrai tabela HTML simples em lista de dicionários."""
-        self.logger.info(f"Extraindo tabela: {table_selector}")
+        """
+        Extrai tabela HTML simples em lista de dicionários.
+
+        Com ``bulk=True`` (padrão) a tabela inteira é lida em uma única
+        chamada ``execute_script``; com ``bulk=False`` usa o caminho
+        célula a célula (um round trip por linha/célula).
+
+        ``attributes`` (apenas no modo bulk) adiciona, para cada célula, o
+        valor dos atributos pedidos (ex: ``["href"]``) na chave
+        ``"<coluna>_<atributo>"``, lidos da própria célula ou do primeiro
+        descendente que os possua.
+        """
+        self.logger.info("Extraindo tabela: %s", table_selector)
         table = self.wait_for(table_selector, by=by)
+
+        if bulk:
+            data = self._extract_table_bulk(table, header, attributes or [])
+        else:
+            data = self._extract_table_per_cell(table, header)
+
+        self.logger.info("Tabela extraída com %s linhas.", len(data))
+        return data
+
+    @time_it
+    def fetch_table(
+        self,
+        url: str,
+        table_selector: str,
+        header: bool = True,
+        attributes: Optional[List[str]] = None,
+        fallback: bool = True,
+    ) -> List[dict]:
+        """
+        Lê a tabela ``table_selector`` (CSS) de ``url`` por HTTP direto,
+        reaproveitando cookies e user agent do navegador, e retorna o mesmo
+        formato de ``extract_table``.
+
+        Se a página não trouxer a tabela no HTML do servidor (montada por
+        JavaScript, ou sessão recusada mesmo após ressincronizar os cookies),
+        usa o navegador: ``go_to(url)`` + ``extract_table`` (``fallback=True``).
+        """
+        import requests
+        from core.http_session import HttpSession, parse_table
+
+        url = urljoin(self.driver.current_url, url)
+        if self._http is None:
+            self._http = HttpSession.from_browser(self)
+
+        for attempt in range(2):
+            try:
+                data = parse_table(self._http.fetch_html(url), table_selector, header, attributes)
+            except requests.RequestException as e:
+                self.logger.warning("Falha no HTTP direto para %s: %s", url, e)
+                data = None
+            # [] é uma tabela vazia (válida); None, tabela ausente no HTML
+            if data is not None:
+                self.logger.info("Tabela obtida por HTTP com %s linhas: %s", len(data), url)
+                return data
+            if attempt == 0:
+                # cookies podem ter mudado desde a última sincronização (ex: novo login)
+                self._http.sync_from_browser(self)
+
+        if not fallback:
+            return data or []
+
+        self.logger.info("Tabela indisponível por HTTP, usando o navegador: %s", url)
+        self.go_to(url)
+        return self.extract_table(table_selector, header=header, attributes=attributes)
+
+    def _extract_table_per_cell(self, table, header: bool) -> List[dict]:
         rows = table.find_elements(By.TAG_NAME, "tr")
         data = []
         headers = []
@@ -371,9 +1096,12 @@ class Browser:
             }
             data.append(row_obj)
 
-        self.logger.info(f"Tabela extraída com {len(data)} linhas.")
         return data
 
+    def _extract_table_bulk(self, table, header: bool, attributes: List[str]) -> List[dict]:
+        raw = self.driver.execute_script(EXTRACT_TABLE_JS, table, attributes)
+        return table_rows_to_dicts(raw["rows"], header)
+
     # --------------------------------------------------------------
     # CONTROLE DE ALERTS
     # --------------------------------------------------------------
@@ -393,28 +1121,57 @@ class Browser:
         """Retorna o texto do alert."""
         alert = self.driver.switch_to.alert
         text = alert.text
-        self.logger.info(f"Texto do alert: {text}")
+        self.logger.info("Texto do alert: %s", text)
         return text
 
     # --------------------------------------------------------------
-    # CAPTURA DE FALHAS
+    # COOKIES E STORAGE
     # --------------------------------------------------------------
-    def capture_evidence(self, name: str):
-        folder = "logs/errors"
-        os.makedirs(folder, exist_ok=True)
+    def get_cookies(self) -> List[dict]:
+        """Retorna os cookies do domínio atual."""
+        return self.driver.get_cookies()
 
-        timestamp = time.strftime("%Y-%m-%d_%H-%M-%S")
-        base = f"{timestamp}_{name}"
+    def add_cookies(self, cookies: List[dict]):
+        """Adiciona cookies ao domínio atual (ignora os recusados pelo driver)."""
+        for cookie in cookies:
+            try:
+                self.driver.add_cookie(cookie)
+            except Exception as e:
+                self.logger.warning("Cookie '%s' recusado: %s", cookie.get('name'), e)
 
-        screenshot_path = os.path.join(folder, base + ".png")
-        html_path = os.path.join(folder, base + ".html")
+    def get_local_storage(self) -> dict:
+        """Retorna o conteúdo do localStorage da origem atual."""
+        return self.driver.execute_script(
+            "const out = {};"
+            "for (let i = 0; i < localStorage.length; i++) {"
+            "  const k = localStorage.key(i); out[k] = localStorage.getItem(k);"
+            "}"
+            "return out;"
+        )
 
-        self.driver.save_screenshot(screenshot_path)
+    def set_local_storage(self, items: dict):
+        """Grava pares chave/valor no localStorage da origem atual."""
+        self.driver.execute_script(
+            "for (const [k, v] of Object.entries(arguments[0])) localStorage.setItem(k, v);",
+            items,
+        )
 
-        with open(html_path, "w", encoding="utf-8") as f:
-            f.write(self.driver.page_source)
+    def clear_session(self):
+        """Apaga cookies, localStorage e sessionStorage da origem atual."""
+        self.driver.delete_all_cookies()
+        try:
+            self.driver.execute_script("localStorage.clear(); sessionStorage.clear();")
+        except WebDriverException as e:
+            # about:blank/data: não têm storage
+            self.logger.debug("Storage não limpo: %s", e)
 
-        self.logger.info(f"Evidências salvas: {screenshot_path}, {html_path}")
+    # --------------------------------------------------------------
+    # CAPTURA DE FALHAS
+    # --------------------------------------------------------------
+    def capture_evidence(self, name: str):
+        """Salva screenshot e HTML (comprimido) da página atual em background."""
+        if capture_evidence(self.driver, name):
+            self.logger.info("Evidências enfileiradas: %s", name)
 
     # --------------------------------------------------------------
     # UTILITÁRIOS AVANÇADOS
@@ -422,8 +1179,13 @@ class Browser:
     @capture_failures
     def execute_script(self, script: str, *args):
         """Executa JavaScript no navegador."""
-        self.logger.debug(f"Executando JS: {script[:60]}...")
-        return self.driver.execute_script(script, *args)
+        self.logger.debug("Executando JS: %s...", script[:60])
+        try:
+            return self.driver.execute_script(script, *args)
+        except StaleElementReferenceException as e:
+            if any(isinstance(arg, WebElement) for arg in args):
+                raise StaleCachedElementError(str(e)) from e
+            raise
 
     def scroll_to(self, target):
         """Rola a página até um seletor CSS ou WebElement."""
@@ -432,7 +1194,7 @@ class Browser:
         else:
             el = target
 
-        self.logger.info(f"Rolando até o elemento: {el}")
+        self.logger.info("Rolando até o elemento: %s", el)
         self.driver.execute_script("arguments[0].scrollIntoView(true);", el)
 
     # ------------------------------------------------------------------
@@ -441,12 +1203,35 @@ class Browser:
     def screenshot(self, path: str):
         os.makedirs(os.path.dirname(path), exist_ok=True)
         self.driver.save_screenshot(path)
-        self.logger.info(f"Screenshot salva em: {path}")
+        self.logger.info("Screenshot salva em: %s", path)
+
+    def profile_report(self, top_n: int = None) -> Optional[str]:
+        """Grava o perfil da sessão em JSON e loga a tabela top-N; retorna o caminho."""
+        if not self.profiler.enabled or not self.profiler.has_data():
+            return None
+        path = self.profiler.dump(self.profile_dir, name=f"profile_{self.browser_name}")
+        self.logger.info(
+            "Perfil de execução (%s):\n%s", path, self.profiler.report(top_n or self.profile_top_n)
+        )
+        return path
 
     def quit(self):
         self.logger.info("Encerrando navegador...")
+        flush_evidence()
+        if self._http is not None:
+            self._http.close()
+        try:
+            self.profile_report()
+        except OSError as e:
+            self.logger.warning("Falha ao gravar o perfil de execução: %s", e)
         try:
             self.driver.quit()
             self.logger.info("Navegador fechado com sucesso.")
         except Exception as e:
-            self.logger.warning(f"Falha ao encerrar o navegador: {e}")
+            self.logger.warning("Falha ao encerrar o navegador: %s", e)
+        finally:
+            if self.recorder is not None:
+                self.recorder.stop()
+                self.logger.info(
+                    "Gravação salva em %s (%s comandos)", self.recorder.path, self.recorder.count
+                )
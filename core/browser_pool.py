@@ -0,0 +1,204 @@
+"""
+BrowserPool — execução de fluxos em paralelo sobre vários Browsers
+------------------------------------------------------------------
+Inclui:
+- Pré-inicialização de N instâncias de Browser (POOL_SIZE)
+- Runner de jobs baseado em ThreadPoolExecutor
+- Reciclagem do navegador após N jobs (POOL_MAX_JOBS) ou em caso de crash
+- Encerramento limpo de todos os drivers
+
+Exemplo:
+    with BrowserPool(size=3, browser="chrome", headless=True) as pool:
+        futures = [
+            pool.submit(lambda b: ConsultarProtocolosFlow(b).executar_fluxo_despacho(u, s)),
+            pool.submit(lambda b: ConsultarProtocolosFlow(b).executar_fluxo_fiscalizacao(u, s)),
+        ]
+        resultados = [f.result() for f in futures]
+"""
+
+import queue
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from typing import Callable, Iterable, List, Optional
+
+from core.browser_manager import Browser
+from core.config_manager import ConfigManager
+from utils.logger import setup_logger
+
+
+class BrowserPool:
+    def __init__(
+        self,
+        size: int = None,
+        max_jobs_per_browser: int = None,
+        browser_factory: Optional[Callable[[], Browser]] = None,
+        **browser_kwargs,
+    ):
+        """
+        Cria o pool e inicializa ``size`` navegadores.
+
+        ``browser_factory`` permite customizar a criação de cada Browser;
+        por padrão usa ``Browser(**browser_kwargs)``.
+        ``max_jobs_per_browser`` = 0 desativa a reciclagem por contagem.
+        """
+        cfg = ConfigManager
+
+        self.size = size or cfg.get("POOL_SIZE", 2, cast=int)
+        self.max_jobs_per_browser = (
+            max_jobs_per_browser
+            if max_jobs_per_browser is not None
+            else cfg.get("POOL_MAX_JOBS", 50, cast=int)
+        )
+        self.browser_factory = browser_factory or (lambda: Browser(**browser_kwargs))
+
+        self.logger = setup_logger("browser_pool")
+
+        self._idle: "queue.Queue[Browser]" = queue.Queue()
+        self._jobs_done = {}
+        self._lock = threading.Lock()
+        self._closed = False
+
+        self.logger.info("Iniciando pool com %s navegadores...", self.size)
+        self._launch_all()
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.size, thread_name_prefix="browser-pool"
+        )
+        self.logger.info("Pool de navegadores pronto.")
+
+    # ------------------------------------------------------------------
+    # Execução de jobs
+    # ------------------------------------------------------------------
+    def submit(self, job: Callable, *args, **kwargs) -> Future:
+        """
+        Agenda ``job(browser, *args, **kwargs)`` em um navegador livre.
+        Retorna um Future com o resultado do job.
+        """
+        if self._closed:
+            raise RuntimeError("BrowserPool já foi encerrado.")
+        return self._executor.submit(self._run_job, job, *args, **kwargs)
+
+    def map(self, job: Callable, items: Iterable) -> List:
+        """
+        Executa ``job(browser, item)`` para cada item em paralelo e
+        retorna os resultados na ordem de entrada.
+        """
+        futures = [self.submit(job, item) for item in items]
+        return [f.result() for f in futures]
+
+    def _run_job(self, job: Callable, *args, **kwargs):
+        browser = self._acquire()
+        crashed = False
+        try:
+            return job(browser, *args, **kwargs)
+        except Exception:
+            crashed = not self._is_alive(browser)
+            raise
+        finally:
+            self._release(browser, crashed)
+
+    # ------------------------------------------------------------------
+    # Ciclo de vida dos navegadores
+    # ------------------------------------------------------------------
+    def _acquire(self) -> Browser:
+        while True:
+            with self._lock:
+                if not self._jobs_done:
+                    raise RuntimeError("Nenhum navegador disponível no pool.")
+            try:
+                return self._idle.get(timeout=1.0)
+            except queue.Empty:
+                continue
+
+    def _launch_all(self):
+        """
+        Inicia os ``size`` navegadores em paralelo. Se algum falhar, os que
+        já subiram são encerrados antes de repassar o erro.
+        """
+        started, error = [], None
+        with ThreadPoolExecutor(max_workers=self.size) as launcher:
+            futures = [launcher.submit(self._launch) for _ in range(self.size)]
+            for future in as_completed(futures):
+                try:
+                    started.append(future.result())
+                except Exception as e:
+                    error = error or e
+
+        if error is not None:
+            self.logger.error("Falha ao iniciar o pool: %s; encerrando %s navegadores", error, len(started))
+            for browser in started:
+                try:
+                    self._discard(browser)
+                except Exception as e:
+                    self.logger.debug("Falha ao encerrar navegador: %s", e)
+            raise error
+
+        for browser in started:
+            self._idle.put(browser)
+
+    def _launch(self) -> Browser:
+        browser = self.browser_factory()
+        with self._lock:
+            self._jobs_done[id(browser)] = 0
+        return browser
+
+    def _release(self, browser: Browser, crashed: bool):
+        with self._lock:
+            self._jobs_done[id(browser)] += 1
+            jobs = self._jobs_done[id(browser)]
+
+        exhausted = self.max_jobs_per_browser and jobs >= self.max_jobs_per_browser
+        if crashed or exhausted:
+            motivo = "crash" if crashed else f"{jobs} jobs"
+            self.logger.info("Reciclando navegador (%s)...", motivo)
+            self._discard(browser)
+            if self._closed:
+                return
+            try:
+                browser = self._launch()
+            except Exception as e:
+                # O pool segue com um navegador a menos; se todos falharem,
+                # _acquire passa a levantar erro em vez de bloquear.
+                self.logger.error("Falha ao recriar navegador: %s", e)
+                return
+
+        self._idle.put(browser)
+
+    def _discard(self, browser: Browser):
+        with self._lock:
+            self._jobs_done.pop(id(browser), None)
+        browser.quit()
+
+    @staticmethod
+    def _is_alive(browser: Browser) -> bool:
+        """Verifica se a sessão do WebDriver ainda responde."""
+        try:
+            browser.driver.window_handles
+            return True
+        except Exception:
+            return False
+
+    # ------------------------------------------------------------------
+    # Encerramento
+    # ------------------------------------------------------------------
+    def shutdown(self, wait: bool = True):
+        """Aguarda os jobs pendentes e encerra todos os navegadores."""
+        if self._closed:
+            return
+        self._closed = True
+        self.logger.info("Encerrando pool de navegadores...")
+        self._executor.shutdown(wait=wait)
+
+        while True:
+            try:
+                browser = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._discard(browser)
+        self.logger.info("Pool encerrado.")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.shutdown()
@@ -0,0 +1,187 @@
+"""
+BrowserSupervisor — reinício automático do driver e retomada por checkpoint
+--------------------------------------------------------------------------
+Inclui:
+- Detecção de sessão morta (driver encerrado, navegador fechado, conexão
+  recusada) via ``utils.error_handler.is_dead_session``
+- Reinício do Browser e reexecução do login por um hook registrado
+  (ex: ``ConsultarProtocolosFlow.login``)
+- Execução de passos nomeados com checkpoint em JSON: ao reiniciar o
+  processo, os passos já concluídos são pulados
+
+Cada passo recebe o Browser já logado e deve partir desse estado (navegar
+até onde precisa), pois após um reinício ele roda em um navegador novo.
+
+Exemplo:
+    def login(browser):
+        ConsultarProtocolosFlow(browser).login(USUARIO, SENHA)
+
+    with BrowserSupervisor(login_hook=login, checkpoint_path=".checkpoints/relatorio.json") as sup:
+        resultados = sup.run_steps([
+            ("despacho", lambda b: exportar(b, 0)),
+            ("fiscalizacao", lambda b: exportar(b, 1)),
+        ])
+"""
+
+import os
+import json
+import time
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+from core.browser_manager import Browser
+from core.config_manager import ConfigManager
+from utils.error_handler import is_dead_session
+from utils.logger import setup_logger
+
+
+class BrowserSupervisor:
+    def __init__(
+        self,
+        browser_factory: Optional[Callable[[], Browser]] = None,
+        login_hook: Optional[Callable[[Browser], Any]] = None,
+        checkpoint_path: Optional[str] = None,
+        max_restarts: int = None,
+        **browser_kwargs,
+    ):
+        """
+        ``browser_factory`` cria cada Browser (padrão: ``Browser(**browser_kwargs)``).
+        ``login_hook(browser)`` roda após cada início/reinício do navegador.
+        ``checkpoint_path`` guarda os passos concluídos; sem ele o progresso
+        vale só para esta execução. ``max_restarts`` limita os reinícios
+        (SUPERVISOR_MAX_RESTARTS).
+        """
+        self.browser_factory = browser_factory or (lambda: Browser(**browser_kwargs))
+        self.login_hook = login_hook
+        self.checkpoint_path = checkpoint_path
+        self.max_restarts = (
+            max_restarts
+            if max_restarts is not None
+            else ConfigManager.get("SUPERVISOR_MAX_RESTARTS", 3, cast=int)
+        )
+        self.logger = setup_logger("browser_supervisor")
+
+        self.browser: Optional[Browser] = None
+        self.restarts = 0
+        self.completed: Dict[str, Any] = self._load_checkpoint()
+
+    def register_login(self, hook: Callable[[Browser], Any]):
+        """Define o hook de login reexecutado a cada (re)início."""
+        self.login_hook = hook
+
+    # ------------------------------------------------------------------
+    # Ciclo de vida do navegador
+    # ------------------------------------------------------------------
+    def start(self) -> Browser:
+        self.browser = self.browser_factory()
+        if self.login_hook:
+            self.login_hook(self.browser)
+        return self.browser
+
+    def restart(self, reason: str = "sessão morta") -> Browser:
+        """Descarta o navegador atual e inicia outro (com login)."""
+        if self.restarts >= self.max_restarts:
+            raise RuntimeError(f"Limite de {self.max_restarts} reinícios do navegador atingido.")
+        self.restarts += 1
+        self.logger.warning(
+            "Reiniciando navegador (%s), reinício %s/%s", reason, self.restarts, self.max_restarts
+        )
+        self._discard()
+        return self.start()
+
+    def _discard(self):
+        if self.browser is None:
+            return
+        try:
+            self.browser.quit()
+        except Exception as e:
+            self.logger.debug("Falha ao encerrar navegador morto: %s", e)
+        self.browser = None
+
+    # ------------------------------------------------------------------
+    # Execução supervisionada
+    # ------------------------------------------------------------------
+    def call(self, func: Callable, *args, **kwargs):
+        """
+        Executa ``func(browser, *args, **kwargs)``. Se a sessão morrer no
+        meio, reinicia o navegador (refazendo o login) e repete a chamada.
+        """
+        while True:
+            try:
+                browser = self.browser or self.start()
+                return func(browser, *args, **kwargs)
+            except Exception as e:
+                if not is_dead_session(e):
+                    raise
+                self.logger.error("Sessão do navegador perdida: %s: %s", e.__class__.__name__, e)
+                self.restart(e.__class__.__name__)
+
+    def run_steps(self, steps: Iterable[Tuple[str, Callable[[Browser], Any]]]) -> Dict[str, Any]:
+        """
+        Executa os passos ``(nome, função)`` em ordem, pulando os que já
+        constam do checkpoint. O resultado de cada passo (se serializável
+        em JSON) é salvo com ele; retorna ``{nome: resultado}``.
+        """
+        results = {}
+        for name, step in steps:
+            if name in self.completed:
+                self.logger.info("Passo '%s' já concluído, pulando.", name)
+                results[name] = self.completed[name]
+                continue
+
+            self.logger.info("Executando passo '%s'", name)
+            results[name] = self.call(step)
+            self.completed[name] = results[name]
+            self._save_checkpoint()
+        return results
+
+    def reset(self):
+        """Esquece os passos concluídos (apaga o checkpoint)."""
+        self.completed = {}
+        if self.checkpoint_path and os.path.exists(self.checkpoint_path):
+            os.remove(self.checkpoint_path)
+
+    # ------------------------------------------------------------------
+    # Checkpoint
+    # ------------------------------------------------------------------
+    def _load_checkpoint(self) -> Dict[str, Any]:
+        if not self.checkpoint_path or not os.path.exists(self.checkpoint_path):
+            return {}
+        try:
+            with open(self.checkpoint_path, "r", encoding="utf-8") as f:
+                completed = json.load(f)["completed"]
+        except (OSError, ValueError, KeyError) as e:
+            self.logger.warning("Checkpoint ilegível em %s, recomeçando: %s", self.checkpoint_path, e)
+            return {}
+        self.logger.info("Checkpoint carregado: %s passos concluídos", len(completed))
+        return completed
+
+    def _save_checkpoint(self):
+        if not self.checkpoint_path:
+            return
+        completed = {}
+        for name, result in self.completed.items():
+            try:
+                json.dumps(result)
+            except (TypeError, ValueError):
+                result = None
+            completed[name] = result
+
+        folder = os.path.dirname(self.checkpoint_path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        tmp = f"{self.checkpoint_path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"updated_at": time.time(), "completed": completed}, f, ensure_ascii=False)
+        os.replace(tmp, self.checkpoint_path)
+
+    # ------------------------------------------------------------------
+    # Encerramento
+    # ------------------------------------------------------------------
+    def quit(self):
+        self._discard()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.quit()
@@ -0,0 +1,243 @@
+"""
+Gravação e replay do tráfego de comandos WebDriver
+--------------------------------------------------
+Inclui:
+- ``RecordingConnection``: envolve o executor de comandos do driver e grava
+  cada comando (parâmetros, resposta W3C e duração) em JSON lines gzip
+- ``ReplayDriver``/``ReplayConnection``: devolvem as respostas gravadas,
+  na ordem, sem navegador nem rede (mesma base ``OfflineDriver`` do FakeDriver)
+- ``summarize``/``diff_summaries``: contagem e tempo por comando de uma
+  gravação, e a comparação entre duas
+
+Segredos registrados com ``register_secret`` (ex: a senha do login) são
+gravados como ``***``; no replay os parâmetros passam pela mesma redação
+antes da comparação.
+
+Exemplo:
+    nav = Browser(record="logs/recordings/despacho.jsonl.gz")
+    ConsultarProtocolosFlow(nav).executar_fluxo_despacho(usuario, senha)
+    nav.quit()
+
+    nav = Browser(backend=ReplayBackend("logs/recordings/despacho.jsonl.gz"))
+    ConsultarProtocolosFlow(nav).executar_fluxo_despacho(usuario, "qualquer")
+"""
+
+import copy
+import gzip
+import json
+import os
+import threading
+import time
+from collections import defaultdict
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from selenium.webdriver.remote.command import Command
+
+from core.fake_driver import OfflineConnection, OfflineDriver
+from utils.logger import redact
+
+FORMAT = "waf-commands"
+VERSION = 1
+
+
+def _normalize(params: Optional[dict]) -> dict:
+    params = dict(params or {})
+    params.pop("sessionId", None)
+    return params
+
+
+def _key(command: str, params: Optional[dict]) -> str:
+    """Chave comparável de um comando (segredos já redigidos)."""
+    return command + " " + redact(json.dumps(_normalize(params), sort_keys=True, ensure_ascii=False, default=str))
+
+
+# ----------------------------------------------------------------------
+# Gravação
+# ----------------------------------------------------------------------
+class RecordingConnection:
+    """
+    Executor que repassa os comandos ao executor real e grava cada um.
+    Os demais atributos (client_config etc.) vêm do executor original.
+    """
+
+    def __init__(self, inner, path: str, driver=None):
+        self.inner = inner
+        self.path = path
+        self.count = 0
+        self._lock = threading.Lock()
+
+        folder = os.path.dirname(path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        self._file = gzip.open(path, "wt", encoding="utf-8")
+        self._write({
+            "format": FORMAT,
+            "version": VERSION,
+            "created_at": time.time(),
+            "session_id": getattr(driver, "session_id", None),
+            "capabilities": getattr(driver, "caps", None) or {},
+        })
+
+    @classmethod
+    def attach(cls, driver, path: str) -> "RecordingConnection":
+        """Passa a gravar os comandos de ``driver`` em ``path`` (.jsonl.gz)."""
+        recorder = cls(driver.command_executor, path, driver)
+        driver.command_executor = recorder
+        return recorder
+
+    def execute(self, command: str, params: dict) -> dict:
+        start = time.perf_counter()
+        response = self.inner.execute(command, params)
+        elapsed = (time.perf_counter() - start) * 1000
+        self._write({
+            "cmd": command,
+            "params": _normalize(params),
+            "response": response,
+            "ms": round(elapsed, 3),
+        })
+        self.count += 1
+        return response
+
+    def _write(self, record: dict):
+        line = redact(json.dumps(record, ensure_ascii=False, separators=(",", ":"), default=str))
+        with self._lock:
+            if self._file is None:
+                return
+            self._file.write(line + "\n")
+
+    def close(self):
+        try:
+            self.inner.close()
+        finally:
+            self.stop()
+
+    def stop(self):
+        """Fecha o arquivo da gravação (o executor original segue ativo)."""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def __getattr__(self, name):
+        return getattr(self.inner, name)
+
+
+def read_recording(path: str) -> Tuple[dict, List[dict]]:
+    """Retorna ``(cabeçalho, comandos)`` de uma gravação."""
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        lines = (json.loads(line) for line in f if line.strip())
+        header = next(lines, None)
+        if not header or header.get("format") != FORMAT:
+            raise ValueError(f"{path} não é uma gravação de comandos WebDriver.")
+        return header, list(lines)
+
+
+# ----------------------------------------------------------------------
+# Replay
+# ----------------------------------------------------------------------
+class ReplayMismatchError(RuntimeError):
+    """O código pediu um comando que não existe na gravação (modo estrito)."""
+
+
+class ReplayConnection(OfflineConnection):
+    browser_name = "replay"
+
+    def __init__(self, path: str, speed: float = 0.0, strict: bool = False, lookahead: int = 50):
+        """
+        ``speed`` multiplica a duração gravada de cada comando: 0 responde
+        na hora, 1.0 reproduz o tempo original, 0.5 a metade.
+        ``strict``: diverge → ``ReplayMismatchError``; sem ele, a resposta
+        vem da última gravação do mesmo comando e a divergência é anotada.
+        """
+        self.path = path
+        self.header, self.records = read_recording(path)
+        self.speed = speed
+        self.strict = strict
+        self.lookahead = lookahead
+        self.position = 0
+        self.divergences: List[dict] = []
+        self._lock = threading.Lock()
+
+        self._keys = [_key(r["cmd"], r["params"]) for r in self.records]
+        self._by_key: Dict[str, dict] = {}
+        self._by_command: Dict[str, dict] = {}
+        for key, record in zip(self._keys, self.records):
+            self._by_key[key] = record
+            self._by_command[record["cmd"]] = record
+
+    def execute(self, command: str, params: dict) -> dict:
+        if command == Command.NEW_SESSION:
+            return {"value": {
+                "sessionId": self.header.get("session_id") or "replay",
+                "capabilities": self.header.get("capabilities") or {"browserName": self.browser_name},
+            }}
+
+        with self._lock:
+            record = self._next(command, _key(command, params))
+        if record is None:
+            if command == Command.QUIT:
+                return {"value": None}
+            return {"status": "unknown error", "value": f"Replay: nenhuma resposta gravada para '{command}'"}
+
+        if self.speed:
+            time.sleep(record.get("ms", 0) / 1000 * self.speed)
+        # o Selenium altera a resposta ao criar os WebElements
+        return copy.deepcopy(record["response"])
+
+    def _next(self, command: str, key: str) -> Optional[dict]:
+        end = min(self.position + self.lookahead, len(self.records))
+        for index in range(self.position, end):
+            if self._keys[index] == key:
+                if index > self.position:
+                    self._diverge("skipped", command, skipped=index - self.position)
+                self.position = index + 1
+                return self.records[index]
+
+        if self.strict:
+            expected = self.records[self.position]["cmd"] if self.position < len(self.records) else None
+            raise ReplayMismatchError(
+                f"Comando {self.position}: gravado '{expected}', pedido '{command}' ({key[:120]})"
+            )
+        record = self._by_key.get(key) or self._by_command.get(command)
+        self._diverge("reused" if record is not None else "missing", command)
+        return record
+
+    def _diverge(self, kind: str, command: str, **extra):
+        self.divergences.append({"kind": kind, "cmd": command, "position": self.position, **extra})
+
+    @property
+    def remaining(self) -> int:
+        """Comandos gravados que o replay ainda não consumiu."""
+        return len(self.records) - self.position
+
+
+class ReplayDriver(OfflineDriver):
+    def __init__(self, path: str, speed: float = 0.0, strict: bool = False):
+        super().__init__(ReplayConnection(path, speed=speed, strict=strict))
+
+    @property
+    def connection(self) -> ReplayConnection:
+        return self.command_executor
+
+
+# ----------------------------------------------------------------------
+# Análise
+# ----------------------------------------------------------------------
+def summarize(path: str) -> Dict[str, dict]:
+    """``{comando: {"count", "ms"}}`` da gravação, do mais caro para o mais barato."""
+    _, records = read_recording(path)
+    summary = defaultdict(lambda: {"count": 0, "ms": 0.0})
+    for record in records:
+        item = summary[record["cmd"]]
+        item["count"] += 1
+        item["ms"] += record.get("ms", 0)
+    return dict(sorted(summary.items(), key=lambda kv: kv[1]["ms"], reverse=True))
+
+
+def diff_summaries(before: Dict[str, dict], after: Dict[str, dict]) -> Iterator[Tuple[str, dict, dict]]:
+    """Gera ``(comando, antes, depois)`` para os comandos cuja contagem mudou."""
+    empty = {"count": 0, "ms": 0.0}
+    for command in sorted(set(before) | set(after)):
+        a, b = before.get(command, empty), after.get(command, empty)
+        if a["count"] != b["count"]:
+            yield command, a, b
@@ -2,6 +2,21 @@ import os
 import yaml
 from dotenv import load_dotenv
 
+
+def to_bool(value) -> bool:
+    """Converte valores de config/env ("true", "0", True...) em bool."""
+    if isinstance(value, str):
+        return value.strip().lower() in ("1", "true", "yes", "sim", "on")
+    return bool(value)
+
+
+def to_list(value) -> list:
+    """Converte listas do YAML ou strings "a,b,c" (env) em lista."""
+    if isinstance(value, str):
+        return [item.strip() for item in value.split(",") if item.strip()]
+    return list(value)
+
+
 class ConfigManager:
     _config_cache = {}
 
@@ -23,6 +38,11 @@ class ConfigManager:
                 yaml_config = yaml.safe_load(f)
                 if yaml_config:
                     config.update(yaml_config)
+                    # → Seção "default" com chaves minúsculas vira chaves
+                    #   no mesmo formato das variáveis de ambiente (BROWSER, ...)
+                    section = yaml_config.get("default") or {}
+                    for key, value in section.items():
+                        config[key.upper()] = value
 
         # → Carregar variáveis de ambiente (sobrescreve YAML)
         for key, value in os.environ.items():
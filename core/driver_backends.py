@@ -0,0 +1,100 @@
+"""
+Backends de driver — de onde vem o WebDriver do Browser
+-------------------------------------------------------
+Inclui:
+- ``SeleniumBackend`` (padrão): Chrome/Firefox reais, com resolução do
+  driver e perfil "lean"
+- ``FakeBackend``: ``FakeDriver`` em memória (core/fake_driver.py), para
+  medir o custo do próprio framework e contar round trips sem navegador
+- ``ReplayBackend``: reproduz uma gravação feita com ``Browser(record=...)``
+  (core/command_replay.py), sem navegador nem rede
+- ``resolve_backend``: aceita instância, nome ("selenium", "fake",
+  "replay") ou None (DRIVER_BACKEND na config)
+
+Exemplo:
+    browser = Browser(backend=FakeBackend(pages={"http://sitac.local/": html}))
+    browser.go_to("http://sitac.local/")
+"""
+
+from typing import Callable, Dict, Optional, Union
+
+from core.config_manager import ConfigManager
+
+
+class DriverBackend:
+    """Cria o WebDriver de um Browser. ``name`` aparece nos logs."""
+
+    name = "base"
+
+    def start(self, browser):
+        raise NotImplementedError
+
+
+class SeleniumBackend(DriverBackend):
+    name = "selenium"
+
+    def start(self, browser):
+        return browser._start_driver()
+
+
+class FakeBackend(DriverBackend):
+    name = "fake"
+
+    def __init__(
+        self,
+        driver=None,
+        pages: Union[Dict[str, str], Callable[[str], Optional[str]], None] = None,
+        start_url: str = None,
+    ):
+        """
+        Usa ``driver`` (um ``FakeDriver`` já configurado, ex: com
+        ``on_click``) ou cria um novo com ``pages``/``start_url``.
+        """
+        self.driver = driver
+        self.pages = pages
+        self.start_url = start_url
+
+    def start(self, browser):
+        if self.driver is not None:
+            return self.driver
+
+        from core.fake_driver import BLANK_URL, FakeDriver
+
+        return FakeDriver(pages=self.pages, start_url=self.start_url or BLANK_URL)
+
+
+class ReplayBackend(DriverBackend):
+    name = "replay"
+
+    def __init__(self, path: str = None, speed: float = 0.0, strict: bool = False):
+        """
+        ``path``: gravação .jsonl.gz (padrão: REPLAY_FILE). ``speed`` e
+        ``strict`` como em ``ReplayConnection``.
+        """
+        self.path = path or ConfigManager.get("REPLAY_FILE")
+        self.speed = speed
+        self.strict = strict
+
+    def start(self, browser):
+        if not self.path:
+            raise ValueError("ReplayBackend precisa de um arquivo de gravação (REPLAY_FILE).")
+
+        from core.command_replay import ReplayDriver
+
+        return ReplayDriver(self.path, speed=self.speed, strict=self.strict)
+
+
+BACKENDS = {
+    "selenium": SeleniumBackend,
+    "fake": FakeBackend,
+    "replay": ReplayBackend,
+}
+
+
+def resolve_backend(backend: Union[str, DriverBackend, None] = None) -> DriverBackend:
+    if isinstance(backend, DriverBackend):
+        return backend
+    name = (backend or ConfigManager.get("DRIVER_BACKEND", "selenium")).lower()
+    if name not in BACKENDS:
+        raise ValueError(f"Backend de driver '{name}' não suportado.")
+    return BACKENDS[name]()
@@ -0,0 +1,113 @@
+"""
+DriverResolver — localização do binário do WebDriver sem rede
+-------------------------------------------------------------
+Ordem de resolução:
+1. Caminho explícito passado ao Browser (``driver_path``)
+2. Caminho fixado na config (CHROMEDRIVER_PATH / GECKODRIVER_PATH)
+3. Cache em disco (DRIVER_CACHE_FILE) com o último caminho resolvido
+4. webdriver-manager (checagem de versão + download), gravando no cache
+
+Também guarda no cache a versão do navegador vista na última sessão.
+"""
+
+import os
+import json
+import time
+import threading
+from typing import Optional, Tuple
+
+from core.config_manager import ConfigManager
+from utils.logger import setup_logger
+
+
+PINNED_PATH_KEYS = {
+    "chrome": "CHROMEDRIVER_PATH",
+    "firefox": "GECKODRIVER_PATH",
+}
+
+
+def _install_with_webdriver_manager(browser_name: str) -> str:
+    if browser_name == "chrome":
+        from webdriver_manager.chrome import ChromeDriverManager
+        return ChromeDriverManager().install()
+    if browser_name == "firefox":
+        from webdriver_manager.firefox import GeckoDriverManager
+        return GeckoDriverManager().install()
+    raise ValueError(f"Browser '{browser_name}' não suportado.")
+
+
+class DriverResolver:
+    # Vários Browsers (ex: BrowserPool) podem resolver ao mesmo tempo
+    _lock = threading.Lock()
+
+    def __init__(self, cache_file: str = None):
+        cfg = ConfigManager
+
+        self.cache_file = cache_file or cfg.get(
+            "DRIVER_CACHE_FILE", os.path.join(".cache", "drivers.json")
+        )
+        self.logger = setup_logger("driver_resolver")
+
+    def resolve(self, browser_name: str, driver_path: Optional[str] = None) -> Tuple[str, str]:
+        """
+        Retorna ``(caminho, origem)``, onde origem é
+        "explicit", "pinned", "cache" ou "webdriver-manager".
+        """
+        if driver_path:
+            return driver_path, "explicit"
+
+        pinned = ConfigManager.get(PINNED_PATH_KEYS.get(browser_name, ""), None)
+        if pinned:
+            if os.path.exists(pinned):
+                return pinned, "pinned"
+            self.logger.warning("Driver fixado na config não existe: %s", pinned)
+
+        with self._lock:
+            entry = self._read_cache().get(browser_name) or {}
+            cached = entry.get("path")
+            if cached and os.path.exists(cached):
+                return cached, "cache"
+
+            path = _install_with_webdriver_manager(browser_name)
+            self._update_cache(browser_name, path=path, resolved_at=time.time())
+            return path, "webdriver-manager"
+
+    def record_browser_version(self, browser_name: str, version: Optional[str]):
+        """Guarda a versão do navegador usada com o driver em cache."""
+        if not version:
+            return
+        with self._lock:
+            entry = self._read_cache().get(browser_name) or {}
+            if entry.get("browser_version") != version:
+                self._update_cache(browser_name, browser_version=version)
+
+    def invalidate(self, browser_name: str):
+        """Descarta o driver em cache (ex: incompatível com o navegador atualizado)."""
+        with self._lock:
+            cache = self._read_cache()
+            if cache.pop(browser_name, None) is not None:
+                self._write_cache(cache)
+
+    # ------------------------------------------------------------------
+    # Persistência
+    # ------------------------------------------------------------------
+    def _read_cache(self) -> dict:
+        try:
+            with open(self.cache_file, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _update_cache(self, browser_name: str, **fields):
+        cache = self._read_cache()
+        cache.setdefault(browser_name, {}).update(fields)
+        self._write_cache(cache)
+
+    def _write_cache(self, cache: dict):
+        folder = os.path.dirname(self.cache_file)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        tmp = f"{self.cache_file}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(cache, f, indent=2)
+        os.replace(tmp, self.cache_file)
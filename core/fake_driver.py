@@ -0,0 +1,657 @@
+"""
+FakeDriver — WebDriver em memória sobre um DOM HTML parseado
+------------------------------------------------------------
+Inclui:
+- ``OfflineDriver``: um ``selenium...remote.WebDriver`` de verdade cujo
+  executor de comandos roda no próprio processo; WebElement, SwitchTo,
+  ActionChains e o tratamento de erros são os do Selenium
+- ``FakeConnection``: responde aos comandos W3C (findElement, clickElement,
+  sendKeysToElement, w3cExecuteScript...) sobre ``utils.html_dom``
+- Os scripts do framework (EXTRACT_TABLE_JS, FILL_MANY_JS, IDLE_PROBE_JS,
+  TABLE_SIGNATURE_JS...) e os atoms getAttribute/isDisplayed reimplementados
+  em Python; outros scripts podem ser registrados com ``register_script``
+- Páginas por URL (dict ou função), links e envio de formulários navegam;
+  ``on_click`` simula o JavaScript da página (ex: AJAX que troca a tabela)
+
+Não há motor de JavaScript nem layout: um elemento é visível se nem ele
+nem os ancestrais têm ``hidden``, ``display: none`` ou ``visibility: hidden``
+no atributo style.
+
+Exemplo:
+    driver = FakeDriver(pages={"http://sitac.local/": html})
+    driver.on_click("#carregar", lambda page, el: page.set_inner_html("#resultado", tabela))
+    browser = Browser(backend=FakeBackend(driver))
+"""
+
+import base64
+import re
+import threading
+import uuid
+import zlib
+from typing import Callable, Dict, List, Optional, Union
+from urllib.parse import urljoin, urlsplit
+
+from selenium.webdriver.common.options import ArgOptions
+from selenium.webdriver.remote.command import Command
+from selenium.webdriver.remote.file_detector import UselessFileDetector
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from utils.html_dom import Element, parse_html, parse_selector, _matches
+
+ELEMENT_KEY = "element-6066-11e4-a52e-4f735466cecf"
+BLANK_URL = "about:blank"
+BLANK_HTML = "<html><head></head><body></body></html>"
+NOT_FOUND_HTML = "<html><head><title>404</title></head><body><h1>Página não encontrada</h1></body></html>"
+USER_AGENT = "Mozilla/5.0 (FakeDriver) web_automation_framework"
+
+# PNG 1x1 transparente (screenshots do fake)
+_BLANK_PNG = base64.b64encode(
+    bytes.fromhex(
+        "89504e470d0a1a0a0000000d4948445200000001000000010806000000"
+        "1f15c4890000000d49444154789c6360000002000001e221bc330000000049454e44ae426082"
+    )
+).decode("ascii")
+
+BOOLEAN_ATTRIBUTES = {
+    "checked", "selected", "disabled", "readonly", "required", "multiple",
+    "hidden", "autofocus", "novalidate", "open",
+}
+NEVER_DISPLAYED = {"head", "script", "style", "title", "meta", "link", "template", "noscript"}
+_HIDDEN_STYLE = re.compile(r"(display\s*:\s*none|visibility\s*:\s*hidden)", re.IGNORECASE)
+# Teclas especiais do Selenium (Keys.ENTER etc.) ficam na área de uso privado do Unicode
+_PRIVATE_USE_KEYS = re.compile("[\ue000-\uf8ff]")
+
+
+class FakeDriverError(Exception):
+    """Erro W3C devolvido como resposta (``error`` = código da especificação)."""
+
+    def __init__(self, error: str, message: str):
+        super().__init__(message)
+        self.error = error
+
+
+# ----------------------------------------------------------------------
+# Documentos e janelas
+# ----------------------------------------------------------------------
+class FakePage:
+    """Um documento carregado: URL + árvore ``html_dom``."""
+
+    def __init__(self, url: str, html: str):
+        self.url = url
+        self.document = parse_html(html)
+
+    @property
+    def title(self) -> str:
+        title = self.document.select_one("title")
+        return title.text if title is not None else ""
+
+    def resolve(self, target: Union[str, Element]) -> Element:
+        if isinstance(target, Element):
+            return target
+        element = self.document.select_one(target)
+        if element is None:
+            raise FakeDriverError("no such element", f"Elemento inexistente: {target}")
+        return element
+
+    # Mutações usadas pelos handlers de on_click
+    def set_inner_html(self, target: Union[str, Element], html: str):
+        element = self.resolve(target)
+        for child in element.children:
+            if isinstance(child, Element):
+                child.parent = None  # nós removidos ficam obsoletos (stale)
+        fragment = parse_html(html)
+        for child in fragment.children:
+            if isinstance(child, Element):
+                child.parent = element
+        element.children = fragment.children
+
+    def set_attribute(self, target: Union[str, Element], name: str, value: Optional[str]):
+        element = self.resolve(target)
+        if value is None:
+            element.attrs.pop(name, None)
+        else:
+            element.attrs[name] = value
+
+    def hide(self, target: Union[str, Element]):
+        self.set_attribute(target, "style", "display: none")
+
+    def show(self, target: Union[str, Element]):
+        self.set_attribute(target, "style", None)
+        self.set_attribute(target, "hidden", None)
+
+
+class FakeWindow:
+    def __init__(self, handle: str, page: FakePage):
+        self.handle = handle
+        self.page = page
+        self.frames: List[FakePage] = []
+
+    @property
+    def context(self) -> FakePage:
+        """Documento do frame atual (ou da página)."""
+        return self.frames[-1] if self.frames else self.page
+
+
+# ----------------------------------------------------------------------
+# Executor de comandos
+# ----------------------------------------------------------------------
+class OfflineConnection:
+    """
+    Base dos executores em processo: recebe ``execute(comando, params)``
+    como o RemoteConnection do Selenium e devolve a resposta W3C
+    (``{"value": ...}`` ou ``{"status": erro, "value": mensagem}``).
+    """
+
+    browser_name = "offline"
+
+    def execute(self, command: str, params: dict) -> dict:
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+
+class FakeConnection(OfflineConnection):
+    browser_name = "fake"
+
+    def __init__(
+        self,
+        pages: Union[Dict[str, str], Callable[[str], Optional[str]], None] = None,
+        start_url: str = BLANK_URL,
+    ):
+        self.pages = pages or {}
+        self.session_id = uuid.uuid4().hex
+        self.cookies: List[dict] = []
+        self.local_storage: Dict[str, Dict[str, str]] = {}
+        self.click_handlers: List[tuple] = []
+        self.scripts: Dict[str, Callable] = {}
+        self.script_fragments: List[tuple] = []
+        self._nodes: Dict[str, Element] = {}
+        self._handles: Dict[int, str] = {}
+        self._lock = threading.RLock()
+
+        self.windows: Dict[str, FakeWindow] = {}
+        self.current: Optional[FakeWindow] = None
+        self._open_window(start_url)
+
+        self.commands = {
+            Command.NEW_SESSION: self._new_session,
+            Command.QUIT: lambda p: None,
+            Command.SET_TIMEOUTS: lambda p: None,
+            Command.GET_TIMEOUTS: lambda p: {"implicit": 0, "pageLoad": 300000, "script": 30000},
+            Command.GET: lambda p: self.navigate(p["url"]),
+            Command.REFRESH: lambda p: self.navigate(self.current.page.url),
+            Command.GET_CURRENT_URL: lambda p: self.current.page.url,
+            Command.GET_TITLE: lambda p: self.current.page.title,
+            Command.GET_PAGE_SOURCE: lambda p: self.current.context.document.outer_html,
+            Command.SCREENSHOT: lambda p: _BLANK_PNG,
+            Command.ELEMENT_SCREENSHOT: lambda p: _BLANK_PNG,
+            Command.FIND_ELEMENT: lambda p: self._find(self.current.context.document, p, single=True),
+            Command.FIND_ELEMENTS: lambda p: self._find(self.current.context.document, p, single=False),
+            Command.FIND_CHILD_ELEMENT: lambda p: self._find(self._node(p["id"]), p, single=True),
+            Command.FIND_CHILD_ELEMENTS: lambda p: self._find(self._node(p["id"]), p, single=False),
+            Command.CLICK_ELEMENT: lambda p: self.click(self._node(p["id"])),
+            Command.SEND_KEYS_TO_ELEMENT: self._send_keys,
+            Command.CLEAR_ELEMENT: self._clear,
+            Command.GET_ELEMENT_TEXT: lambda p: self._text(self._node(p["id"])),
+            Command.GET_ELEMENT_TAG_NAME: lambda p: self._node(p["id"]).tag,
+            Command.IS_ELEMENT_ENABLED: lambda p: "disabled" not in self._node(p["id"]).attrs,
+            Command.IS_ELEMENT_SELECTED: lambda p: self._selected(self._node(p["id"])),
+            Command.GET_ELEMENT_ATTRIBUTE: lambda p: self._node(p["id"]).get(p["name"]),
+            Command.GET_ELEMENT_PROPERTY: lambda p: self._property(self._node(p["id"]), p["name"]),
+            Command.GET_ELEMENT_VALUE_OF_CSS_PROPERTY: self._css_value,
+            Command.GET_ELEMENT_RECT: lambda p: {"x": 0, "y": 0, "width": 100, "height": 20},
+            Command.W3C_EXECUTE_SCRIPT: lambda p: self.run_script(p["script"], p.get("args") or []),
+            Command.W3C_GET_CURRENT_WINDOW_HANDLE: lambda p: self.current.handle,
+            Command.W3C_GET_WINDOW_HANDLES: lambda p: list(self.windows),
+            Command.NEW_WINDOW: lambda p: {"handle": self._open_window(BLANK_URL).handle, "type": "tab"},
+            Command.SWITCH_TO_WINDOW: self._switch_window,
+            Command.CLOSE: self._close_window,
+            Command.SWITCH_TO_FRAME: self._switch_frame,
+            Command.SWITCH_TO_PARENT_FRAME: lambda p: self.current.frames.pop() if self.current.frames else None,
+            Command.GET_WINDOW_RECT: lambda p: {"x": 0, "y": 0, "width": 1280, "height": 800},
+            Command.SET_WINDOW_RECT: lambda p: {"x": 0, "y": 0, "width": 1280, "height": 800},
+            Command.W3C_MAXIMIZE_WINDOW: lambda p: {"x": 0, "y": 0, "width": 1280, "height": 800},
+            Command.W3C_ACTIONS: lambda p: None,
+            Command.W3C_CLEAR_ACTIONS: lambda p: None,
+            Command.GET_ALL_COOKIES: lambda p: [dict(c) for c in self.cookies],
+            Command.GET_COOKIE: self._get_cookie,
+            Command.ADD_COOKIE: self._add_cookie,
+            Command.DELETE_COOKIE: lambda p: self._delete_cookies(p["name"]),
+            Command.DELETE_ALL_COOKIES: lambda p: self._delete_cookies(None),
+            Command.W3C_GET_ALERT_TEXT: self._no_alert,
+            Command.W3C_ACCEPT_ALERT: self._no_alert,
+            Command.W3C_DISMISS_ALERT: self._no_alert,
+            "executeCdpCommand": lambda p: {},
+        }
+        self._register_builtin_scripts()
+
+    # ------------------------------------------------------------------
+    # Protocolo
+    # ------------------------------------------------------------------
+    def execute(self, command: str, params: dict) -> dict:
+        handler = self.commands.get(command)
+        if handler is None:
+            return {"status": "unknown command", "value": f"FakeDriver não implementa '{command}'"}
+        with self._lock:
+            try:
+                return {"value": self._wrap(handler(params or {}))}
+            except FakeDriverError as e:
+                return {"status": e.error, "value": str(e)}
+
+    def _new_session(self, params):
+        return {
+            "sessionId": self.session_id,
+            "capabilities": {"browserName": self.browser_name, "browserVersion": "0", "platformName": "any"},
+        }
+
+    def _wrap(self, value):
+        """Element → referência W3C (o Selenium cria o WebElement)."""
+        if isinstance(value, Element):
+            return {ELEMENT_KEY: self.handle_of(value)}
+        if isinstance(value, list):
+            return [self._wrap(item) for item in value]
+        if isinstance(value, dict):
+            return {key: self._wrap(item) for key, item in value.items()}
+        return value
+
+    def _unwrap(self, value):
+        if isinstance(value, dict):
+            if ELEMENT_KEY in value:
+                return self._node(value[ELEMENT_KEY])
+            return {key: self._unwrap(item) for key, item in value.items()}
+        if isinstance(value, list):
+            return [self._unwrap(item) for item in value]
+        return value
+
+    # ------------------------------------------------------------------
+    # Elementos
+    # ------------------------------------------------------------------
+    def handle_of(self, element: Element) -> str:
+        handle = self._handles.get(id(element))
+        if handle is None or self._nodes.get(handle) is not element:
+            handle = uuid.uuid4().hex
+            self._handles[id(element)] = handle
+            self._nodes[handle] = element
+        return handle
+
+    def _node(self, handle: str) -> Element:
+        element = self._nodes.get(handle)
+        if element is None:
+            raise FakeDriverError("no such element", f"Referência de elemento desconhecida: {handle}")
+        root = element
+        while root.parent is not None:
+            root = root.parent
+        if root is not self.current.context.document:
+            raise FakeDriverError("stale element reference", "O elemento não está mais no documento atual")
+        return element
+
+    def _find(self, scope: Element, params: dict, single: bool):
+        using, value = params["using"], params["value"]
+        if using == "css selector":
+            try:
+                found = scope.select(value)
+            except ValueError as e:
+                raise FakeDriverError("invalid selector", str(e))
+        elif using == "tag name":
+            found = [el for el in scope.iter() if el.tag == value.lower()]
+        elif using in ("link text", "partial link text"):
+            found = [
+                el for el in scope.iter()
+                if el.tag == "a" and (el.text == value if using == "link text" else value in el.text)
+            ]
+        else:
+            raise FakeDriverError("invalid selector", f"Estratégia '{using}' não suportada pelo FakeDriver")
+
+        if not single:
+            return found
+        if not found:
+            raise FakeDriverError("no such element", f"Nenhum elemento para {using}={value!r}")
+        return found[0]
+
+    @staticmethod
+    def is_displayed(element: Element) -> bool:
+        if element.tag == "input" and element.get("type", "").lower() == "hidden":
+            return False
+        node = element
+        while node is not None and node.tag != "#document":
+            if node.tag in NEVER_DISPLAYED or "hidden" in node.attrs:
+                return False
+            if _HIDDEN_STYLE.search(node.get("style", "")):
+                return False
+            node = node.parent
+        return True
+
+    def _text(self, element: Element) -> str:
+        return element.text if self.is_displayed(element) else ""
+
+    @staticmethod
+    def _selected(element: Element) -> bool:
+        return "checked" in element.attrs or "selected" in element.attrs
+
+    def _attribute(self, element: Element, name: str) -> Optional[str]:
+        """Semântica do atom getAttribute do Selenium."""
+        name = name.lower()
+        if name in BOOLEAN_ATTRIBUTES:
+            return "true" if name in element.attrs else None
+        value = element.get(name)
+        if value is not None and name in ("href", "src"):
+            return urljoin(self.current.context.url, value)
+        return value
+
+    def _property(self, element: Element, name: str):
+        if name in BOOLEAN_ATTRIBUTES:
+            return name in element.attrs
+        if name == "tagName":
+            return element.tag.upper()
+        if name in ("innerText", "textContent"):
+            return element.text if name == "innerText" else element.text_content
+        if name == "innerHTML":
+            return element.inner_html
+        if name == "value" and element.tag in ("input", "textarea", "select"):
+            return element.get("value", "")
+        return self._attribute(element, name)
+
+    def _css_value(self, params):
+        element = self._node(params["id"])
+        if params["propertyName"] == "display":
+            return "block" if self.is_displayed(element) else "none"
+        return ""
+
+    # ------------------------------------------------------------------
+    # Interação
+    # ------------------------------------------------------------------
+    def on_click(self, selector: str, handler: Callable[[FakePage, Element], Optional[bool]]):
+        """
+        ``handler(page, elemento)`` roda ao clicar em ``selector`` (ou em um
+        descendente, como o bubbling do DOM). Retornar False cancela a ação
+        padrão (seguir link / enviar formulário).
+        """
+        self.click_handlers.append((parse_selector(selector), handler))
+
+    def click(self, element: Element):
+        if not self.is_displayed(element):
+            raise FakeDriverError("element not interactable", f"Elemento <{element.tag}> não está visível")
+        page = self.current.context
+
+        default = True
+        node = element
+        while node is not None and node.tag != "#document":
+            for groups, handler in self.click_handlers:
+                if any(_matches(node, parts, len(parts) - 1) for parts in groups):
+                    if handler(page, element) is False:
+                        default = False
+            node = node.parent
+        if not default:
+            return
+
+        if element.tag in ("input", "textarea") and element.get("type", "").lower() in ("checkbox", "radio"):
+            if "checked" in element.attrs and element.get("type").lower() == "checkbox":
+                element.attrs.pop("checked")
+            else:
+                element.attrs["checked"] = ""
+            return
+
+        link = _closest(element, "a")
+        if link is not None:
+            href = link.get("href", "")
+            if href and not href.startswith(("#", "javascript:")):
+                self.navigate(urljoin(page.url, href))
+            return
+
+        button_type = element.get("type", "submit" if element.tag == "button" else "").lower()
+        form = _closest(element, "form")
+        if form is not None and element.tag in ("button", "input") and button_type == "submit":
+            self.navigate(urljoin(page.url, form.get("action") or page.url))
+
+    def _send_keys(self, params):
+        element = self._node(params["id"])
+        if element.tag not in ("input", "textarea") or "disabled" in element.attrs:
+            raise FakeDriverError("element not interactable", f"Não é possível digitar em <{element.tag}>")
+        typed = _PRIVATE_USE_KEYS.sub("", params.get("text", ""))
+        element.attrs["value"] = element.get("value", "") + typed
+
+    def _clear(self, params):
+        element = self._node(params["id"])
+        if element.tag in ("input", "textarea"):
+            element.attrs["value"] = ""
+
+    # ------------------------------------------------------------------
+    # Navegação, janelas e frames
+    # ------------------------------------------------------------------
+    def load(self, url: str) -> FakePage:
+        """Monta o documento de ``url`` a partir de ``pages``."""
+        if url == BLANK_URL:
+            return FakePage(url, BLANK_HTML)
+        if callable(self.pages):
+            html = self.pages(url)
+        else:
+            html = self.pages.get(url)
+            if html is None:
+                html = self.pages.get(url.split("#", 1)[0])
+        return FakePage(url, html if html is not None else NOT_FOUND_HTML)
+
+    def navigate(self, url: str):
+        self.current.page = self.load(url)
+        self.current.frames = []
+
+    def _open_window(self, url: str) -> FakeWindow:
+        window = FakeWindow(uuid.uuid4().hex[:16].upper(), self.load(url))
+        self.windows[window.handle] = window
+        if self.current is None:
+            self.current = window
+        return window
+
+    def open_blank_window(self):
+        self._open_window(BLANK_URL)
+
+    def _switch_window(self, params):
+        window = self.windows.get(params["handle"])
+        if window is None:
+            raise FakeDriverError("no such window", f"Janela inexistente: {params['handle']}")
+        self.current = window
+
+    def _close_window(self, params):
+        self.windows.pop(self.current.handle, None)
+        return list(self.windows)
+
+    def _switch_frame(self, params):
+        reference = params.get("id")
+        if reference is None:
+            self.current.frames = []
+            return
+        frames = [el for el in self.current.context.document.iter() if el.tag in ("iframe", "frame")]
+        if isinstance(reference, int):
+            if reference >= len(frames):
+                raise FakeDriverError("no such frame", f"Frame {reference} inexistente")
+            frame = frames[reference]
+        else:
+            frame = self._unwrap(reference)
+            if frame.tag not in ("iframe", "frame"):
+                raise FakeDriverError("no such frame", f"<{frame.tag}> não é um frame")
+
+        base = self.current.context.url
+        if "srcdoc" in frame.attrs:
+            page = FakePage(base, frame.get("srcdoc"))
+        else:
+            page = self.load(urljoin(base, frame.get("src", BLANK_URL)))
+        self.current.frames.append(page)
+
+    # ------------------------------------------------------------------
+    # Cookies e alerts
+    # ------------------------------------------------------------------
+    def _get_cookie(self, params):
+        for cookie in self.cookies:
+            if cookie["name"] == params["name"]:
+                return dict(cookie)
+        raise FakeDriverError("no such cookie", f"Cookie inexistente: {params['name']}")
+
+    def _add_cookie(self, params):
+        cookie = dict(params["cookie"])
+        cookie.setdefault("domain", urlsplit(self.current.page.url).hostname or "")
+        cookie.setdefault("path", "/")
+        self._delete_cookies(cookie["name"])
+        self.cookies.append(cookie)
+
+    def _delete_cookies(self, name: Optional[str]):
+        self.cookies = [c for c in self.cookies if name is not None and c["name"] != name]
+
+    def _no_alert(self, params):
+        raise FakeDriverError("no such alert", "Nenhum alert aberto")
+
+    # ------------------------------------------------------------------
+    # Scripts
+    # ------------------------------------------------------------------
+    def register_script(self, script: str, handler: Callable, fragment: bool = False):
+        """
+        ``handler(connection, *args)`` responde ao script ``script`` (texto
+        exato) ou, com ``fragment=True``, a qualquer script que o contenha.
+        Os argumentos chegam com os elementos já convertidos em ``Element``.
+        """
+        if fragment:
+            self.script_fragments.append((script, handler))
+        else:
+            self.scripts[script] = handler
+
+    def run_script(self, script: str, args: list):
+        handler = self.scripts.get(script)
+        if handler is None:
+            handler = next((h for fragment, h in self.script_fragments if fragment in script), None)
+        if handler is None:
+            raise FakeDriverError("javascript error", f"FakeDriver: script não reconhecido: {script[:80]!r}")
+        return handler(self, *self._unwrap(args))
+
+    def _register_builtin_scripts(self):
+        from core.browser_manager import (
+            EXTRACT_TABLE_JS, FILL_MANY_JS, IDLE_PROBE_JS, TAB_NAVIGATE_JS, TAB_READY_JS,
+        )
+        from components.paginator import TABLE_SIGNATURE_JS
+
+        self.register_script(EXTRACT_TABLE_JS, _extract_table)
+        self.register_script(FILL_MANY_JS, _fill_many)
+        # sem JS nem rede: o documento já nasce carregado e ocioso
+        self.register_script(IDLE_PROBE_JS, lambda c: {"ready": "complete", "pending": 0, "quiet": 60000})
+        self.register_script(TAB_NAVIGATE_JS, lambda c, url: c.navigate(url))
+        self.register_script(TAB_READY_JS, lambda c: True)
+        self.register_script(TABLE_SIGNATURE_JS, _table_signature)
+
+        for fragment, handler in (
+            ("/* getAttribute */", lambda c, el, name: c._attribute(el, name)),
+            ("/* isDisplayed */", lambda c, el: c.is_displayed(el)),
+            ("scrollIntoView", lambda c, *args: None),
+            ("window.scrollBy(", lambda c, *args: None),
+            ("window.open(", lambda c, *args: c.open_blank_window()),
+            ("navigator.userAgent", lambda c: USER_AGENT),
+            ("getEntriesByType('navigation')", lambda c: None),
+            ("localStorage.getItem", lambda c: dict(c._storage())),
+            ("localStorage.setItem", lambda c, items: c._storage().update(items)),
+            ("localStorage.clear()", lambda c: c._storage().clear()),
+            ("return window.name", lambda c: ""),
+            ("document.readyState", lambda c: "complete"),
+        ):
+            self.register_script(fragment, handler, fragment=True)
+
+    def _storage(self) -> Dict[str, str]:
+        parts = urlsplit(self.current.page.url)
+        return self.local_storage.setdefault(f"{parts.scheme}://{parts.netloc}", {})
+
+
+def _closest(element: Element, tag: str) -> Optional[Element]:
+    node = element
+    while node is not None and node.tag != tag:
+        node = node.parent
+    return node
+
+
+def _extract_table(connection: FakeConnection, table: Element, attributes=None):
+    from core.http_session import table_rows
+
+    return {"rows": table_rows(table, attributes or [])}
+
+
+def _table_signature(connection: FakeConnection, table: Element) -> str:
+    text = table.text
+    return f"{len(table.select('tr'))}:{zlib.crc32(text.encode('utf-8'))}"
+
+
+def _fill_many(connection: FakeConnection, batch: list) -> list:
+    document = connection.current.context.document
+    statuses = []
+    for by, selector, value in batch:
+        if by == "css selector":
+            element = document.select_one(selector)
+        elif by in ("id", "name"):
+            element = next((el for el in document.iter() if el.get(by) == selector), None)
+        else:
+            statuses.append("unsupported")
+            continue
+
+        if element is None:
+            statuses.append("not_found")
+        elif "disabled" in element.attrs or "readonly" in element.attrs:
+            statuses.append("unsupported")
+        elif element.tag == "input" and element.get("type", "").lower() == "file":
+            statuses.append("unsupported")
+        elif element.tag == "input" and element.get("type", "").lower() in ("checkbox", "radio"):
+            if bool(value) != ("checked" in element.attrs):
+                connection.click(element)
+            statuses.append("ok")
+        elif element.tag == "select":
+            options = element.select("option")
+            if not any(option.get("value", option.text) == str(value) for option in options):
+                statuses.append("unsupported")
+                continue
+            for option in options:
+                option.attrs.pop("selected", None)
+                if option.get("value", option.text) == str(value):
+                    option.attrs["selected"] = ""
+            element.attrs["value"] = str(value)
+            statuses.append("ok")
+        elif element.tag in ("input", "textarea"):
+            element.attrs["value"] = str(value)
+            statuses.append("ok")
+        else:
+            statuses.append("unsupported")
+    return statuses
+
+
+# ----------------------------------------------------------------------
+# Drivers
+# ----------------------------------------------------------------------
+class OfflineDriver(WebDriver):
+    """WebDriver remoto do Selenium ligado a um executor em processo."""
+
+    def __init__(self, connection: OfflineConnection):
+        super().__init__(
+            command_executor=connection,
+            options=ArgOptions(),
+            file_detector=UselessFileDetector(),
+        )
+
+
+class FakeDriver(OfflineDriver):
+    def __init__(
+        self,
+        pages: Union[Dict[str, str], Callable[[str], Optional[str]], None] = None,
+        start_url: str = BLANK_URL,
+    ):
+        """
+        ``pages``: ``{url: html}`` ou ``função(url) -> html`` (None = 404).
+        URLs com ``#fragmento`` caem na entrada sem o fragmento.
+        """
+        super().__init__(FakeConnection(pages, start_url))
+
+    @property
+    def connection(self) -> FakeConnection:
+        return self.command_executor
+
+    def on_click(self, selector: str, handler: Callable[[FakePage, Element], Optional[bool]]):
+        self.connection.on_click(selector, handler)
+
+    def register_script(self, script: str, handler: Callable, fragment: bool = False):
+        self.connection.register_script(script, handler, fragment)
+
+    def load_html(self, html: str, url: str = "http://fake.local/"):
+        """Abre ``html`` diretamente na janela atual."""
+        self.connection.current.page = FakePage(url, html)
+        self.connection.current.frames = []
@@ -0,0 +1,205 @@
+"""
+FlowEngine — passos de fluxo declarados como grafo
+--------------------------------------------------
+Inclui:
+- ``Step``: ação nomeada, com pré-requisitos (``requires``) e uma checagem
+  opcional do estado da página (``check``: a pós-condição do passo)
+- ``StepGraph``: o grafo de passos; o caminho até um alvo são os
+  pré-requisitos em ordem (ex: login → protocolos → a_receber → categoria_0)
+- Planejamento: alvos com o mesmo prefixo rodam em sequência, e o prefixo
+  já percorrido não é refeito
+- Passo pulado se a pós-condição já vale na página atual; sem ``check``,
+  só é pulado quando faz parte do prefixo já executado
+- Tempo por passo (executado ou pulado) e relatório
+
+Exemplo:
+    grafo = StepGraph([
+        Step("login", lambda: flow.login(usuario, senha),
+             check=lambda: flow.login_page.is_logged_in(timeout=0)),
+        Step("protocolos", home.abrir_protocolos, requires=["login"],
+             check=lambda: home.is_element_visible(home.MENU_PROTOCOLO_A_RECEBER)),
+        Step("categoria_0", lambda: home.abrir_categoria(0), requires=["protocolos"]),
+        Step("categoria_1", lambda: home.abrir_categoria(1), requires=["protocolos"]),
+    ])
+    engine = FlowEngine(grafo)
+    engine.run(["categoria_0", "categoria_1"])   # login e protocolos uma vez só
+    print(engine.report())
+"""
+
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
+
+from utils.logger import setup_logger
+
+RAN = "ran"
+SKIPPED_STATE = "state"
+SKIPPED_PREFIX = "prefix"
+
+
+class Step:
+    def __init__(
+        self,
+        name: str,
+        action: Callable[[], Any],
+        requires: Sequence[str] = (),
+        check: Optional[Callable[[], bool]] = None,
+    ):
+        """
+        ``action()`` leva a página ao estado do passo; o retorno do passo
+        alvo vira o resultado do ``run``. ``requires``: passos que precisam
+        ter rodado antes. ``check()``: True se a página já está no estado
+        que o passo produz (deve ser rápida, sem espera).
+        """
+        self.name = name
+        self.action = action
+        self.requires = tuple(requires)
+        self.check = check
+
+    def __repr__(self):
+        return f"Step({self.name!r}, requires={list(self.requires)})"
+
+
+class StepGraph:
+    def __init__(self, steps: Iterable[Step] = ()):
+        self.steps: Dict[str, Step] = {}
+        for step in steps:
+            self.add(step)
+
+    def add(self, step: Step) -> Step:
+        if step.name in self.steps:
+            raise ValueError(f"Passo '{step.name}' já existe no grafo.")
+        self.steps[step.name] = step
+        return step
+
+    def path(self, target: str) -> List[Step]:
+        """Pré-requisitos de ``target`` em ordem de execução, terminando nele."""
+        order: List[Step] = []
+        visiting = set()
+
+        def visit(name: str):
+            if name not in self.steps:
+                raise KeyError(f"Passo '{name}' não existe no grafo.")
+            if name in visiting:
+                raise ValueError(f"Ciclo de pré-requisitos no passo '{name}'.")
+            step = self.steps[name]
+            if step in order:
+                return
+            visiting.add(name)
+            for required in step.requires:
+                visit(required)
+            visiting.discard(name)
+            order.append(step)
+
+        visit(target)
+        return order
+
+    def plan(self, targets: Sequence[str]) -> List[List[Step]]:
+        """
+        Caminhos dos alvos, reordenados para que os de prefixo comum
+        fiquem juntos (percurso em profundidade da árvore de prefixos).
+        Entre alvos irmãos vale a ordem pedida.
+        """
+        paths = [self.path(target) for target in targets]
+        first_seen: Dict[str, int] = {}
+        for path in paths:
+            for step in path:
+                first_seen.setdefault(step.name, len(first_seen))
+        return sorted(paths, key=lambda path: [first_seen[step.name] for step in path])
+
+
+class FlowEngine:
+    def __init__(self, graph: StepGraph, name: str = "flow_engine"):
+        self.graph = graph
+        self.name = name
+        self.timings: List[dict] = []
+        self.logger = setup_logger("flow_engine")
+        self._current: List[str] = []
+
+    def invalidate(self):
+        """Esquece o prefixo executado (ex: após navegar fora do engine)."""
+        self._current = []
+
+    # ------------------------------------------------------------------
+    # Execução
+    # ------------------------------------------------------------------
+    def run(self, targets: Sequence[str]) -> Dict[str, Any]:
+        """
+        Executa o plano dos ``targets``; retorna ``{alvo: retorno da ação}``.
+        O passo alvo sempre roda, mesmo com a pós-condição valendo.
+        """
+        first = len(self.timings)
+        start = time.perf_counter()
+        results = {}
+        for path in self.graph.plan(targets):
+            results[path[-1].name] = self._run_path(path)
+
+        ran = sum(1 for item in self.timings[first:] if item["status"] == RAN)
+        self.logger.info(
+            "%s: %s alvos em %.2fs (%s passos executados, %s pulados)",
+            self.name, len(results), time.perf_counter() - start, ran, len(self.timings) - first - ran,
+        )
+        self.logger.debug("%s:\n%s", self.name, self.report())
+        return results
+
+    def _run_path(self, path: List[Step]) -> Any:
+        target = path[-1]
+        in_prefix = True
+        result = None
+        for index, step in enumerate(path):
+            in_prefix = in_prefix and index < len(self._current) and self._current[index] == step.name
+            is_target = step is target
+
+            start = time.perf_counter()
+            if not is_target and self._holds(step, in_prefix):
+                status = SKIPPED_PREFIX if step.check is None else SKIPPED_STATE
+            else:
+                try:
+                    value = step.action()
+                except Exception:
+                    self._current = self._current[:index] if in_prefix else []
+                    raise
+                if is_target:
+                    result = value
+                status = RAN
+                # Daqui em diante o caminho diverge do prefixo anterior
+                in_prefix = False
+            self._record(step, target, status, time.perf_counter() - start)
+
+        self._current = [step.name for step in path]
+        return result
+
+    def _holds(self, step: Step, in_prefix: bool) -> bool:
+        if step.check is None:
+            return in_prefix
+        try:
+            return bool(step.check())
+        except Exception as e:
+            self.logger.debug("Checagem do passo '%s' falhou: %s", step.name, e)
+            return False
+
+    def _record(self, step: Step, target: Step, status: str, seconds: float):
+        self.timings.append({"step": step.name, "target": target.name, "status": status, "seconds": seconds})
+        self.logger.debug(
+            "%s: passo '%s' (%s) %s em %.3fs",
+            self.name, step.name, target.name, "executado" if status == RAN else "pulado", seconds,
+        )
+
+    # ------------------------------------------------------------------
+    # Relatório
+    # ------------------------------------------------------------------
+    def summary(self) -> Dict[str, dict]:
+        """``{passo: {"ran", "skipped", "seconds"}}`` na ordem da primeira aparição."""
+        summary: Dict[str, dict] = {}
+        for item in self.timings:
+            entry = summary.setdefault(item["step"], {"ran": 0, "skipped": 0, "seconds": 0.0})
+            entry["ran" if item["status"] == RAN else "skipped"] += 1
+            entry["seconds"] += item["seconds"]
+        return summary
+
+    def report(self) -> str:
+        linhas = [f"{'passo':<28} {'executado':>9} {'pulado':>7} {'tempo':>9}"]
+        for step, entry in self.summary().items():
+            linhas.append(f"{step:<28} {entry['ran']:>9} {entry['skipped']:>7} {entry['seconds']:>8.3f}s")
+        total = sum(item["seconds"] for item in self.timings)
+        linhas.append(f"{'total':<28} {'':>9} {'':>7} {total:>8.3f}s")
+        return "\n".join(linhas)
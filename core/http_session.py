@@ -0,0 +1,154 @@
+"""
+HttpSession — leitura de páginas por HTTP direto, com a sessão do Browser
+------------------------------------------------------------------------
+Inclui:
+- ``requests.Session`` com pool de conexões keep-alive (HTTP_POOL_SIZE)
+  e retry para erros transitórios do servidor
+- Cookies e user agent copiados do Browser (mesmo login, sem driver)
+- ``parse_table``: a mesma ``List[dict]`` de ``Browser.extract_table``
+  a partir do HTML do servidor
+
+Usada por ``Browser.fetch_table``, que cai para o navegador quando a
+página depende de JavaScript para montar a tabela.
+
+Exemplo:
+    with HttpSession.from_browser(browser) as http:
+        linhas = parse_table(http.fetch_html(url), ".display")
+"""
+
+import re
+from typing import List, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from core.browser_manager import table_rows_to_dicts
+from core.config_manager import ConfigManager
+from utils.html_dom import Element, parse_html
+from utils.logger import setup_logger
+
+_META_CHARSET = re.compile(rb"""<meta[^>]+charset=["']?([\w-]+)""", re.IGNORECASE)
+
+
+class HttpSession:
+    def __init__(self, pool_size: int = None, timeout: float = None, retries: int = 2):
+        cfg = ConfigManager
+        self.timeout = timeout or cfg.get("HTTP_TIMEOUT", 15, cast=float)
+        pool_size = pool_size or cfg.get("HTTP_POOL_SIZE", 10, cast=int)
+
+        self.logger = setup_logger("http_session")
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=pool_size,
+            pool_maxsize=pool_size,
+            max_retries=Retry(
+                total=retries,
+                backoff_factor=0.3,
+                status_forcelist=(502, 503, 504),
+                allowed_methods=("GET", "HEAD"),
+            ),
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    @classmethod
+    def from_browser(cls, browser, **kwargs) -> "HttpSession":
+        http = cls(**kwargs)
+        http.sync_from_browser(browser)
+        return http
+
+    def sync_from_browser(self, browser):
+        """Copia cookies e user agent do navegador para a sessão HTTP."""
+        user_agent = browser.driver.execute_script("return navigator.userAgent;")
+        if user_agent:
+            self.session.headers["User-Agent"] = user_agent
+
+        cookies = browser.get_cookies()
+        for cookie in cookies:
+            self.session.cookies.set(
+                cookie["name"],
+                cookie["value"],
+                domain=_cookie_domain(cookie.get("domain")),
+                path=cookie.get("path", "/"),
+                secure=cookie.get("secure", False),
+            )
+        self.logger.debug("Sessão HTTP sincronizada com o navegador (%s cookies)", len(cookies))
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        kwargs.setdefault("timeout", self.timeout)
+        return self.session.get(url, **kwargs)
+
+    def fetch_html(self, url: str) -> str:
+        """GET da página; levanta ``requests.HTTPError`` para status de erro."""
+        response = self.get(url)
+        response.raise_for_status()
+        if "charset" not in response.headers.get("Content-Type", "").lower():
+            # sem charset no cabeçalho o requests assume ISO-8859-1; o navegador usaria o <meta>
+            match = _META_CHARSET.search(response.content[:2048])
+            response.encoding = match.group(1).decode() if match else "utf-8"
+        return response.text
+
+    def close(self):
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def _cookie_domain(domain: Optional[str]) -> str:
+    """
+    Domínio do cookie no formato do cookiejar. Hosts sem ponto (ex:
+    "localhost") são tratados pelo http.cookiejar como "localhost.local";
+    sem esse ajuste o cookie nunca seria enviado.
+    """
+    if not domain:
+        return ""
+    host = domain.lstrip(".")
+    if "." not in host:
+        return host + ".local"
+    return domain
+
+
+def parse_table(
+    html: str,
+    table_selector: str,
+    header: bool = True,
+    attributes: Optional[List[str]] = None,
+) -> Optional[List[dict]]:
+    """
+    Extrai a tabela ``table_selector`` (CSS) do HTML no mesmo formato de
+    ``Browser.extract_table``. Retorna None se a tabela não existir.
+    """
+    table = parse_html(html).select_one(table_selector)
+    if table is None:
+        return None
+    return table_rows_to_dicts(table_rows(table, attributes or []), header)
+
+
+def table_rows(table: Element, attributes: List[str]) -> List[dict]:
+    """Linhas cruas (``{th, td, attrs}``) da tabela, como as de ``EXTRACT_TABLE_JS``."""
+
+    def attrs_of(cell):
+        out = {}
+        for name in attributes:
+            value = cell.get(name)
+            if value is None:
+                child = cell.select_one(f"[{name}]")
+                value = child.get(name) if child is not None else None
+            if value is not None:
+                out[name] = value
+        return out
+
+    rows = []
+    for tr in table.select("tr"):
+        tds = tr.select("td")
+        rows.append({
+            "th": [th.text for th in tr.select("th")],
+            "td": [td.text for td in tds],
+            "attrs": [attrs_of(td) for td in tds] if attributes else [],
+        })
+    return rows
@@ -0,0 +1,122 @@
+"""
+SessionCache — reaproveitamento de sessões autenticadas
+-------------------------------------------------------
+Inclui:
+- Snapshot de cookies + localStorage após um login bem-sucedido
+- Arquivo local por (usuário, URL base), com validade (SESSION_TTL)
+- Restauração em um Browser novo antes da navegação; cookies já vencidos
+  (ex: analytics, CSRF de vida curta) não são restaurados, e a validade da
+  sessão em si é conferida por quem chama (``is_logged_in``)
+
+O cache guarda credenciais de sessão: os arquivos são gravados com
+permissão 0600 em SESSION_CACHE_DIR (fora do controle de versão).
+"""
+
+import os
+import json
+import time
+import hashlib
+from typing import Optional
+from urllib.parse import urlsplit
+
+from core.browser_manager import Browser
+from core.config_manager import ConfigManager
+from utils.logger import setup_logger
+
+
+class SessionCache:
+    def __init__(self, folder: str = None, ttl: int = None):
+        cfg = ConfigManager
+
+        self.folder = folder or cfg.get("SESSION_CACHE_DIR", ".sessions")
+        self.ttl = ttl or cfg.get("SESSION_TTL", 3600, cast=int)
+        self.logger = setup_logger("session_cache")
+
+    # ------------------------------------------------------------------
+    # Snapshot
+    # ------------------------------------------------------------------
+    def save(self, browser: Browser, user: str, base_url: str):
+        """Salva cookies, localStorage e a URL atual da sessão logada."""
+        snapshot = {
+            "user": user,
+            "base_url": self._origin(base_url),
+            "created_at": time.time(),
+            "url": browser.driver.current_url,
+            "cookies": browser.get_cookies(),
+            "local_storage": browser.get_local_storage(),
+        }
+
+        os.makedirs(self.folder, exist_ok=True)
+        path = self._path(user, base_url)
+        tmp = path + ".tmp"
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(snapshot, f)
+        os.replace(tmp, path)
+        self.logger.info("Sessão salva para '%s' em %s", user, path)
+
+    def load(self, user: str, base_url: str) -> Optional[dict]:
+        """Retorna o snapshot válido ou None se ausente/expirado."""
+        path = self._path(user, base_url)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                snapshot = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if self._expired(snapshot):
+            self.logger.info("Sessão expirada para '%s', descartando snapshot.", user)
+            self.invalidate(user, base_url)
+            return None
+        return snapshot
+
+    def invalidate(self, user: str, base_url: str):
+        try:
+            os.remove(self._path(user, base_url))
+        except OSError:
+            pass
+
+    # ------------------------------------------------------------------
+    # Restauração
+    # ------------------------------------------------------------------
+    def restore(self, browser: Browser, user: str, base_url: str) -> bool:
+        """
+        Injeta o snapshot no navegador e navega para a URL salva.
+        Retorna False se não houver snapshot válido. A validação de que a
+        sessão ainda é aceita pelo servidor fica a cargo de quem chama
+        (ex: ``LoginPage.is_logged_in``).
+        """
+        snapshot = self.load(user, base_url)
+        if not snapshot:
+            return False
+
+        self.logger.info("Restaurando sessão de '%s'...", user)
+        # Cookies e localStorage só podem ser definidos estando na origem
+        browser.go_to(snapshot["base_url"] + "/")
+        browser.add_cookies(self._live_cookies(snapshot["cookies"]))
+        browser.set_local_storage(snapshot["local_storage"])
+        browser.go_to(snapshot["url"])
+        return True
+
+    # ------------------------------------------------------------------
+    # Auxiliares
+    # ------------------------------------------------------------------
+    def _expired(self, snapshot: dict) -> bool:
+        # Só a idade do snapshot; cookies vencidos são filtrados na restauração
+        return time.time() - snapshot.get("created_at", 0) > self.ttl
+
+    def _live_cookies(self, cookies: list) -> list:
+        now = time.time()
+        live = [c for c in cookies if c.get("expiry") is None or c["expiry"] > now]
+        if len(live) < len(cookies):
+            self.logger.debug("%s cookies vencidos não restaurados", len(cookies) - len(live))
+        return live
+
+    def _path(self, user: str, base_url: str) -> str:
+        key = f"{user}|{self._origin(base_url)}".encode("utf-8")
+        return os.path.join(self.folder, hashlib.sha256(key).hexdigest()[:32] + ".json")
+
+    @staticmethod
+    def _origin(url: str) -> str:
+        parts = urlsplit(url)
+        return f"{parts.scheme}://{parts.netloc}"
@@ -0,0 +1,168 @@
+"""
+WaitEngine — esperas explícitas com o implicit wait zerado
+----------------------------------------------------------
+Inclui:
+- Condições compostas: present, visible, clickable, absent, invisible, any_of, all_of
+- Intervalo de polling configurável (WAIT_POLL_INTERVAL)
+- Fast-path: a condição é avaliada uma vez antes de qualquer espera, e
+  retorna imediatamente quando o elemento já está pronto
+
+Com implicit wait > 0, cada ``find_elements`` de uma verificação negativa
+bloqueia pelo implicit wait inteiro; por isso o Browser roda com implicit
+wait = 0 e toda espera passa por aqui.
+
+Exemplo:
+    engine.until(any_of(visible(MODAL), present(AVATAR)), timeout=5)
+"""
+
+import time
+from typing import Any, Callable, Optional, Tuple
+
+from selenium.common.exceptions import (
+    NoSuchElementException,
+    StaleElementReferenceException,
+    TimeoutException,
+)
+
+from core.config_manager import ConfigManager
+
+
+Locator = Tuple[str, str]
+
+# Exceções que significam "ainda não" durante o polling
+IGNORED_EXCEPTIONS = (NoSuchElementException, StaleElementReferenceException)
+
+
+class Condition:
+    """Condição avaliada contra o driver; retorna um valor truthy quando satisfeita."""
+
+    def __init__(self, check: Callable[[Any], Any], description: str):
+        self.check = check
+        self.description = description
+
+    def __call__(self, driver):
+        return self.check(driver)
+
+    def __str__(self):
+        return self.description
+
+
+def present(locator: Locator) -> Condition:
+    """Primeiro elemento presente no DOM."""
+    def check(driver):
+        elements = driver.find_elements(*locator)
+        return elements[0] if elements else None
+    return Condition(check, f"present{locator}")
+
+
+def visible(locator: Locator) -> Condition:
+    """Primeiro elemento presente e visível."""
+    def check(driver):
+        for element in driver.find_elements(*locator):
+            if element.is_displayed():
+                return element
+        return None
+    return Condition(check, f"visible{locator}")
+
+
+def clickable(locator: Locator) -> Condition:
+    """Primeiro elemento visível e habilitado."""
+    def check(driver):
+        for element in driver.find_elements(*locator):
+            if element.is_displayed() and element.is_enabled():
+                return element
+        return None
+    return Condition(check, f"clickable{locator}")
+
+
+def absent(locator: Locator) -> Condition:
+    """Nenhum elemento presente no DOM."""
+    return Condition(lambda driver: not driver.find_elements(*locator), f"absent{locator}")
+
+
+def invisible(locator: Locator) -> Condition:
+    """Nenhum elemento visível (ausente ou oculto)."""
+    def check(driver):
+        try:
+            return not any(el.is_displayed() for el in driver.find_elements(*locator))
+        except StaleElementReferenceException:
+            # o elemento saiu do DOM durante a checagem
+            return True
+    return Condition(check, f"invisible{locator}")
+
+
+def any_of(*conditions: Condition) -> Condition:
+    """Primeiro resultado truthy entre as condições, na ordem dada."""
+    def check(driver):
+        for condition in conditions:
+            result = condition(driver)
+            if result:
+                return result
+        return None
+    return Condition(check, "any_of(" + ", ".join(map(str, conditions)) + ")")
+
+
+def all_of(*conditions: Condition) -> Condition:
+    """Lista com os resultados quando todas as condições são satisfeitas."""
+    def check(driver):
+        results = []
+        for condition in conditions:
+            result = condition(driver)
+            if not result:
+                return None
+            results.append(result)
+        return results
+    return Condition(check, "all_of(" + ", ".join(map(str, conditions)) + ")")
+
+
+CONDITIONS = {
+    "present": present,
+    "visible": visible,
+    "clickable": clickable,
+    "absent": absent,
+    "invisible": invisible,
+}
+
+
+class WaitEngine:
+    def __init__(self, driver, timeout: float = 10, poll_interval: float = None):
+        self.driver = driver
+        self.timeout = timeout
+        self.poll_interval = poll_interval or ConfigManager.get(
+            "WAIT_POLL_INTERVAL", 0.1, cast=float
+        )
+
+    def check(self, condition: Condition):
+        """Avalia a condição uma única vez (sem esperar)."""
+        try:
+            return condition(self.driver)
+        except IGNORED_EXCEPTIONS:
+            return None
+
+    def until(
+        self,
+        condition: Condition,
+        timeout: Optional[float] = None,
+        poll_interval: Optional[float] = None,
+    ):
+        """
+        Espera a condição ser satisfeita e retorna seu resultado.
+        Levanta ``TimeoutException`` ao esgotar o timeout.
+        """
+        # Fast-path: elemento já pronto, nenhuma espera
+        result = self.check(condition)
+        if result:
+            return result
+
+        timeout = self.timeout if timeout is None else timeout
+        poll = poll_interval or self.poll_interval
+        deadline = time.monotonic() + timeout
+
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutException(f"Condição não satisfeita em {timeout}s: {condition}")
+            time.sleep(min(poll, remaining))
+            result = self.check(condition)
+            if result:
+                return result
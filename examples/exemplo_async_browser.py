@@ -0,0 +1,38 @@
+import os
+import sys
+import asyncio
+
+sys.path.append(
+    os.path.dirname(os.path.dirname(__file__))
+)
+
+from core.async_browser import AsyncBrowser
+from utils.logger import setup_logger
+
+
+logger = setup_logger()
+
+URLS = [
+    "https://www.w3schools.com/html/html_tables.asp",
+    "https://www.w3schools.com/css/css_table.asp",
+    "https://www.w3schools.com/html/html_table_headers.asp",
+]
+
+
+async def extrair(url: str):
+    async with await AsyncBrowser.create(browser="chrome", headless=True, lean=True) as browser:
+        await browser.go_to(url)
+        await browser.wait_for("table", condition="visible")
+        return await browser.extract_table("table")
+
+
+async def exemplo():
+    # Um único processo/loop conduz todas as sessões ao mesmo tempo;
+    # as threads do executor só são usadas durante os round trips ao driver.
+    resultados = await asyncio.gather(*(extrair(url) for url in URLS))
+    for url, linhas in zip(URLS, resultados):
+        logger.info(f"{url}: {len(linhas)} linhas")
+
+
+if __name__ == "__main__":
+    asyncio.run(exemplo())
@@ -0,0 +1,39 @@
+import os
+import sys
+
+sys.path.append(
+    os.path.dirname(os.path.dirname(__file__))
+)
+
+from core.browser_pool import BrowserPool
+from flows.consultar_protocolos_flow import ConsultarProtocolosFlow
+from utils.logger import setup_logger
+
+
+logger = setup_logger()
+
+USUARIO = "meu_usuario"
+SENHA = "minha_senha"
+
+
+def executar(browser, nome_fluxo: str):
+    flow = ConsultarProtocolosFlow(browser)
+    getattr(flow, nome_fluxo)(USUARIO, SENHA)
+    return browser.extract_table(".display")
+
+
+def exemplo():
+    fluxos = [
+        "executar_fluxo_despacho",
+        "executar_fluxo_fiscalizacao",
+        "executar_fluxo_pre_envio_camaras",
+    ]
+    with BrowserPool(size=3, browser="chrome", headless=True) as pool:
+        resultados = pool.map(executar, fluxos)
+
+    for nome, linhas in zip(fluxos, resultados):
+        logger.info(f"{nome}: {len(linhas)} linhas")
+
+
+if __name__ == "__main__":
+    exemplo()
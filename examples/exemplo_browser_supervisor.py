@@ -0,0 +1,54 @@
+import os
+import sys
+
+sys.path.append(
+    os.path.dirname(os.path.dirname(__file__))
+)
+
+from core.browser_supervisor import BrowserSupervisor
+from flows.consultar_protocolos_flow import ConsultarProtocolosFlow
+from pages.user_home_page import UserHomePage
+from sinks.row_sinks import open_sink
+from utils.logger import setup_logger
+
+
+logger = setup_logger()
+
+USUARIO = "meu_usuario"
+SENHA = "minha_senha"
+
+
+def login(browser):
+    # Reexecutado a cada reinício do navegador
+    ConsultarProtocolosFlow(browser).login(USUARIO, SENHA)
+
+
+def exportar_categoria(browser, categoria: int):
+    UserHomePage(browser).acessar_categoria(categoria)
+    linhas = browser.extract_table(".display")
+    with open_sink(f"protocolos_categoria_{categoria}.csv") as sink:
+        sink.write_rows(linhas)
+    return len(linhas)
+
+
+def exemplo():
+    # Se o chromedriver morrer no meio, o navegador é reiniciado, o login é
+    # refeito e o passo é repetido; rodando de novo, os passos concluídos
+    # (gravados no checkpoint) são pulados.
+    with BrowserSupervisor(
+        login_hook=login,
+        checkpoint_path=".checkpoints/exportar_categorias.json",
+        browser="chrome",
+        headless=True,
+    ) as supervisor:
+        resultados = supervisor.run_steps([
+            (f"categoria_{categoria}", lambda b, c=categoria: exportar_categoria(b, c))
+            for categoria in (0, 1, 2)
+        ])
+
+    for passo, linhas in resultados.items():
+        logger.info("%s: %s linhas", passo, linhas)
+
+
+if __name__ == "__main__":
+    exemplo()
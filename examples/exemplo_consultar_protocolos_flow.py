@@ -6,11 +6,13 @@ sys.path.append(
 )
 
 from core.browser_manager import Browser
+from core.session_cache import SessionCache
 from flows.consultar_protocolos_flow import ConsultarProtocolosFlow
 
 browser = Browser(browser="chrome", headless=False)
 
-flow = ConsultarProtocolosFlow(browser)
+# A sessão fica salva em .sessions/ e é reaproveitada nas próximas execuções
+flow = ConsultarProtocolosFlow(browser, session_cache=SessionCache())
 
 flow.executar_fluxo_fiscalizacao(
     username="meu_usuario",
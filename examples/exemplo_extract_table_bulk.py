@@ -0,0 +1,47 @@
+import os
+import sys
+
+sys.path.append(
+    os.path.dirname(os.path.dirname(__file__))
+)
+
+import pathlib
+import time
+from core.browser_manager import Browser
+from utils.logger import setup_logger
+
+
+logger = setup_logger()
+
+FIXTURE = pathlib.Path(__file__).parent / "fixtures" / "tabela_protocolos.html"
+
+
+def exemplo():
+    """
+    Compara a extração bulk (um único execute_script) com o caminho
+    célula a célula sobre a fixture local e confere que o resultado é igual.
+    """
+    nav = Browser(browser="chrome", headless=True)
+    try:
+        nav.go_to(FIXTURE.resolve().as_uri())
+
+        inicio = time.perf_counter()
+        por_celula = nav.extract_table(".display", bulk=False)
+        tempo_por_celula = time.perf_counter() - inicio
+
+        inicio = time.perf_counter()
+        bulk = nav.extract_table(".display")
+        tempo_bulk = time.perf_counter() - inicio
+
+        assert bulk == por_celula, f"Divergência:\n{bulk}\n!=\n{por_celula}"
+        logger.info(f"Paridade OK ({len(bulk)} linhas)")
+        logger.info(f"Célula a célula: {tempo_por_celula:.3f}s | bulk: {tempo_bulk:.3f}s")
+
+        com_links = nav.extract_table(".display", attributes=["href"])
+        logger.info(f"Primeira linha com atributos: {com_links[0]}")
+    finally:
+        nav.quit()
+
+
+if __name__ == "__main__":
+    exemplo()
@@ -0,0 +1,53 @@
+import os
+import sys
+
+sys.path.append(
+    os.path.dirname(os.path.dirname(__file__))
+)
+
+from selenium.webdriver.common.by import By
+from components.paginator import Paginator
+from core.browser_supervisor import BrowserSupervisor
+from flows.consultar_protocolos_flow import ConsultarProtocolosFlow
+from jobs.extraction_job import ExtractionJob
+from pages.user_home_page import UserHomePage
+from utils.logger import setup_logger
+
+
+logger = setup_logger()
+
+USUARIO = "meu_usuario"
+SENHA = "minha_senha"
+TABELA = (By.CSS_SELECTOR, ".display")
+PAGINAS = (By.CSS_SELECTOR, "[id^='Paginator_ProtocolosSetorFilial'] > label:nth-child(1) > a:nth-child({page})")
+
+
+def login(browser):
+    ConsultarProtocolosFlow(browser).login(USUARIO, SENHA)
+
+
+def paginas(browser, categoria: int, start_page: int):
+    UserHomePage(browser).acessar_categoria(categoria)
+    paginator = Paginator(browser, table=TABELA, page_locator=PAGINAS)
+    return paginator.iter_pages(start_page=start_page)
+
+
+def exemplo():
+    # Se a execução cair (ou o driver morrer) no meio, rodar de novo pula as
+    # categorias concluídas e retoma a interrompida na página seguinte à
+    # última gravada; protocolos já gravados não são duplicados.
+    with BrowserSupervisor(login_hook=login, browser="chrome", headless=True) as supervisor, \
+            ExtractionJob("protocolos_a_receber", "protocolos_a_receber.csv", key="Protocolo") as job:
+        for categoria in (0, 1, 2):
+            supervisor.call(
+                lambda browser, c=categoria: job.run_unit(
+                    f"categoria_{c}", lambda start: paginas(browser, c, start)
+                )
+            )
+
+        for unidade in job.progress():
+            logger.info("%s: %s (%s linhas)", unidade["unit"], unidade["status"], unidade["rows"])
+
+
+if __name__ == "__main__":
+    exemplo()
@@ -0,0 +1,41 @@
+import os
+import sys
+
+sys.path.append(
+    os.path.dirname(os.path.dirname(__file__))
+)
+
+from core.browser_manager import Browser
+from flows.consultar_protocolos_flow import ConsultarProtocolosFlow
+from utils.logger import setup_logger
+
+
+logger = setup_logger()
+
+
+def detalhes(browser, url):
+    # Roda na aba da URL, já carregada; a sessão (login) é a mesma
+    browser.wait_for(".display")
+    return browser.extract_table(".display")
+
+
+def exemplo():
+    browser = Browser(browser="chrome", headless=True)
+    try:
+        flow = ConsultarProtocolosFlow(browser)
+        flow.executar_fluxo_fiscalizacao("meu_usuario", "minha_senha")
+
+        # Links de detalhe de cada protocolo da listagem
+        protocolos = browser.extract_table(".display", attributes=["href"])
+        urls = [p["Protocolo_href"] for p in protocolos if p.get("Protocolo_href")]
+
+        # Até 4 páginas carregando ao mesmo tempo, no mesmo driver
+        resultados = browser.fan_out_tabs(urls, detalhes, max_tabs=4)
+        for url, linhas in zip(urls, resultados):
+            logger.info(f"{url}: {len(linhas)} linhas")
+    finally:
+        browser.quit()
+
+
+if __name__ == "__main__":
+    exemplo()
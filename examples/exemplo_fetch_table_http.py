@@ -0,0 +1,64 @@
+import os
+import sys
+
+sys.path.append(
+    os.path.dirname(os.path.dirname(__file__))
+)
+
+import functools
+import pathlib
+import threading
+import time
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+from core.browser_manager import Browser
+from utils.logger import setup_logger
+
+
+logger = setup_logger()
+
+FIXTURES = pathlib.Path(__file__).parent / "fixtures"
+
+
+class _SilentHandler(SimpleHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+def servidor_local():
+    """Serve examples/fixtures em uma porta livre de 127.0.0.1, em background."""
+    handler = functools.partial(_SilentHandler, directory=str(FIXTURES))
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def exemplo():
+    """
+    Lê a mesma tabela pelo navegador (extract_table) e por HTTP direto
+    (fetch_table) a partir de um servidor local, e confere a paridade.
+    """
+    server = servidor_local()
+    url = f"http://127.0.0.1:{server.server_port}/tabela_protocolos.html"
+    nav = Browser(browser="chrome", headless=True)
+    try:
+        nav.go_to(url)
+
+        inicio = time.perf_counter()
+        pelo_navegador = nav.extract_table(".display", attributes=["href"])
+        tempo_navegador = time.perf_counter() - inicio
+
+        inicio = time.perf_counter()
+        por_http = nav.fetch_table(url, ".display", attributes=["href"])
+        tempo_http = time.perf_counter() - inicio
+
+        assert por_http == pelo_navegador, f"Divergência:\n{por_http}\n!=\n{pelo_navegador}"
+        logger.info(f"Paridade OK ({len(por_http)} linhas)")
+        logger.info(f"Navegador: {tempo_navegador:.3f}s | HTTP: {tempo_http:.3f}s")
+    finally:
+        nav.quit()
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    exemplo()
@@ -0,0 +1,38 @@
+import os
+import sys
+
+sys.path.append(
+    os.path.dirname(os.path.dirname(__file__))
+)
+
+from core.browser_manager import Browser
+from flows.consultar_protocolos_flow import ConsultarProtocolosFlow
+from sinks.row_sinks import open_sink
+from utils.logger import setup_logger
+
+
+logger = setup_logger()
+
+USUARIO = "meu_usuario"
+SENHA = "minha_senha"
+
+
+def exemplo():
+    browser = Browser(browser="chrome", headless=True)
+    try:
+        # Login e menus uma vez só; depois só o clique de cada categoria
+        flow = ConsultarProtocolosFlow(browser)
+        resultados = flow.extrair_categorias(USUARIO, SENHA, categorias=(0, 1, 2))
+
+        with open_sink("protocolos_a_receber.csv") as sink:
+            for categoria, linhas in resultados.items():
+                sink.write_rows(linhas)
+                logger.info("Categoria %s: %s linhas", categoria, len(linhas))
+
+        logger.info("Tempo por passo:\n%s", flow.engine.report())
+    finally:
+        browser.quit()
+
+
+if __name__ == "__main__":
+    exemplo()
@@ -5,7 +5,6 @@ sys.path.append(
     os.path.dirname(os.path.dirname(__file__))
 )
 
-import time
 from core.browser_manager import Browser
 from utils.logger import setup_logger
 
@@ -21,8 +20,7 @@ def exemplo():
         nav.type('#login', '00000000000000')
         nav.type('#senha', 'minha_senha')
         nav.click('#enviar')
-        
-        time.sleep(1)
+        nav.wait_until_idle()
         
         logger.info('Buscando mensagem de erro')
         nav.wait_for('#error_message')
@@ -5,9 +5,10 @@ sys.path.append(
     os.path.dirname(os.path.dirname(__file__))
 )
 
-import time
+from selenium.webdriver.common.by import By
 from core.browser_manager import Browser
-from excel.excel_manager import ExcelManager
+from components.paginator import Paginator
+from sinks.row_sinks import open_sink
 from utils.logger import setup_logger
 
 
@@ -20,27 +21,32 @@ def exemplo():
         nav.go_to('https://crea-ma.sitac.com.br/app/view/pages/login/login.php#!')
         input('Insira usuário e senha manualmente')
         nav.wait_for('#welcome_avatar')
-        
-        time.sleep(1)
+        nav.wait_until_idle()
         
         # Fechar janela de notícias
         # nav.click('.iziModal-button')
         
         # Navegar até a tabela
         nav.click('#conteudo > div.cad_conteudo > div:nth-child(5)')
-        time.sleep(1)
+        nav.wait_until_idle()
         nav.click('#mostrarProtocolosAReceber')
-        time.sleep(1)
+        nav.wait_until_idle()
         nav.click('#mostrarProtocoloSetorFilial1')
-        time.sleep(1)
-        nav.click('#Paginator_ProtocolosSetorFilial2144 > label:nth-child(1) > a:nth-child(1)')
+        nav.wait_until_idle()
         
-        # Extrair tabela
-        data = nav.extract_table('.display')
-        if data:
-            path = os.path.join(os.curdir, 'examples', 'screenshots', 'saida.xlsx')
-            ExcelManager.write(path, data, sheet_name='Resultados')
-            logger.info(f'Dados gravados em {path}')
+        # Extrair todas as páginas, gravando cada uma assim que é lida
+        paginator = Paginator(
+            nav,
+            table=(By.CSS_SELECTOR, '.display'),
+            page_locator=(
+                By.CSS_SELECTOR,
+                '#Paginator_ProtocolosSetorFilial2144 > label:nth-child(1) > a:nth-child({page})',
+            ),
+        )
+        path = os.path.join(os.curdir, 'examples', 'screenshots', 'saida.xlsx')
+        with open_sink(path, sheet_name='Resultados') as sink:
+            total = paginator.export(sink)
+        logger.info(f'{total} linhas gravadas em {path}')
     finally:
         nav.quit()
 
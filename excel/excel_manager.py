@@ -1,6 +1,7 @@
 """Manager simples para leitura e escrita Excel usando pandas/openpyxl."""
 import pandas as pd
 from typing import List, Dict, Optional
+from excel.excel_stream_writer import ExcelStreamWriter
 
 class ExcelManager:
     @staticmethod
@@ -11,7 +12,8 @@ class ExcelManager:
 
     @staticmethod
     def append(path: str, data: List[Dict], sheet_name: str = 'Sheet1', index: bool = False):
-        # lê se existe, concatena e regrava
+        # lê se existe, concatena e regrava (O(n) por chamada; para vários
+        # lotes seguidos use ExcelManager.stream)
         try:
             existing = pd.read_excel(path, sheet_name=sheet_name)
             df_new = pd.DataFrame(data)
@@ -21,6 +23,11 @@ class ExcelManager:
         with pd.ExcelWriter(path, engine='openpyxl', mode='w') as writer:
             out.to_excel(writer, sheet_name=sheet_name, index=index)
 
+    @staticmethod
+    def stream(path: str, sheet_name: str = 'Sheet1', columns: Optional[List[str]] = None, mode: str = 'w') -> ExcelStreamWriter:
+        """Abre um ExcelStreamWriter para gravação incremental em lotes."""
+        return ExcelStreamWriter(path, sheet_name=sheet_name, columns=columns, mode=mode)
+
     @staticmethod
     def read(path: str, sheet_name: Optional[str] = None) -> pd.DataFrame:
         return pd.read_excel(path, sheet_name=sheet_name)
\ No newline at end of file
@@ -0,0 +1,96 @@
+"""Escrita incremental de Excel (openpyxl), sem reler e regravar o arquivo a cada lote."""
+import os
+import logging
+from typing import Dict, Iterable, List, Optional
+
+from openpyxl import Workbook, load_workbook
+
+logger = logging.getLogger('web_automation')
+
+
+class ExcelStreamWriter:
+    """
+    Mantém o workbook aberto e acrescenta linhas em lotes; grava no ``close()``.
+
+    - ``mode='w'``: cria o arquivo em modo write-only do openpyxl (as linhas
+      vão para um arquivo temporário, a memória não cresce com o volume).
+    - ``mode='a'``: se o arquivo existir, ele é carregado uma única vez e as
+      linhas são anexadas à aba; as colunas seguem o cabeçalho existente.
+
+    As colunas vêm de ``columns`` ou das chaves da primeira linha escrita;
+    chaves desconhecidas em linhas posteriores são ignoradas (com aviso).
+
+    Exemplo:
+        with ExcelStreamWriter('saida.xlsx', sheet_name='Resultados') as writer:
+            for pagina in paginas:
+                writer.write_rows(pagina)
+    """
+
+    def __init__(
+        self,
+        path: str,
+        sheet_name: str = 'Sheet1',
+        columns: Optional[List[str]] = None,
+        mode: str = 'w',
+    ):
+        if mode not in ('w', 'a'):
+            raise ValueError(f"Modo '{mode}' inválido. Use 'w' ou 'a'.")
+
+        self.path = path
+        self.sheet_name = sheet_name
+        self.columns = list(columns) if columns else None
+        self.rows_written = 0
+        self._unknown_warned = False
+        self._closed = False
+
+        if mode == 'a' and os.path.exists(path):
+            self._wb = load_workbook(path)
+            if sheet_name in self._wb.sheetnames:
+                self._ws = self._wb[sheet_name]
+                header = next(self._ws.iter_rows(min_row=1, max_row=1, values_only=True), None)
+                if header and any(h is not None for h in header):
+                    self.columns = [h for h in header if h is not None]
+                    return
+            else:
+                self._ws = self._wb.create_sheet(sheet_name)
+        else:
+            self._wb = Workbook(write_only=True)
+            self._ws = self._wb.create_sheet(sheet_name)
+
+        if self.columns:
+            self._ws.append(self.columns)
+
+    def write_rows(self, rows: Iterable[Dict]) -> int:
+        """Anexa as linhas (dicts) e retorna quantas foram escritas."""
+        count = 0
+        for row in rows:
+            if self.columns is None:
+                self.columns = list(row.keys())
+                self._ws.append(self.columns)
+            elif not self._unknown_warned and any(k not in self.columns for k in row):
+                self._unknown_warned = True
+                logger.warning(
+                    "Colunas fora do cabeçalho serão ignoradas em %s: %s",
+                    self.path, [k for k in row if k not in self.columns]
+                )
+            self._ws.append([row.get(col) for col in self.columns])
+            count += 1
+        self.rows_written += count
+        return count
+
+    def write_batches(self, batches: Iterable[Iterable[Dict]]) -> int:
+        """Consome um iterador de lotes (ex: uma página de tabela por vez)."""
+        return sum(self.write_rows(batch) for batch in batches)
+
+    def close(self):
+        """Grava o arquivo. Idempotente."""
+        if self._closed:
+            return
+        self._closed = True
+        self._wb.save(self.path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
@@ -1,45 +1,116 @@
+from datetime import date, datetime
+from functools import partial
+from typing import Dict, List, Optional
+from selenium.webdriver.common.by import By
+from components.paginator import Paginator
+from core.flow_engine import FlowEngine, Step, StepGraph
+from core.session_cache import SessionCache
 from pages.login_page import LoginPage
 from pages.user_home_page import UserHomePage
 from components.noticia_modal import NoticiaModal
+from utils.decorators import time_it
+
+
+def _data(valor) -> Optional[date]:
+    """Aceita date, "YYYY-MM-DD" ou "DD/MM/YYYY"; vazio → None."""
+    if not valor:
+        return None
+    if isinstance(valor, date):
+        return valor
+    for formato in ("%Y-%m-%d", "%d/%m/%Y"):
+        try:
+            return datetime.strptime(str(valor).strip()[:10], formato).date()
+        except ValueError:
+            continue
+    raise ValueError(f"Data '{valor}' inválida. Use YYYY-MM-DD ou DD/MM/YYYY.")
+
 
 class ConsultarProtocolosFlow:
     """
     Fluxo:
     Login → Fechar modal → Home → Protocolos → A Receber → Categoria semântica
+
+    Com um ``SessionCache``, o login reaproveita a sessão salva na última
+    execução e só refaz o login completo se ela estiver expirada/inválida.
+
+    ``extrair_categorias`` percorre o mesmo caminho declarado como grafo
+    (``grafo``/``FlowEngine``): várias categorias compartilham o login e os
+    menus, em vez de refazer a cadeia inteira para cada uma.
     """
 
-    def __init__(self, browser):
+    TABELA = (By.CSS_SELECTOR, ".display")
+    PAGINAS = (By.CSS_SELECTOR, "[id^='Paginator_ProtocolosSetorFilial'] > label:nth-child(1) > a:nth-child({page})")
+
+    def __init__(self, browser, session_cache: Optional[SessionCache] = None):
         self.browser = browser
+        self.session_cache = session_cache
 
         self.login_page = LoginPage(browser)
         self.home_page = UserHomePage(browser)
         self.modal_noticias = NoticiaModal(browser)
 
+        # Parâmetros da chamada atual de extrair_categorias, lidos pelos passos
+        self._params: dict = {}
+        self._usuario: Optional[str] = None
+        self.engine = FlowEngine(self.grafo(), name=type(self).__name__)
+
     # -----------------------------------------
     # Fluxo de login
     # -----------------------------------------
+    @time_it(kind="step", keyed=False)
     def login(self, username: str, password: str):
+        if self._usuario not in (None, username):
+            # Outra credencial no mesmo navegador: sem a sessão anterior
+            self.browser.clear_session()
+            self.engine.invalidate()
+        self._usuario = None
+
+        if self.session_cache and self._restaurar_sessao(username):
+            self.browser.wait_until_idle()
+            self.modal_noticias.fechar()
+            self._usuario = username
+            return
+
         self.login_page.open_login()
         self.login_page.login(username, password)
 
         if not self.login_page.is_logged_in():
             raise RuntimeError("Falha no login.")
 
+        if self.session_cache:
+            self.session_cache.save(self.browser, username, self.login_page.URL)
+
+        # O modal de notícias só aparece depois das cargas pós-login
+        self.browser.wait_until_idle()
         self.modal_noticias.fechar()
+        self._usuario = username
+
+    def _restaurar_sessao(self, username: str) -> bool:
+        if not self.session_cache.restore(self.browser, username, self.login_page.URL):
+            return False
+
+        if self.login_page.is_logged_in(timeout=5):
+            return True
+
+        self.session_cache.invalidate(username, self.login_page.URL)
+        return False
 
     # -----------------------------------------
     # Métodos de fluxo semântico
     # -----------------------------------------
+    @time_it(kind="step")
     def acessar_protocolos_aguardando_resposta_despacho(self):
         self.home_page.abrir_protocolos()
         self.home_page.abrir_protocolos_a_receber()
         self.home_page.abrir_aguardando_resposta_despacho()
 
+    @time_it(kind="step")
     def acessar_protocolos_departamento_fiscalizacao(self):
         self.home_page.abrir_protocolos()
         self.home_page.abrir_protocolos_a_receber()
         self.home_page.abrir_departamento_fiscalizacao()
 
+    @time_it(kind="step")
     def acessar_protocolos_pre_envio_para_camaras(self):
         self.home_page.abrir_protocolos()
         self.home_page.abrir_protocolos_a_receber()
@@ -48,14 +119,104 @@ class ConsultarProtocolosFlow:
     # -----------------------------------------
     # Fluxo completo com categoria semântica
     # -----------------------------------------
+    @time_it(kind="step", keyed=False)
     def executar_fluxo_despacho(self, username: str, password: str):
         self.login(username, password)
         self.acessar_protocolos_aguardando_resposta_despacho()
 
+    @time_it(kind="step", keyed=False)
     def executar_fluxo_fiscalizacao(self, username: str, password: str):
         self.login(username, password)
         self.acessar_protocolos_departamento_fiscalizacao()
     
+    @time_it(kind="step", keyed=False)
     def executar_fluxo_pre_envio_camaras(self, username: str, password: str):
         self.login(username, password)
         self.acessar_protocolos_pre_envio_para_camaras()
+
+    # -----------------------------------------
+    # Grafo de passos (prefixo comum feito uma vez só)
+    # -----------------------------------------
+    def grafo(self) -> StepGraph:
+        """
+        login → protocolos → a_receber → categoria_N → extrair_N.
+        Os passos leem credenciais e período de ``self._params`` (definidos
+        por ``extrair_categorias``); o login é pulado se o mesmo usuário já
+        está logado e menus já abertos na página não são clicados de novo.
+        """
+        home = self.home_page
+        grafo = StepGraph([
+            Step("login", lambda: self.login(self._params["username"], self._params["password"]),
+                 check=self._logado),
+            Step("protocolos", home.abrir_protocolos, requires=["login"],
+                 check=lambda: home.is_element_visible(home.MENU_PROTOCOLO_A_RECEBER)),
+            Step("a_receber", home.abrir_protocolos_a_receber, requires=["protocolos"],
+                 check=lambda: home.is_element_visible(home.CATEGORIA_0)),
+        ])
+        for numero in home.CATEGORIAS:
+            grafo.add(Step(f"categoria_{numero}", partial(home.abrir_categoria, numero), requires=["a_receber"]))
+            grafo.add(Step(f"extrair_{numero}", self._extrair, requires=[f"categoria_{numero}"]))
+        return grafo
+
+    def _logado(self) -> bool:
+        return self._usuario == self._params["username"] and self.login_page.is_logged_in(timeout=0)
+
+    # -----------------------------------------
+    # Extração (usada pelo runner em lote: python -m jobs)
+    # -----------------------------------------
+    @time_it(kind="step", keyed=False)
+    def extrair_categorias(
+        self,
+        username: str,
+        password: str,
+        categorias=(0, 1, 2),
+        data_inicio=None,
+        data_fim=None,
+    ) -> Dict[int, List[dict]]:
+        """
+        Linhas de todas as páginas de cada categoria, com um único login e
+        uma única abertura dos menus. ``data_inicio``/``data_fim`` filtram
+        pela coluna "Data" (inclusive). O ``self.engine`` é o mesmo entre
+        chamadas: login e menus já feitos não são refeitos (e os tempos por
+        passo se acumulam nele).
+        """
+        categorias = [int(numero) for numero in categorias]
+        for numero in categorias:
+            if numero not in self.home_page.CATEGORIAS:
+                raise ValueError(f"Setor '{numero}' não é válido. Use 0, 1 ou 2.")
+
+        self._params = {
+            "username": username, "password": password, "data_inicio": data_inicio, "data_fim": data_fim,
+        }
+        resultados = self.engine.run([f"extrair_{numero}" for numero in categorias])
+        return {numero: resultados[f"extrair_{numero}"] for numero in categorias}
+
+    @time_it(kind="step", keyed=False)
+    def extrair_protocolos(
+        self,
+        username: str,
+        password: str,
+        categoria: int,
+        data_inicio=None,
+        data_fim=None,
+    ) -> List[dict]:
+        """Login → categoria → linhas de todas as páginas da tabela."""
+        return self.extrair_categorias(username, password, [categoria], data_inicio, data_fim)[int(categoria)]
+
+    def _extrair(self) -> List[dict]:
+        return self._linhas(self._params["data_inicio"], self._params["data_fim"])
+
+    def _linhas(self, data_inicio=None, data_fim=None) -> List[dict]:
+        inicio, fim = _data(data_inicio), _data(data_fim)
+        paginator = Paginator(self.browser, table=self.TABELA, page_locator=self.PAGINAS)
+        linhas = []
+        for row in paginator.iter_rows():
+            if inicio or fim:
+                try:
+                    dia = _data(row.get("Data"))
+                except ValueError:
+                    continue
+                if not dia or (inicio and dia < inicio) or (fim and dia > fim):
+                    continue
+            linhas.append(row)
+        return linhas
@@ -0,0 +1,71 @@
+"""
+Runner em lote: executa uma matriz de jobs em vários processos, um
+navegador por processo, e junta as linhas num único arquivo.
+
+Uso:
+    python -m jobs MATRIZ.yaml [--workers 4] [--output saida.csv] [--resume]
+    python -m jobs MATRIZ.xlsx --flow flows.consultar_protocolos_flow.ConsultarProtocolosFlow
+        --method extrair_protocolos --output saida.csv [--tag categoria username]
+    python -m jobs MATRIZ.yaml --dry-run
+
+No YAML ficam o fluxo, o método, a saída e os eixos (ver jobs/job_matrix.py);
+no Excel, cada aba é um eixo. As opções da linha de comando sobrescrevem o
+arquivo. Sai com código 1 se algum job falhar; --resume roda só os pendentes.
+"""
+
+import argparse
+import json
+import sys
+
+from jobs.batch_runner import BatchRunner
+from jobs.job_matrix import JobMatrix
+from utils.logger import setup_logger
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m jobs", description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("matriz", help="matriz de jobs (.yaml ou .xlsx)")
+    parser.add_argument("--flow", help="classe do fluxo (pacote.modulo.Classe)")
+    parser.add_argument("--method", help="método do fluxo chamado com os parâmetros do job")
+    parser.add_argument("--output", help="arquivo de resultado (.csv, .jsonl ou .xlsx)")
+    parser.add_argument("--tag", nargs="*", help="parâmetros copiados como colunas em cada linha")
+    parser.add_argument("--workers", type=int, help="processos (padrão: BATCH_WORKERS ou nº de CPUs)")
+    parser.add_argument("--browser", help="chrome ou firefox")
+    parser.add_argument("--headed", action="store_true", help="abre os navegadores com janela")
+    parser.add_argument("--backend", help="backend do driver (selenium, fake, replay)")
+    parser.add_argument("--resume", action="store_true", help="pula os jobs concluídos na execução anterior")
+    parser.add_argument("--keep-parts", action="store_true", help="mantém os arquivos parciais de cada job")
+    parser.add_argument("--dry-run", action="store_true", help="só lista os jobs")
+    parser.add_argument("--json", help="grava o resumo da execução neste arquivo")
+    args = parser.parse_args()
+
+    logger = setup_logger()
+    matrix = JobMatrix.load(args.matriz)
+    for option in ("flow", "method", "tag"):
+        if getattr(args, option) is not None:
+            setattr(matrix, option, getattr(args, option))
+    if args.browser:
+        matrix.browser["browser"] = args.browser
+    if args.headed:
+        matrix.browser["headless"] = False
+    if args.backend:
+        matrix.browser["backend"] = args.backend
+
+    if args.dry_run:
+        jobs = matrix.jobs()
+        logger.info("%s jobs:\n%s", len(jobs), "\n".join(f"{job['id']}  {job['label']}" for job in jobs))
+        return 0
+
+    summary = BatchRunner(matrix, output=args.output, workers=args.workers, resume=args.resume,
+                          keep_parts=args.keep_parts).run()
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(summary, f, ensure_ascii=False, indent=2)
+        logger.info("Resumo gravado em %s", args.json)
+    return 1 if summary["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
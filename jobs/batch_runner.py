@@ -0,0 +1,261 @@
+"""
+BatchRunner — matriz de jobs em paralelo, um navegador por processo
+-------------------------------------------------------------------
+Inclui:
+- ProcessPoolExecutor com N processos (BATCH_WORKERS, padrão: nº de CPUs),
+  iniciados com "spawn" (não herdam threads/locks do processo pai)
+- Um Browser por processo, criado no primeiro job e reaproveitado nos
+  seguintes; sessão morta → novo navegador e o job roda de novo
+  (BrowserSupervisor)
+- O fluxo também é reaproveitado entre jobs do mesmo processo com a
+  mesma credencial (login e menus já feitos não se repetem); cookies e
+  storage só são limpos quando muda o fluxo, o usuário ou o navegador,
+  ou depois de um job com erro
+- ``${VAR}`` dos parâmetros resolvido só ao rodar o job
+- Cada job executa ``Fluxo(browser).<método>(**params)``; as linhas
+  retornadas vão para um arquivo parcial (JSONL) do job
+- Junção dos parciais, na ordem dos jobs, em um único arquivo de saída
+  (.csv, .jsonl ou .xlsx, ver ``open_sink``)
+- ``resume``: jobs com parcial concluído não rodam de novo; os parciais só
+  são apagados quando todos os jobs terminam sem erro
+
+Exemplo:
+    matrix = JobMatrix.load("examples/jobs_protocolos.yaml")
+    resumo = BatchRunner(matrix, workers=4).run()
+
+    # ou pela linha de comando:
+    python -m jobs examples/jobs_protocolos.yaml --workers 4
+"""
+
+import importlib
+import json
+import multiprocessing
+import os
+import shutil
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing.util import Finalize
+from typing import Callable, Dict, List, Optional
+
+from core.browser_supervisor import BrowserSupervisor
+from core.config_manager import ConfigManager
+from jobs.job_matrix import JobMatrix, resolve_env
+from sinks.row_sinks import JsonlSink, open_sink
+from utils.logger import flush_logs, log_context, setup_logger
+
+MERGE_BATCH = 500
+
+
+def resolve(path: str):
+    """Importa ``pacote.modulo.Nome`` e retorna o objeto."""
+    module, _, name = path.rpartition(".")
+    if not module:
+        raise ValueError(f"'{path}' não é um caminho pacote.modulo.Nome.")
+    return getattr(importlib.import_module(module), name)
+
+
+# ----------------------------------------------------------------------
+# Lado do worker (um processo, um navegador)
+# ----------------------------------------------------------------------
+_supervisor: Optional[BrowserSupervisor] = None
+# Fluxo do último job: ((fluxo, usuário), browser, instância)
+_flow: Optional[tuple] = None
+
+
+def _init_worker(browser_kwargs: dict, browser_factory: Optional[str]):
+    global _supervisor
+    factory = resolve(browser_factory) if browser_factory else None
+    _supervisor = BrowserSupervisor(browser_factory=factory, **browser_kwargs)
+    # Processos do pool terminam sem passar pelo atexit
+    Finalize(_supervisor, _close_worker, exitpriority=10)
+
+
+def _close_worker():
+    if _supervisor is not None:
+        _supervisor.quit()
+    flush_logs()
+
+
+def _execute(browser, flow: str, method: str, params: dict) -> List[dict]:
+    global _flow
+    key = (flow, params.get("username"))
+    if _flow is None or _flow[0] != key or _flow[1] is not browser:
+        # Outro fluxo, outra credencial ou navegador reiniciado: começa sem
+        # os cookies/storage do job anterior e com um fluxo novo
+        browser.clear_session()
+        _flow = (key, browser, resolve(flow)(browser))
+    try:
+        rows = getattr(_flow[2], method)(**params)
+    except Exception:
+        # Estado da página desconhecido: o próximo job começa do zero
+        _flow = None
+        raise
+    return list(rows or [])
+
+
+def _run_job(flow: str, method: str, job: dict, part: str, tag: List[str]) -> dict:
+    logger = setup_logger("batch_runner")
+    result = {"id": job["id"], "label": job["label"], "pid": os.getpid(), "rows": 0, "error": None}
+    start = time.perf_counter()
+
+    with log_context(step=f"job {job['id']}"):
+        try:
+            params = resolve_env(job["params"])
+            rows = _supervisor.call(_execute, flow, method, params)
+            tags = {name: params.get(name) for name in tag}
+
+            tmp = part + ".tmp"
+            with JsonlSink(tmp) as sink:
+                result["rows"] = sink.write_rows({**tags, **row} for row in rows)
+            os.replace(tmp, part)
+            result["status"] = "done"
+        except Exception as e:
+            logger.error("Job %s (%s) falhou: %s: %s", job["id"], job["label"], e.__class__.__name__, e)
+            result["status"] = "failed"
+            result["error"] = f"{e.__class__.__name__}: {e}"
+
+    result["seconds"] = time.perf_counter() - start
+    return result
+
+
+# ----------------------------------------------------------------------
+# Lado do coordenador
+# ----------------------------------------------------------------------
+class BatchRunner:
+    def __init__(
+        self,
+        matrix: JobMatrix,
+        output: str = None,
+        workers: int = None,
+        resume: bool = False,
+        keep_parts: bool = False,
+        on_result: Optional[Callable[[dict], None]] = None,
+    ):
+        """
+        ``output`` e ``workers`` sobrescrevem os valores da matriz
+        (``workers`` padrão: BATCH_WORKERS ou o nº de CPUs).
+        ``resume`` reaproveita os parciais de uma execução anterior.
+        ``on_result(resultado)`` é chamado no processo pai a cada job concluído.
+        """
+        self.matrix = matrix
+        self.output = output or matrix.output
+        if not matrix.flow or not matrix.method:
+            raise ValueError("A matriz de jobs precisa de 'flow' e 'method'.")
+        if not self.output:
+            raise ValueError("A matriz de jobs precisa de um arquivo de saída ('output').")
+
+        self.workers = (
+            workers
+            or matrix.workers
+            or ConfigManager.get("BATCH_WORKERS", None, cast=int)
+            or os.cpu_count()
+            or 1
+        )
+        self.resume = resume
+        self.keep_parts = keep_parts
+        self.on_result = on_result
+        self.parts_dir = self.output + ".parts"
+        self.logger = setup_logger("batch_runner")
+
+    def part_path(self, job: dict) -> str:
+        return os.path.join(self.parts_dir, f"job-{job['id']}.jsonl")
+
+    # ------------------------------------------------------------------
+    # Execução
+    # ------------------------------------------------------------------
+    def run(self) -> Dict:
+        """
+        Executa os jobs pendentes, junta os parciais em ``output`` e
+        retorna o resumo: ``{"output", "rows", "done", "failed", "skipped",
+        "seconds", "results"}``.
+        """
+        jobs = self.matrix.jobs()
+        if not self.resume and os.path.isdir(self.parts_dir):
+            shutil.rmtree(self.parts_dir)
+        os.makedirs(self.parts_dir, exist_ok=True)
+
+        pending = [job for job in jobs if not os.path.exists(self.part_path(job))]
+        skipped = len(jobs) - len(pending)
+        workers = max(1, min(self.workers, len(pending)))
+        self.logger.info(
+            "Runner em lote: %s jobs (%s já concluídos), %s processos, %s.%s",
+            len(jobs), skipped, workers, self.matrix.flow, self.matrix.method,
+        )
+
+        start = time.perf_counter()
+        results = self._run_pending(pending, workers) if pending else []
+        failed = [r for r in results if r["status"] == "failed"]
+
+        rows = self.merge(jobs)
+        if not failed and not self.keep_parts:
+            shutil.rmtree(self.parts_dir, ignore_errors=True)
+
+        summary = {
+            "output": self.output,
+            "rows": rows,
+            "done": len(results) - len(failed),
+            "failed": len(failed),
+            "skipped": skipped,
+            "seconds": time.perf_counter() - start,
+            "results": sorted(results, key=lambda r: r["id"]),
+        }
+        self.logger.info(
+            "Runner em lote concluído em %.1fs: %s linhas em %s (%s ok, %s com erro, %s pulados)",
+            summary["seconds"], rows, self.output, summary["done"], summary["failed"], skipped,
+        )
+        if failed:
+            self.logger.warning(
+                "Jobs com erro (parciais mantidos em %s; use resume para rodar só estes): %s",
+                self.parts_dir, ", ".join(r["id"] for r in failed),
+            )
+        return summary
+
+    def _run_pending(self, pending: List[dict], workers: int) -> List[dict]:
+        matrix = self.matrix
+        executor = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(matrix.browser, matrix.browser_factory),
+        )
+        results = []
+        with executor:
+            futures = [
+                executor.submit(_run_job, matrix.flow, matrix.method, job, self.part_path(job), matrix.tag)
+                for job in pending
+            ]
+            for future in as_completed(futures):
+                result = future.result()
+                results.append(result)
+                self.logger.info(
+                    "[%s/%s] job %s %s: %s linhas em %.1fs (pid %s)",
+                    len(results), len(pending), result["id"], result["status"],
+                    result["rows"], result["seconds"], result["pid"],
+                )
+                if self.on_result:
+                    self.on_result(result)
+        return results
+
+    # ------------------------------------------------------------------
+    # Junção
+    # ------------------------------------------------------------------
+    def merge(self, jobs: List[dict]) -> int:
+        """Grava os parciais existentes, na ordem dos jobs, em ``output``."""
+        folder = os.path.dirname(self.output)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+
+        with open_sink(self.output) as sink:
+            for job in jobs:
+                part = self.part_path(job)
+                if not os.path.exists(part):
+                    continue
+                with open(part, "r", encoding="utf-8") as f:
+                    batch = []
+                    for line in f:
+                        batch.append(json.loads(line))
+                        if len(batch) >= MERGE_BATCH:
+                            sink.write_rows(batch)
+                            batch = []
+                    sink.write_rows(batch)
+            return sink.rows_written
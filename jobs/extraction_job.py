@@ -0,0 +1,191 @@
+"""
+ExtractionJob — exportação retomável, página a página
+-----------------------------------------------------
+Inclui:
+- Unidades de trabalho nomeadas (ex: uma categoria de protocolos), cada
+  uma produzindo páginas de linhas a partir de uma página inicial
+- Gravação incremental em um sink (CSV, JSONL ou Excel) logo após cada página
+- Progresso no ``JobStore``: ao rodar de novo, unidades concluídas são
+  puladas e a unidade interrompida recomeça da página seguinte à última gravada
+- Chave por linha: linhas já gravadas (ex: relidas após um reinício) são descartadas
+- Ao retomar, linhas gravadas no arquivo mas não registradas no JobStore
+  (queda entre a escrita e o registro da página) são removidas antes de
+  continuar: nenhuma linha duplicada nem perdida
+- Saída .xlsx: o openpyxl só grava no ``close()``, então as linhas vão para
+  um arquivo de apoio ``<saída>.rows.jsonl`` (durável a cada página) e o
+  .xlsx é gerado a partir dele no ``close()``
+
+Exemplo:
+    def paginas(browser, categoria, start_page):
+        UserHomePage(browser).acessar_categoria(categoria)
+        paginator = Paginator(browser, table=TABELA, page_locator=PAGINAS)
+        return paginator.iter_pages(start_page=start_page)
+
+    with ExtractionJob("protocolos", "protocolos.csv", key="Protocolo") as job:
+        for categoria in (0, 1, 2):
+            job.run_unit(f"categoria_{categoria}", lambda start: paginas(browser, categoria, start))
+"""
+
+import os
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Union
+
+from jobs.job_store import JobStore
+from sinks.row_sinks import RowSink, open_sink, read_rows
+from utils.logger import setup_logger
+
+RowKey = Union[str, Sequence[str], Callable[[Dict], str]]
+
+
+class ExtractionJob:
+    def __init__(
+        self,
+        name: str,
+        output: str,
+        key: RowKey,
+        store: Optional[JobStore] = None,
+        **sink_kwargs,
+    ):
+        """
+        ``output``: arquivo de saída (extensão define o sink, ver ``open_sink``).
+        ``key``: coluna, lista de colunas ou função que identifica uma linha.
+        ``store``: JobStore compartilhado (padrão: JOB_STORE_PATH).
+        """
+        self.name = name
+        self.output = output
+        self.key_of = self._key_function(key)
+        self.store = store or JobStore()
+        self._own_store = store is None
+        self.sink_kwargs = sink_kwargs
+        self.logger = setup_logger("extraction_job")
+        self._sink: Optional[RowSink] = None
+
+        # Excel só chega ao disco no close(): grava-se um JSONL de apoio
+        self._excel = os.path.splitext(output)[1].lower() == ".xlsx"
+        self.rows_path = output + ".rows.jsonl" if self._excel else output
+
+    @staticmethod
+    def _key_function(key: RowKey) -> Callable[[Dict], str]:
+        if callable(key):
+            return lambda row: str(key(row))
+        if isinstance(key, str):
+            return lambda row: str(row.get(key))
+        return lambda row: "|".join(str(row.get(col)) for col in key)
+
+    def _row_sink_kwargs(self) -> dict:
+        return {} if self._excel else self.sink_kwargs
+
+    def _open_sink(self) -> RowSink:
+        if self._sink is None:
+            # Com progresso salvo, continua o arquivo existente; senão recomeça
+            resuming = self.store.has_progress(self.name) and os.path.exists(self.rows_path)
+            if resuming:
+                self._discard_unrecorded_rows()
+            mode = "a" if resuming else "w"
+            self._sink = open_sink(self.rows_path, mode=mode, **self._row_sink_kwargs())
+        return self._sink
+
+    def _discard_unrecorded_rows(self):
+        """
+        As linhas vão para o arquivo antes de a página ser registrada no
+        JobStore; uma queda entre os dois deixa no arquivo linhas que a
+        retomada vai gravar de novo. Elas são removidas aqui.
+        """
+        kwargs = self._row_sink_kwargs()
+        rows, seen = [], set()
+        for row in read_rows(self.rows_path, **kwargs):
+            key = self.key_of(row)
+            if key not in seen:
+                seen.add(key)
+                rows.append(row)
+        known = self.store.known_keys(self.name, seen)
+        kept = [row for row in rows if self.key_of(row) in known]
+        if len(kept) == len(rows) and len(seen) == len(rows):
+            return
+
+        self.logger.warning(
+            "%s: %s linhas não registradas no progresso removidas de %s",
+            self.name, len(rows) - len(kept), self.rows_path,
+        )
+        with open_sink(self.rows_path, mode="w", **kwargs) as sink:
+            sink.write_rows(kept)
+
+    # ------------------------------------------------------------------
+    # Execução
+    # ------------------------------------------------------------------
+    def run_unit(self, unit: str, pages: Callable[[int], Iterator[List[Dict]]]) -> int:
+        """
+        Executa a unidade ``unit``. ``pages(start_page)`` deve gerar as
+        linhas de cada página a partir de ``start_page`` (ex:
+        ``Paginator.iter_pages``). Retorna quantas linhas novas foram gravadas.
+        """
+        state = self.store.unit(self.name, unit)
+        if state and state["status"] == "done":
+            self.logger.info("Unidade '%s' já concluída (%s linhas), pulando.", unit, state["rows"])
+            return 0
+
+        start_page = state["next_page"] if state else 1
+        if start_page > 1:
+            self.logger.info("Retomando unidade '%s' na página %s", unit, start_page)
+
+        sink = self._open_sink()
+        written = 0
+        page = start_page
+        for rows in pages(start_page):
+            written += self._write_page(sink, unit, page, rows)
+            page += 1
+
+        self.store.mark_done(self.name, unit)
+        self.logger.info("Unidade '%s' concluída: %s linhas novas", unit, written)
+        return written
+
+    def _write_page(self, sink: RowSink, unit: str, page: int, rows: List[Dict]) -> int:
+        keyed = {}
+        for row in rows:
+            keyed.setdefault(self.key_of(row), row)
+        known = self.store.known_keys(self.name, keyed)
+        new_keys = [key for key in keyed if key not in known]
+
+        if len(new_keys) < len(rows):
+            self.logger.debug(
+                "Página %s de '%s': %s linhas repetidas descartadas", page, unit, len(rows) - len(new_keys)
+            )
+        sink.write_rows(keyed[key] for key in new_keys)
+        self.store.record_page(self.name, unit, page, new_keys)
+        return len(new_keys)
+
+    def progress(self) -> List[dict]:
+        """Estado de cada unidade do job."""
+        return self.store.units(self.name)
+
+    def reset(self):
+        """Descarta o progresso: a próxima execução recomeça o arquivo do zero."""
+        self.store.reset(self.name)
+        if self._excel and os.path.exists(self.rows_path):
+            os.remove(self.rows_path)
+
+    def close(self):
+        wrote = self._sink is not None
+        if wrote:
+            self._sink.close()
+            self._sink = None
+        if self._excel and os.path.exists(self.rows_path) and (wrote or not os.path.exists(self.output)):
+            self._write_excel()
+        if self._own_store:
+            self.store.close()
+
+    def _write_excel(self):
+        """Gera o .xlsx a partir do JSONL de apoio (mantido para retomadas)."""
+        with open_sink(self.output, mode="w", **self.sink_kwargs) as sink:
+            batch = []
+            for row in read_rows(self.rows_path):
+                batch.append(row)
+                if len(batch) >= 1000:
+                    sink.write_rows(batch)
+                    batch = []
+            sink.write_rows(batch)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
@@ -0,0 +1,182 @@
+"""
+JobMatrix — matriz de jobs do runner em lote
+--------------------------------------------
+Inclui:
+- Leitura de YAML (fluxo, método, saída, eixos e parâmetros fixos) ou de
+  Excel (uma aba por eixo, uma linha por valor)
+- Produto cartesiano dos eixos (ex: categorias × credenciais × períodos):
+  valores dict são mesclados nos parâmetros do job, valores simples viram
+  ``{eixo: valor}``
+- ``${VAR}`` em valores de texto é lido do ambiente/.env (ConfigManager),
+  para as senhas não ficarem no arquivo da matriz; os jobs guardam o texto
+  original e ``resolve_env`` o substitui só na execução (``--dry-run`` não
+  precisa das variáveis)
+- Datas normalizadas como texto ISO (YYYY-MM-DD)
+
+Exemplo (YAML):
+    flow: flows.consultar_protocolos_flow.ConsultarProtocolosFlow
+    method: extrair_protocolos
+    output: resultados/protocolos.csv
+    tag: [categoria, username]
+    matrix:
+      categoria: [0, 1, 2]
+      credencial:
+        - {username: fiscal01, password: "${SENHA_FISCAL01}"}
+      periodo:
+        - {data_inicio: 2025-01-01, data_fim: 2025-06-30}
+
+    matrix = JobMatrix.load("examples/jobs_protocolos.yaml")
+    for job in matrix.jobs():
+        print(job["id"], job["label"])
+"""
+
+import itertools
+import math
+import os
+import re
+from datetime import date, datetime
+from typing import Dict, List, Optional
+
+import yaml
+
+from core.config_manager import ConfigManager
+
+ENV_VAR = re.compile(r"\$\{(\w+)\}")
+
+# Parâmetros que não entram no rótulo do job (logs, resumo)
+SECRET_PARAMS = ("password", "senha")
+
+
+def _plain(value):
+    """Datas em ISO, NaN/NaT do pandas como None."""
+    if isinstance(value, datetime):
+        return value.date().isoformat() if value.time() == datetime.min.time() else value.isoformat()
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, float) and math.isnan(value):
+        return None
+    if hasattr(value, "item") and not isinstance(value, (str, bytes)):
+        return _plain(value.item())  # escalares numpy
+    return value
+
+
+def resolve_env(params: dict) -> dict:
+    """Cópia de ``params`` com ``${VAR}`` substituído pelo ambiente/.env."""
+    return {k: ENV_VAR.sub(_env, v) if isinstance(v, str) else v for k, v in params.items()}
+
+
+def _env(match) -> str:
+    value = ConfigManager.get(match.group(1))
+    if value is None:
+        raise ValueError(f"Variável '{match.group(1)}' usada na matriz de jobs não está definida.")
+    return str(value)
+
+
+class JobMatrix:
+    def __init__(
+        self,
+        axes: Dict[str, list],
+        params: Optional[dict] = None,
+        flow: str = None,
+        method: str = None,
+        output: str = None,
+        tag: Optional[List[str]] = None,
+        browser: Optional[dict] = None,
+        browser_factory: str = None,
+        workers: int = None,
+    ):
+        """
+        ``axes``: ``{eixo: [valores]}``; ``params``: parâmetros comuns a
+        todos os jobs. ``flow`` é o caminho da classe (``pacote.modulo.Classe``)
+        e ``method`` o método chamado com os parâmetros do job. ``tag``:
+        parâmetros copiados como colunas em cada linha do resultado.
+        ``browser``: kwargs do Browser de cada processo (ou
+        ``browser_factory``, caminho de uma função que cria o Browser).
+        """
+        self.axes = {name: list(values) for name, values in axes.items()}
+        self.params = params or {}
+        self.flow = flow
+        self.method = method
+        self.output = output
+        self.tag = list(tag or [])
+        self.browser = browser or {}
+        self.browser_factory = browser_factory
+        self.workers = workers
+
+        for name, values in self.axes.items():
+            if not values:
+                raise ValueError(f"Eixo '{name}' da matriz de jobs está vazio.")
+
+    # ------------------------------------------------------------------
+    # Leitura
+    # ------------------------------------------------------------------
+    @classmethod
+    def load(cls, path: str) -> "JobMatrix":
+        """Escolhe o formato pela extensão (.yaml/.yml ou .xlsx)."""
+        ext = os.path.splitext(path)[1].lower()
+        if ext in (".yaml", ".yml"):
+            return cls.from_yaml(path)
+        if ext == ".xlsx":
+            return cls.from_excel(path)
+        raise ValueError(f"Extensão '{ext}' não suportada para a matriz de jobs. Use .yaml ou .xlsx.")
+
+    @classmethod
+    def from_yaml(cls, path: str) -> "JobMatrix":
+        with open(path, "r", encoding="utf-8") as f:
+            data = yaml.safe_load(f) or {}
+
+        axes = data.pop("matrix", None) or {}
+        unknown = set(data) - {"params", "flow", "method", "output", "tag", "browser", "browser_factory", "workers"}
+        if unknown:
+            raise ValueError(f"Chaves desconhecidas em {path}: {', '.join(sorted(unknown))}")
+        return cls(axes, **data)
+
+    @classmethod
+    def from_excel(cls, path: str, **kwargs) -> "JobMatrix":
+        """
+        Cada aba é um eixo (nome da aba). Uma aba com uma única coluna de
+        mesmo nome gera valores simples; as demais, um dict por linha.
+        Fluxo, método e saída vêm de ``kwargs`` (ou da linha de comando).
+        """
+        from excel.excel_manager import ExcelManager
+
+        axes = {}
+        for sheet, frame in ExcelManager.read(path, sheet_name=None).items():
+            frame = frame.dropna(how="all")
+            if list(frame.columns) == [sheet]:
+                axes[sheet] = frame[sheet].tolist()
+            else:
+                axes[sheet] = [
+                    {k: v for k, v in row.items() if _plain(v) is not None}
+                    for row in frame.to_dict("records")
+                ]
+        return cls(axes, **kwargs)
+
+    # ------------------------------------------------------------------
+    # Expansão
+    # ------------------------------------------------------------------
+    def jobs(self) -> List[dict]:
+        """
+        Jobs na ordem do produto dos eixos: ``{"id", "label", "params"}``.
+        O ``id`` (0001, 0002...) é estável enquanto a matriz não mudar.
+        """
+        names = list(self.axes)
+        jobs = []
+        for index, values in enumerate(itertools.product(*(self.axes[n] for n in names)), start=1):
+            params = {k: _plain(v) for k, v in self.params.items()}
+            for name, value in zip(names, values):
+                if isinstance(value, dict):
+                    params.update({k: _plain(v) for k, v in value.items()})
+                else:
+                    params[name] = _plain(value)
+            jobs.append({"id": f"{index:04d}", "label": self.label(params), "params": params})
+        return jobs
+
+    @staticmethod
+    def label(params: dict) -> str:
+        return " ".join(
+            f"{k}={v}" for k, v in params.items() if not any(s in k.lower() for s in SECRET_PARAMS)
+        )
+
+    def __len__(self) -> int:
+        return math.prod(len(values) for values in self.axes.values()) if self.axes else 1
@@ -0,0 +1,134 @@
+"""
+JobStore — progresso de jobs de extração em SQLite
+--------------------------------------------------
+Guarda, por job e unidade (ex: uma categoria):
+- status (pending/done), próxima página e total de linhas gravadas
+- chave da última linha gravada
+- chaves de todas as linhas já gravadas, para não duplicar ao retomar
+
+Cada página é registrada numa única transação, depois que as linhas foram
+enviadas ao destino.
+"""
+
+import os
+import time
+import sqlite3
+from typing import Iterable, List, Optional
+
+from core.config_manager import ConfigManager
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS units (
+    job TEXT NOT NULL,
+    unit TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    next_page INTEGER NOT NULL DEFAULT 1,
+    rows INTEGER NOT NULL DEFAULT 0,
+    last_row_key TEXT,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (job, unit)
+);
+CREATE TABLE IF NOT EXISTS row_keys (
+    job TEXT NOT NULL,
+    key TEXT NOT NULL,
+    PRIMARY KEY (job, key)
+);
+"""
+
+# Limite de parâmetros por consulta "IN (...)"
+_CHUNK = 500
+
+
+class JobStore:
+    def __init__(self, path: str = None):
+        self.path = path or ConfigManager.get("JOB_STORE_PATH", ".jobs/jobs.sqlite")
+        folder = os.path.dirname(self.path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+
+        self._conn = sqlite3.connect(self.path)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+
+    # ------------------------------------------------------------------
+    # Unidades
+    # ------------------------------------------------------------------
+    def unit(self, job: str, unit: str) -> Optional[dict]:
+        row = self._conn.execute(
+            "SELECT * FROM units WHERE job = ? AND unit = ?", (job, unit)
+        ).fetchone()
+        return dict(row) if row else None
+
+    def units(self, job: str) -> List[dict]:
+        rows = self._conn.execute("SELECT * FROM units WHERE job = ? ORDER BY unit", (job,))
+        return [dict(row) for row in rows]
+
+    def has_progress(self, job: str) -> bool:
+        return self._conn.execute("SELECT 1 FROM units WHERE job = ? LIMIT 1", (job,)).fetchone() is not None
+
+    def record_page(self, job: str, unit: str, page: int, keys: List[str]):
+        """Registra a página ``page`` da unidade e as chaves das linhas gravadas."""
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO row_keys (job, key) VALUES (?, ?)",
+                [(job, key) for key in keys],
+            )
+            self._conn.execute(
+                """
+                INSERT INTO units (job, unit, next_page, rows, last_row_key, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT (job, unit) DO UPDATE SET
+                    next_page = excluded.next_page,
+                    rows = units.rows + excluded.rows,
+                    last_row_key = COALESCE(excluded.last_row_key, units.last_row_key),
+                    updated_at = excluded.updated_at
+                """,
+                (job, unit, page + 1, len(keys), keys[-1] if keys else None, time.time()),
+            )
+
+    def mark_done(self, job: str, unit: str):
+        with self._conn:
+            self._conn.execute(
+                """
+                INSERT INTO units (job, unit, status, updated_at) VALUES (?, ?, 'done', ?)
+                ON CONFLICT (job, unit) DO UPDATE SET status = 'done', updated_at = excluded.updated_at
+                """,
+                (job, unit, time.time()),
+            )
+
+    # ------------------------------------------------------------------
+    # Chaves de linhas
+    # ------------------------------------------------------------------
+    def known_keys(self, job: str, keys: Iterable[str]) -> set:
+        """Subconjunto de ``keys`` já gravado no job."""
+        keys = list(keys)
+        known = set()
+        for i in range(0, len(keys), _CHUNK):
+            chunk = keys[i:i + _CHUNK]
+            placeholders = ",".join("?" * len(chunk))
+            rows = self._conn.execute(
+                f"SELECT key FROM row_keys WHERE job = ? AND key IN ({placeholders})",
+                (job, *chunk),
+            )
+            known.update(row[0] for row in rows)
+        return known
+
+    # ------------------------------------------------------------------
+    # Manutenção
+    # ------------------------------------------------------------------
+    def reset(self, job: str):
+        """Apaga o progresso e as chaves do job."""
+        with self._conn:
+            self._conn.execute("DELETE FROM units WHERE job = ?", (job,))
+            self._conn.execute("DELETE FROM row_keys WHERE job = ?", (job,))
+
+    def close(self):
+        self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
@@ -1,5 +1,6 @@
 from selenium.webdriver.common.by import By
 from core.base_page import BasePage
+from utils.decorators import time_it
 
 class LoginPage(BasePage):
     """Page Object da página de login do SITAC."""
@@ -25,17 +26,20 @@ class LoginPage(BasePage):
         self.type(self.USERNAME, username)
 
     def fill_password(self, password: str):
-        self.type(self.PASSWORD, password)
+        self.type(self.PASSWORD, password, secret=True)
 
     def submit(self):
         self.click(self.LOGIN_BTN)
 
+    @time_it(kind="step", keyed=False)
     def login(self, username: str, password: str):
         """
         Ação de login completa.
         """
-        self.fill_username(username)
-        self.fill_password(password)
+        self.fill_form({
+            self.USERNAME: username,
+            self.PASSWORD: password,
+        }, secrets=[self.PASSWORD])
         self.submit()
 
     # ---------------------------
@@ -46,8 +50,4 @@ class LoginPage(BasePage):
         Verifica se o login foi bem-sucedido.
         Consideramos que o avatar aparece após login.
         """
-        try:
-            self.wait_for(self.WELCOME_AVATAR, timeout=timeout)
-            return True
-        except:
-            return False
+        return self.is_element_present(self.WELCOME_AVATAR, timeout=timeout)
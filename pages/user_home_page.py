@@ -1,5 +1,6 @@
 from selenium.webdriver.common.by import By
 from core.base_page import BasePage
+from utils.decorators import time_it
 
 class UserHomePage(BasePage):
     """
@@ -28,16 +29,25 @@ class UserHomePage(BasePage):
     # Ações de navegação
     # -----------------------------------
 
+    # Cada menu dispara uma carga AJAX; esperar a página ficar ociosa
+    # substitui os time.sleep fixos entre os cliques.
+
+    @time_it(kind="step")
     def abrir_protocolos(self):
         self.click(self.MENU_PROTOCOLOS)
+        self.wait_until_idle()
 
+    @time_it(kind="step")
     def abrir_protocolos_a_receber(self):
         self.click(self.MENU_PROTOCOLO_A_RECEBER)
+        self.wait_until_idle()
 
+    @time_it(kind="step")
     def abrir_categoria(self, numero: int):
         if numero not in self.CATEGORIAS:
             raise ValueError(f"Setor '{numero}' não é válido. Use 0, 1 ou 2.")
         self.click(self.CATEGORIAS[numero])
+        self.wait_until_idle()
 
     # -------- Métodos semânticos --------
 
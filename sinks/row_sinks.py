@@ -0,0 +1,143 @@
+"""Destinos incrementais de linhas (Excel, CSV, JSONL) para extrações paginadas."""
+import os
+import csv
+import json
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from excel.excel_stream_writer import ExcelStreamWriter
+
+
+class RowSink:
+    """
+    Interface comum: ``write_rows`` recebe um lote de dicts e grava na hora;
+    ``close`` finaliza o arquivo. Use como context manager.
+    """
+
+    def __init__(self, path: str, mode: str = 'w'):
+        if mode not in ('w', 'a'):
+            raise ValueError(f"Modo '{mode}' inválido. Use 'w' ou 'a'.")
+        self.path = path
+        self.mode = mode
+        self.rows_written = 0
+
+    def write_rows(self, rows: Iterable[Dict]) -> int:
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+class ExcelSink(RowSink):
+    def __init__(self, path: str, mode: str = 'w', sheet_name: str = 'Sheet1', columns: Optional[List[str]] = None):
+        super().__init__(path, mode)
+        self._writer = ExcelStreamWriter(path, sheet_name=sheet_name, columns=columns, mode=mode)
+
+    def write_rows(self, rows: Iterable[Dict]) -> int:
+        count = self._writer.write_rows(rows)
+        self.rows_written += count
+        return count
+
+    def close(self):
+        self._writer.close()
+
+
+class CsvSink(RowSink):
+    """CSV com cabeçalho das chaves da primeira linha; em modo 'a' reaproveita o existente."""
+
+    def __init__(self, path: str, mode: str = 'w', columns: Optional[List[str]] = None, delimiter: str = ';'):
+        super().__init__(path, mode)
+        self.columns = list(columns) if columns else None
+        self.delimiter = delimiter
+
+        if mode == 'a' and os.path.exists(path) and os.path.getsize(path) > 0:
+            with open(path, 'r', encoding='utf-8-sig', newline='') as f:
+                self.columns = next(csv.reader(f, delimiter=delimiter))
+            self._header_written = True
+        else:
+            self._header_written = False
+
+        self._file = open(path, mode, encoding='utf-8-sig' if mode == 'w' else 'utf-8', newline='')
+        self._writer = None
+
+    def write_rows(self, rows: Iterable[Dict]) -> int:
+        count = 0
+        for row in rows:
+            if self._writer is None:
+                self.columns = self.columns or list(row.keys())
+                self._writer = csv.DictWriter(
+                    self._file, fieldnames=self.columns, delimiter=self.delimiter, extrasaction='ignore'
+                )
+                if not self._header_written:
+                    self._writer.writeheader()
+                    self._header_written = True
+            self._writer.writerow(row)
+            count += 1
+        self._file.flush()
+        self.rows_written += count
+        return count
+
+    def close(self):
+        if not self._file.closed:
+            self._file.close()
+
+
+class JsonlSink(RowSink):
+    """Uma linha JSON por registro."""
+
+    def __init__(self, path: str, mode: str = 'w'):
+        super().__init__(path, mode)
+        self._file = open(path, mode, encoding='utf-8')
+
+    def write_rows(self, rows: Iterable[Dict]) -> int:
+        count = 0
+        for row in rows:
+            self._file.write(json.dumps(row, ensure_ascii=False) + '\n')
+            count += 1
+        self._file.flush()
+        self.rows_written += count
+        return count
+
+    def close(self):
+        if not self._file.closed:
+            self._file.close()
+
+
+SINKS = {
+    '.xlsx': ExcelSink,
+    '.csv': CsvSink,
+    '.jsonl': JsonlSink,
+}
+
+
+def open_sink(path: str, mode: str = 'w', **kwargs) -> RowSink:
+    """Escolhe o sink pela extensão do arquivo (.xlsx, .csv, .jsonl)."""
+    ext = os.path.splitext(path)[1].lower()
+    if ext not in SINKS:
+        raise ValueError(f"Extensão '{ext}' não suportada. Use {', '.join(SINKS)}.")
+    return SINKS[ext](path, mode=mode, **kwargs)
+
+
+def read_rows(path: str, delimiter: str = ';', **_) -> Iterator[Dict]:
+    """Lê de volta as linhas de um arquivo .csv ou .jsonl gravado por um sink."""
+    ext = os.path.splitext(path)[1].lower()
+    if ext == '.csv':
+        with open(path, 'r', encoding='utf-8-sig', newline='') as f:
+            yield from csv.DictReader(f, delimiter=delimiter)
+    elif ext == '.jsonl':
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    # linha truncada por uma queda no meio da escrita
+                    continue
+    else:
+        raise ValueError(f"Extensão '{ext}' não suportada para leitura. Use .csv ou .jsonl.")
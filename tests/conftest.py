@@ -0,0 +1,61 @@
+import os
+import shutil
+import sys
+
+sys.path.insert(
+    0, os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+)
+
+import pytest
+
+from benchmarks.sitac_server import LOGIN_PATH, SitacServer
+from core.browser_manager import Browser
+from core.driver_backends import FakeBackend
+from pages.login_page import LoginPage
+from utils import error_handler
+
+BASE_URL = "http://sitac.local"
+ROWS = 120
+PAGE_SIZE = 50
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "browser: abre um navegador real (pulado sem Chrome na máquina)")
+
+
+@pytest.fixture(autouse=True)
+def evidence_dir(tmp_path, monkeypatch):
+    """Evidências de falha gravadas em uma pasta temporária por teste."""
+    folder = tmp_path / "evidencias"
+    monkeypatch.setattr(error_handler, "_writer", error_handler.EvidenceWriter(folder=str(folder)))
+    return folder
+
+
+@pytest.fixture
+def sitac(monkeypatch):
+    """Réplica do SITAC só em memória (a porta HTTP é liberada na hora)."""
+    server = SitacServer(rows=ROWS, page_size=PAGE_SIZE)
+    server.httpd.server_close()
+    monkeypatch.setattr(LoginPage, "URL", BASE_URL + LOGIN_PATH + "#!")
+    return server
+
+
+@pytest.fixture
+def browser(sitac):
+    """Browser sobre o FakeDriver da réplica, sem navegador."""
+    nav = Browser(backend=FakeBackend(sitac.fake_driver(BASE_URL)), log_level="WARNING")
+    yield nav
+    nav.quit()
+
+
+@pytest.fixture
+def chrome():
+    """Chrome headless real, para o que o FakeDriver não executa (JavaScript)."""
+    if not any(shutil.which(name) for name in ("google-chrome", "google-chrome-stable", "chromium", "chromium-browser")):
+        pytest.skip("Chrome não encontrado")
+    try:
+        nav = Browser(browser="chrome", headless=True, log_level="WARNING")
+    except Exception as e:
+        pytest.skip(f"Chrome indisponível: {e}")
+    yield nav
+    nav.quit()
@@ -0,0 +1,80 @@
+import asyncio
+import pathlib
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from selenium.common.exceptions import TimeoutException
+
+from core import async_browser
+from core.async_browser import AsyncBrowser
+from core.browser_manager import Browser
+from core.driver_backends import FakeBackend
+
+FIXTURE = pathlib.Path(__file__).resolve().parent.parent / "examples" / "fixtures" / "tabela_protocolos.html"
+URL = FIXTURE.as_uri()
+ESPERA = 0.6
+
+
+@pytest.fixture
+def single_thread(monkeypatch):
+    """Uma única thread no executor: uma espera que a prendesse travaria a outra sessão."""
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="async-browser")
+    monkeypatch.setattr(async_browser, "_executor", executor)
+    yield executor
+    executor.shutdown(wait=True)
+
+
+@pytest.fixture
+def sessoes():
+    """Duas sessões independentes sobre a tabela de exemplo."""
+    navs = [
+        Browser(backend=FakeBackend(pages={URL: FIXTURE.read_text(encoding="utf-8")}), log_level="WARNING")
+        for _ in range(2)
+    ]
+    yield [AsyncBrowser(nav) for nav in navs]
+    for nav in navs:
+        nav.quit()
+
+
+def test_waits_do_not_block_each_other(sessoes, single_thread):
+    lenta, rapida = sessoes
+
+    async def esperar_o_que_nao_vem():
+        await lenta.go_to(URL)
+        with pytest.raises(TimeoutException):
+            await lenta.wait_for("#nunca-aparece", timeout=ESPERA)
+        return time.perf_counter()
+
+    async def extrair():
+        await rapida.go_to(URL)
+        await rapida.wait_for(".display")
+        rows = await rapida.extract_table(".display")
+        return rows, time.perf_counter()
+
+    async def main():
+        return await asyncio.gather(esperar_o_que_nao_vem(), extrair())
+
+    inicio = time.perf_counter()
+    fim_lenta, (rows, fim_rapida) = asyncio.run(main())
+
+    assert rows
+    assert rows[0]["Protocolo"].startswith("2144001")
+    # a extração terminou enquanto a outra sessão ainda esperava
+    assert fim_rapida < fim_lenta
+    assert fim_rapida - inicio < ESPERA
+
+
+def test_concurrent_waits_overlap(sessoes, single_thread):
+    async def esperar(sessao):
+        with pytest.raises(TimeoutException):
+            await sessao.wait_for("#nunca-aparece", timeout=ESPERA)
+
+    async def main():
+        await asyncio.gather(*(esperar(s) for s in sessoes))
+
+    inicio = time.perf_counter()
+    asyncio.run(main())
+
+    # em série seriam 2 * ESPERA
+    assert time.perf_counter() - inicio < 1.5 * ESPERA
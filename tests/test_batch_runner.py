@@ -0,0 +1,58 @@
+import pytest
+
+from jobs import batch_runner
+from pages.login_page import LoginPage
+
+from conftest import ROWS
+
+FLOW = "flows.consultar_protocolos_flow.ConsultarProtocolosFlow"
+
+
+@pytest.fixture
+def logins(monkeypatch):
+    """Usuários de cada login completo feito pelo fluxo."""
+    monkeypatch.setattr(batch_runner, "_flow", None)
+    feitos = []
+    original = LoginPage.login
+
+    def login(self, username, password):
+        feitos.append(username)
+        return original(self, username, password)
+
+    monkeypatch.setattr(LoginPage, "login", login)
+    return feitos
+
+
+def _job(browser, username, categoria):
+    params = {"username": username, "password": "senha123", "categoria": categoria}
+    return batch_runner._execute(browser, FLOW, "extrair_protocolos", params)
+
+
+def test_same_credentials_reuse_the_flow(browser, logins):
+    assert len(_job(browser, "fiscal01", 0)) == ROWS
+    assert len(_job(browser, "fiscal01", 1)) == ROWS
+
+    assert logins == ["fiscal01"]
+
+
+def test_another_user_clears_the_session(browser, logins, monkeypatch):
+    limpezas = []
+    clear_session = browser.clear_session
+    monkeypatch.setattr(browser, "clear_session", lambda: (limpezas.append(1), clear_session()))
+
+    _job(browser, "fiscal01", 0)
+    fluxo = batch_runner._flow[2]
+    _job(browser, "fiscal02", 0)
+
+    assert logins == ["fiscal01", "fiscal02"]
+    assert len(limpezas) == 2
+    assert batch_runner._flow[2] is not fluxo
+
+
+def test_failed_job_discards_the_flow(browser, logins):
+    with pytest.raises(ValueError):
+        _job(browser, "fiscal01", 9)
+
+    assert batch_runner._flow is None
+    _job(browser, "fiscal01", 0)
+    assert logins == ["fiscal01"]
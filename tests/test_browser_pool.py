@@ -0,0 +1,47 @@
+import itertools
+
+import pytest
+
+from core.browser_manager import Browser
+from core.browser_pool import BrowserPool
+from core.driver_backends import FakeBackend
+
+
+class _FakeBrowser:
+    def __init__(self, log):
+        self.log = log
+
+    def quit(self):
+        self.log.append("quit")
+
+
+def test_pool_quits_started_browsers_when_a_launch_fails():
+    log, launches = [], itertools.count(1)
+
+    def factory():
+        if next(launches) == 2:
+            raise RuntimeError("driver não subiu")
+        return _FakeBrowser(log)
+
+    with pytest.raises(RuntimeError):
+        BrowserPool(size=3, browser_factory=factory)
+
+    assert next(launches) == 4
+    assert log == ["quit", "quit"]
+
+
+def test_map_keeps_input_order_and_recycles_browsers():
+    numeros = itertools.count(1)
+
+    def factory():
+        browser = Browser(backend=FakeBackend(), log_level="WARNING")
+        browser.numero = next(numeros)
+        return browser
+
+    with BrowserPool(size=2, max_jobs_per_browser=3, browser_factory=factory) as pool:
+        resultados = pool.map(lambda browser, item: (item, browser.numero), range(8))
+        usados = {numero for _, numero in resultados}
+
+    assert [item for item, _ in resultados] == list(range(8))
+    # 8 jobs, no máximo 3 por navegador: ao menos 3 navegadores diferentes
+    assert len(usados) >= 3
@@ -0,0 +1,55 @@
+import pytest
+
+from core.browser_manager import Browser
+from core.command_replay import ReplayMismatchError, read_recording, summarize
+from core.driver_backends import FakeBackend, ReplayBackend
+from flows.consultar_protocolos_flow import ConsultarProtocolosFlow
+
+SENHA = "senha-gravada-123"
+
+
+def _extrair(nav: Browser):
+    return ConsultarProtocolosFlow(nav).extrair_protocolos("fiscal01", SENHA, 1)
+
+
+@pytest.fixture
+def gravacao(sitac, tmp_path):
+    """Gravação da extração da categoria 1 sobre o FakeDriver."""
+    path = str(tmp_path / "extracao.jsonl.gz")
+    nav = Browser(backend=FakeBackend(sitac.fake_driver()), record=path, log_level="WARNING")
+    try:
+        rows = _extrair(nav)
+    finally:
+        nav.quit()
+    return path, rows
+
+
+def test_recording_redacts_password(gravacao):
+    path, rows = gravacao
+    header, records = read_recording(path)
+
+    assert len(rows) == 120
+    assert records and summarize(path)["get"]["count"] >= 1
+    assert SENHA not in str(records)
+
+
+def test_replay_reproduces_the_flow(gravacao):
+    path, rows = gravacao
+
+    nav = Browser(backend=ReplayBackend(path, strict=True), log_level="WARNING")
+    try:
+        assert _extrair(nav) == rows
+        assert nav.driver.connection.divergences == []
+    finally:
+        nav.quit()
+
+
+def test_strict_replay_rejects_a_different_path(gravacao):
+    path, _ = gravacao
+
+    nav = Browser(backend=ReplayBackend(path, strict=True), log_level="WARNING")
+    try:
+        with pytest.raises(ReplayMismatchError):
+            ConsultarProtocolosFlow(nav).extrair_protocolos("fiscal01", SENHA, 2)
+    finally:
+        nav.quit()
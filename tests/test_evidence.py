@@ -0,0 +1,27 @@
+import pytest
+from selenium.common.exceptions import TimeoutException
+
+from pages.login_page import LoginPage
+from utils.error_handler import flush_evidence
+
+
+def test_failure_captures_evidence_once(browser, evidence_dir):
+    browser.go_to(LoginPage.URL)
+
+    with pytest.raises(TimeoutException):
+        browser.click("#nao-existe", timeout=0.2)
+    flush_evidence()
+
+    files = sorted(path.name for path in evidence_dir.iterdir())
+    # click → wait_for: só a chamada mais externa captura
+    assert len(files) == 2
+    assert files[0].endswith("_click.html.gz")
+    assert files[1].endswith("_click.png")
+
+
+def test_success_captures_nothing(browser, evidence_dir):
+    browser.go_to(LoginPage.URL)
+    browser.wait_for("#username")
+    flush_evidence()
+
+    assert not evidence_dir.exists()
@@ -0,0 +1,75 @@
+import pathlib
+
+import pytest
+
+from benchmarks.sitac_server import COLUNAS
+from core.browser_manager import Browser
+from core.driver_backends import FakeBackend
+from flows.consultar_protocolos_flow import ConsultarProtocolosFlow
+
+from conftest import PAGE_SIZE
+
+FIXTURE = pathlib.Path(__file__).resolve().parent.parent / "examples" / "fixtures" / "tabela_protocolos.html"
+
+
+# ----------------------------------------------------------------------
+# FakeDriver: o EXTRACT_TABLE_JS é respondido em Python (html_dom), então
+# estes testes cobrem o lado do Browser, não o JavaScript
+# ----------------------------------------------------------------------
+@pytest.fixture
+def categoria_0(browser):
+    flow = ConsultarProtocolosFlow(browser)
+    flow.login("fiscal01", "senha123")
+    flow.home_page.abrir_protocolos()
+    flow.home_page.abrir_protocolos_a_receber()
+    flow.home_page.abrir_categoria(0)
+    browser.wait_for(".display")
+    return browser
+
+
+@pytest.fixture
+def fixture_page():
+    url = FIXTURE.as_uri()
+    nav = Browser(
+        backend=FakeBackend(pages={url: FIXTURE.read_text(encoding="utf-8")}, start_url=url),
+        log_level="WARNING",
+    )
+    yield nav
+    nav.quit()
+
+
+def test_extract_table_bulk(categoria_0, sitac):
+    rows = categoria_0.extract_table(".display")
+
+    assert len(rows) == PAGE_SIZE
+    assert list(rows[0]) == list(COLUNAS)
+    assert rows[0] == sitac.row(0, 0)
+
+
+def test_extract_table_attributes(categoria_0):
+    rows = categoria_0.extract_table(".display", attributes=["href"])
+
+    numero = rows[0]["Protocolo"].split("/")[0]
+    assert rows[0]["Protocolo_href"].endswith(f"detalhe.php?id={numero}")
+
+
+def test_fake_bulk_matches_per_cell_on_fixture(fixture_page):
+    bulk = fixture_page.extract_table(".display")
+
+    assert bulk
+    assert bulk == fixture_page.extract_table(".display", bulk=False)
+
+
+# ----------------------------------------------------------------------
+# Navegador real: o EXTRACT_TABLE_JS que vai para produção
+# ----------------------------------------------------------------------
+@pytest.mark.browser
+def test_bulk_js_matches_per_cell_in_chrome(chrome):
+    chrome.go_to(FIXTURE.as_uri())
+
+    bulk = chrome.extract_table(".display")
+    assert bulk
+    assert bulk == chrome.extract_table(".display", bulk=False)
+
+    com_links = chrome.extract_table(".display", attributes=["href"])
+    assert com_links[0]["Protocolo_href"].endswith("detalhe.php?id=2144001")
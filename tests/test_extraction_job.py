@@ -0,0 +1,100 @@
+import pytest
+
+from jobs.extraction_job import ExtractionJob
+from jobs.job_store import JobStore
+from sinks.row_sinks import read_rows
+
+PAGES = 3
+PER_PAGE = 3
+
+
+class Queda(Exception):
+    pass
+
+
+def paginas(crash_at=None):
+    """``pages(start_page)`` de 3 páginas; ``crash_at`` interrompe antes dessa página."""
+    def gerar(start_page):
+        for page in range(start_page, PAGES + 1):
+            if page == crash_at:
+                raise Queda()
+            yield [{"id": f"{page}-{i}", "valor": i} for i in range(PER_PAGE)]
+    return gerar
+
+
+def ler(path: str):
+    if path.endswith(".xlsx"):
+        from openpyxl import load_workbook
+
+        sheet = load_workbook(path, read_only=True).active
+        values = list(sheet.iter_rows(values_only=True))
+        return [dict(zip(values[0], row)) for row in values[1:]]
+    return list(read_rows(path))
+
+
+@pytest.fixture
+def store_path(tmp_path):
+    return str(tmp_path / "progresso.sqlite")
+
+
+def test_completed_units_are_skipped(tmp_path, store_path):
+    output = str(tmp_path / "saida.csv")
+    with JobStore(store_path) as store:
+        with ExtractionJob("job", output, key="id", store=store) as job:
+            assert job.run_unit("u", paginas()) == PAGES * PER_PAGE
+        with ExtractionJob("job", output, key="id", store=store) as job:
+            assert job.run_unit("u", paginas()) == 0
+
+    assert len(ler(output)) == PAGES * PER_PAGE
+
+
+@pytest.mark.parametrize("ext", [".csv", ".jsonl", ".xlsx"])
+def test_resume_after_crash(tmp_path, store_path, ext):
+    output = str(tmp_path / f"saida{ext}")
+
+    # Queda na página 3, sem close() (processo morto)
+    store = JobStore(store_path)
+    job = ExtractionJob("job", output, key="id", store=store)
+    with pytest.raises(Queda):
+        job.run_unit("u", paginas(crash_at=3))
+    assert job.progress()[0]["next_page"] == 3
+    store.close()
+
+    with JobStore(store_path) as store:
+        with ExtractionJob("job", output, key="id", store=store) as job:
+            assert job.run_unit("u", paginas()) == PER_PAGE
+
+    ids = [row["id"] for row in ler(output)]
+    assert sorted(ids) == sorted(f"{p}-{i}" for p in range(1, PAGES + 1) for i in range(PER_PAGE))
+
+
+@pytest.mark.parametrize("ext", [".csv", ".jsonl"])
+def test_resume_drops_rows_written_but_not_recorded(tmp_path, store_path, ext):
+    output = str(tmp_path / f"saida{ext}")
+
+    store = JobStore(store_path)
+    job = ExtractionJob("job", output, key="id", store=store)
+    with pytest.raises(Queda):
+        job.run_unit("u", paginas(crash_at=3))
+    # Queda entre a escrita da página 3 e o registro no JobStore
+    job._sink.write_rows([{"id": "3-0", "valor": 0}])
+    store.close()
+
+    with JobStore(store_path) as store:
+        with ExtractionJob("job", output, key="id", store=store) as job:
+            job.run_unit("u", paginas())
+
+    ids = [row["id"] for row in ler(output)]
+    assert len(ids) == len(set(ids)) == PAGES * PER_PAGE
+
+
+def test_reset_starts_over(tmp_path, store_path):
+    output = str(tmp_path / "saida.xlsx")
+    with JobStore(store_path) as store:
+        with ExtractionJob("job", output, key="id", store=store) as job:
+            job.run_unit("u", paginas())
+            job.reset()
+        with ExtractionJob("job", output, key="id", store=store) as job:
+            assert job.run_unit("u", paginas()) == PAGES * PER_PAGE
+
+    assert len(ler(output)) == PAGES * PER_PAGE
@@ -0,0 +1,32 @@
+from urllib.parse import urljoin
+
+import pytest
+
+from flows.consultar_protocolos_flow import ConsultarProtocolosFlow
+
+
+@pytest.fixture
+def categoria_0(browser):
+    flow = ConsultarProtocolosFlow(browser)
+    flow.login("fiscal01", "senha123")
+    flow.home_page.abrir_protocolos()
+    flow.home_page.abrir_protocolos_a_receber()
+    flow.home_page.abrir_categoria(0)
+    browser.wait_for(".display")
+    return browser
+
+
+def test_fan_out_resolves_relative_hrefs(categoria_0):
+    rows = categoria_0.extract_table(".display", attributes=["href"])
+    hrefs = [row["Protocolo_href"] for row in rows[:7]]
+    base = categoria_0.driver.current_url
+    origin = categoria_0.driver.current_window_handle
+
+    visitas = categoria_0.fan_out_tabs(
+        hrefs, lambda nav, url: (url, nav.driver.current_url), max_tabs=3, timeout=2
+    )
+
+    assert all(not href.startswith("http") for href in hrefs)
+    assert visitas == [(href, urljoin(base, href)) for href in hrefs]
+    assert categoria_0.driver.window_handles == [origin]
+    assert categoria_0.driver.current_url == base
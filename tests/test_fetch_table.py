@@ -0,0 +1,56 @@
+import pytest
+
+from benchmarks.sitac_server import SESSION_COOKIE, SitacServer
+from core.browser_manager import Browser
+from core.driver_backends import FakeBackend
+
+
+# ----------------------------------------------------------------------
+# fetch_table (HTTP real contra a réplica em localhost)
+# ----------------------------------------------------------------------
+def _session_browser(server: SitacServer) -> Browser:
+    """Browser fake na origem da réplica, com o cookie de uma sessão logada."""
+    start = server.url("/")
+    nav = Browser(
+        backend=FakeBackend(pages={start: "<html><body></body></html>"}, start_url=start),
+        log_level="WARNING",
+    )
+    nav.driver.add_cookie({"name": SESSION_COOKIE, "value": server._new_session("fiscal01")})
+    return nav
+
+
+@pytest.mark.parametrize("host", ["127.0.0.1", "localhost"])
+def test_fetch_table_over_http(host):
+    with SitacServer(rows=120, page_size=50, host=host) as server:
+        nav = _session_browser(server)
+        try:
+            rows = nav.fetch_table(server.protocolos_url(1, 3), ".display", fallback=False)
+        finally:
+            nav.quit()
+
+    assert len(rows) == 20
+    assert rows[0] == server.row(1, 100)
+
+
+def test_fetch_table_empty_table_is_not_missing():
+    with SitacServer(rows=0, host="localhost") as server:
+        nav = _session_browser(server)
+        try:
+            rows = nav.fetch_table(server.protocolos_url(0), ".display")
+            url = nav.driver.current_url
+        finally:
+            nav.quit()
+
+    # tabela vazia é resultado válido: sem fallback para o navegador
+    assert rows == []
+    assert url == server.url("/")
+
+
+def test_fetch_table_missing_table_without_fallback():
+    with SitacServer(host="localhost") as server:
+        nav = _session_browser(server)
+        nav.driver.delete_all_cookies()
+        try:
+            assert nav.fetch_table(server.protocolos_url(0), ".display", fallback=False) == []
+        finally:
+            nav.quit()
@@ -0,0 +1,55 @@
+import pytest
+
+from core.browser_manager import Browser
+from core.driver_backends import FakeBackend
+from utils.logger import REDACTED, redact
+
+URL = "http://form.local/"
+FORM = """
+<form>
+  <input id="nome">
+  <input id="anexo" type="file">
+  <select id="uf"><option value="MA">MA</option><option value="PI">PI</option></select>
+  <input id="aceite" type="checkbox">
+  <input id="senha" type="password">
+</form>
+"""
+
+
+@pytest.fixture
+def form():
+    nav = Browser(backend=FakeBackend(pages={URL: FORM}, start_url=URL), log_level="WARNING")
+    yield nav
+    nav.quit()
+
+
+def value(nav, selector):
+    return nav.driver.find_element("css selector", selector).get_attribute("value")
+
+
+def test_fill_many_types_fields_the_js_path_cannot_fill(form):
+    form.fill_many({"#nome": "Maria", "#anexo": "/tmp/protocolo.pdf", "#uf": "PI", "#aceite": True})
+
+    assert value(form, "#nome") == "Maria"
+    assert value(form, "#anexo") == "/tmp/protocolo.pdf"
+    assert value(form, "#uf") == "PI"
+    assert form.driver.find_element("css selector", "#aceite").is_selected()
+
+
+def test_fill_many_keystrokes_fields_are_typed(form):
+    form.fill_many({"#nome": "Maria", "#senha": "123"}, keystrokes=["#senha"])
+
+    assert value(form, "#nome") == "Maria"
+    assert value(form, "#senha") == "123"
+
+
+@pytest.mark.parametrize("keystrokes", [(), ["#senha"]])
+def test_fill_many_secrets_are_redacted(form, caplog, keystrokes):
+    form.logger.setLevel("DEBUG")
+    with caplog.at_level("DEBUG", logger=form.logger.name):
+        form.fill_many({"#nome": "Maria", "#senha": "s3gr3d0-fill"}, keystrokes=keystrokes, secrets=["#senha"])
+
+    assert value(form, "#senha") == "s3gr3d0-fill"
+    assert "s3gr3d0-fill" not in caplog.text
+    # registrado antes do lote: qualquer mensagem posterior sai redigida
+    assert redact("senha s3gr3d0-fill") == f"senha {REDACTED}"
@@ -0,0 +1,152 @@
+import pytest
+
+from core.browser_manager import Browser
+from core.driver_backends import FakeBackend
+from core.flow_engine import RAN, SKIPPED_PREFIX, SKIPPED_STATE, FlowEngine, Step, StepGraph
+from flows.consultar_protocolos_flow import ConsultarProtocolosFlow
+from utils.command_counter import CommandCounter
+
+from conftest import ROWS
+
+
+# ----------------------------------------------------------------------
+# Grafo e planejamento
+# ----------------------------------------------------------------------
+def _grafo(calls, estado=None):
+    def step(name, requires=(), check=None):
+        return Step(name, lambda: calls.append(name) or name, requires=requires, check=check)
+
+    return StepGraph([
+        step("login"),
+        step("menu", requires=["login"], check=(lambda: estado.get("menu")) if estado is not None else None),
+        step("a", requires=["menu"]),
+        step("b", requires=["menu"]),
+        step("outro", requires=["login"]),
+    ])
+
+
+def test_path_and_cycle_detection():
+    grafo = _grafo([])
+    assert [step.name for step in grafo.path("a")] == ["login", "menu", "a"]
+
+    grafo.add(Step("x", lambda: None, requires=["y"]))
+    grafo.add(Step("y", lambda: None, requires=["x"]))
+    with pytest.raises(ValueError):
+        grafo.path("x")
+    with pytest.raises(KeyError):
+        grafo.path("inexistente")
+
+
+def test_plan_groups_common_prefixes():
+    grafo = _grafo([])
+    plano = grafo.plan(["a", "outro", "b"])
+    assert [path[-1].name for path in plano] == ["a", "b", "outro"]
+
+
+def test_prefix_runs_once():
+    calls = []
+    engine = FlowEngine(_grafo(calls))
+
+    resultados = engine.run(["b", "a"])
+
+    assert resultados == {"a": "a", "b": "b"}
+    assert calls == ["login", "menu", "b", "a"]
+    assert [(t["step"], t["status"]) for t in engine.timings[3:5]] == [("login", SKIPPED_PREFIX), ("menu", SKIPPED_PREFIX)]
+
+
+def test_check_skips_step_already_in_state():
+    calls = []
+    engine = FlowEngine(_grafo(calls, estado={"menu": True}))
+
+    engine.run(["a"])
+
+    assert calls == ["login", "a"]
+    assert engine.summary()["menu"]["skipped"] == 1
+
+
+def test_target_always_runs():
+    calls = []
+    engine = FlowEngine(_grafo(calls))
+    engine.run(["a"])
+    engine.run(["a"])
+
+    assert calls == ["login", "menu", "a", "a"]
+
+
+def test_failure_forgets_the_prefix():
+    calls = []
+    grafo = _grafo(calls)
+    engine = FlowEngine(grafo)
+    engine.run(["a"])
+
+    def quebra():
+        raise RuntimeError("b")
+
+    grafo.steps["b"].action = quebra
+    with pytest.raises(RuntimeError):
+        engine.run(["b"])
+    engine.run(["outro"])
+
+    # Estado da página desconhecido após a falha: o prefixo é refeito
+    assert calls == ["login", "menu", "a", "login", "outro"]
+    assert [t["status"] for t in engine.timings if t["target"] == "outro"] == [RAN, RAN]
+
+
+# ----------------------------------------------------------------------
+# ConsultarProtocolosFlow sobre o FakeDriver
+# ----------------------------------------------------------------------
+def test_flow_reuses_login_and_menus_across_calls(browser):
+    flow = ConsultarProtocolosFlow(browser)
+
+    assert len(flow.extrair_protocolos("fiscal01", "senha123", 0)) == ROWS
+    assert len(flow.extrair_protocolos("fiscal01", "senha123", 2)) == ROWS
+
+    status = [(t["step"], t["status"]) for t in flow.engine.timings]
+    assert status[5:8] == [("login", SKIPPED_STATE), ("protocolos", SKIPPED_STATE), ("a_receber", SKIPPED_STATE)]
+
+
+def test_flow_logs_in_again_for_another_user(browser):
+    flow = ConsultarProtocolosFlow(browser)
+    flow.extrair_protocolos("fiscal01", "senha123", 0)
+    flow.extrair_protocolos("fiscal02", "senha456", 1)
+
+    assert flow.engine.summary()["login"]["ran"] == 2
+
+
+def test_graph_sends_fewer_commands_than_chained_flows(sitac):
+    def comandos(extrair):
+        nav = Browser(backend=FakeBackend(sitac.fake_driver()), log_level="WARNING")
+        counter = CommandCounter(nav.driver)
+        try:
+            linhas = extrair(ConsultarProtocolosFlow(nav))
+        finally:
+            nav.quit()
+        return linhas, counter.total
+
+    def encadeado(flow):
+        linhas = 0
+        for metodo in ("executar_fluxo_despacho", "executar_fluxo_fiscalizacao", "executar_fluxo_pre_envio_camaras"):
+            getattr(flow, metodo)("fiscal01", "senha123")
+            linhas += len(flow._linhas())
+        return linhas
+
+    def grafo(flow):
+        resultados = flow.extrair_categorias("fiscal01", "senha123", categorias=(0, 1, 2))
+        assert flow.engine.summary()["login"]["ran"] == 1
+        return sum(len(linhas) for linhas in resultados.values())
+
+    linhas_encadeado, comandos_encadeado = comandos(encadeado)
+    linhas_grafo, comandos_grafo = comandos(grafo)
+
+    assert linhas_encadeado == linhas_grafo == 3 * ROWS
+    assert comandos_grafo < comandos_encadeado
+
+
+def test_date_filter(browser, sitac):
+    flow = ConsultarProtocolosFlow(browser)
+    linhas = flow.extrair_protocolos("fiscal01", "senha123", 1, "2025-02-01", "2025-03-31")
+
+    assert 0 < len(linhas) < ROWS
+    for linha in linhas:
+        dia, mes, ano = linha["Data"].split("/")
+        assert "2025-02-01" <= f"{ano}-{mes}-{dia}" <= "2025-03-31"
@@ -0,0 +1,39 @@
+import pytest
+
+from utils.html_dom import parse_html
+
+HTML = "<ul>" + "".join(f"<li>{n}</li>" for n in range(1, 11)) + "</ul>"
+
+
+@pytest.mark.parametrize("arg, expected", [
+    ("3", [3]),
+    ("odd", [1, 3, 5, 7, 9]),
+    ("even", [2, 4, 6, 8, 10]),
+    ("2n+1", [1, 3, 5, 7, 9]),
+    ("3n", [3, 6, 9]),
+    ("n+8", [8, 9, 10]),
+    ("-n+3", [1, 2, 3]),
+    (" 2n - 1 ", [1, 3, 5, 7, 9]),
+])
+def test_nth_child(arg, expected):
+    items = parse_html(HTML).select(f"li:nth-child({arg})")
+    assert [int(li.text) for li in items] == expected
+
+
+@pytest.mark.parametrize("arg", ["", "abc", "2x+1", "n+"])
+def test_nth_child_rejects_invalid_arguments(arg):
+    with pytest.raises(ValueError):
+        parse_html(HTML).select(f"li:nth-child({arg})")
+
+
+def test_sitac_paginator_locator():
+    html = (
+        '<div id="Paginator_ProtocolosSetorFilial2144"><label>'
+        '<a data-page="1">1</a><a data-page="2">2</a><a data-page="3">3</a>'
+        "</label></div>"
+    )
+    selector = "[id^='Paginator_ProtocolosSetorFilial'] > label:nth-child(1) > a:nth-child({page})"
+    document = parse_html(html)
+
+    assert [el.get("data-page") for el in document.select(selector.format(page=2))] == ["2"]
+    assert document.select(selector.format(page=4)) == []
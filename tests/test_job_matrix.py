@@ -0,0 +1,42 @@
+import pytest
+
+from core.config_manager import ConfigManager
+from jobs.job_matrix import JobMatrix, resolve_env
+
+
+@pytest.fixture
+def matrix():
+    return JobMatrix(
+        {
+            "categoria": [0, 1],
+            "credencial": [{"username": "fiscal01", "password": "${SENHA_TESTE_FISCAL01}"}],
+        },
+        params={"data_inicio": "2025-01-01"},
+        flow="flows.consultar_protocolos_flow.ConsultarProtocolosFlow",
+        method="extrair_protocolos",
+    )
+
+
+def test_jobs_expand_the_axes(matrix):
+    jobs = matrix.jobs()
+
+    assert len(matrix) == len(jobs) == 2
+    assert [job["id"] for job in jobs] == ["0001", "0002"]
+    assert jobs[1]["params"] == {
+        "data_inicio": "2025-01-01", "categoria": 1, "username": "fiscal01", "password": "${SENHA_TESTE_FISCAL01}",
+    }
+
+
+def test_label_hides_passwords(matrix):
+    assert matrix.jobs()[0]["label"] == "data_inicio=2025-01-01 categoria=0 username=fiscal01"
+
+
+def test_secrets_are_resolved_only_when_the_job_runs(matrix, monkeypatch):
+    params = matrix.jobs()[0]["params"]
+
+    with pytest.raises(ValueError):
+        resolve_env(params)
+
+    monkeypatch.setitem(ConfigManager.load(), "SENHA_TESTE_FISCAL01", "s3nha")
+    assert resolve_env(params)["password"] == "s3nha"
+    assert params["password"] == "${SENHA_TESTE_FISCAL01}"
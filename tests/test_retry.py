@@ -0,0 +1,58 @@
+import time
+
+import pytest
+
+from utils.decorators import remaining_budget, retry_on_fail
+
+
+class Falha(Exception):
+    pass
+
+
+def test_retry_stops_when_budget_runs_out():
+    calls = []
+
+    @retry_on_fail(retries=50, delay=0.05, backoff=1.0, jitter=0, budget=0.2)
+    def sempre_falha():
+        calls.append(time.monotonic())
+        raise Falha()
+
+    start = time.monotonic()
+    with pytest.raises(Falha):
+        sempre_falha()
+
+    assert time.monotonic() - start < 0.5
+    assert 2 <= len(calls) < 50
+
+
+def test_nested_retry_never_extends_outer_budget():
+    budgets = []
+
+    @retry_on_fail(retries=3, delay=0, jitter=0, budget=10)
+    def interna():
+        budgets.append(remaining_budget())
+
+    @retry_on_fail(retries=3, delay=0, jitter=0, budget=0.5)
+    def externa():
+        interna()
+
+    externa()
+
+    assert budgets[0] <= 0.5
+    assert remaining_budget() is None
+
+
+def test_retry_gives_up_on_excluded_errors():
+    calls = []
+
+    class Fatal(Falha):
+        pass
+
+    @retry_on_fail(retries=5, delay=0, retry_on=(Falha,), give_up_on=(Fatal,))
+    def fatal():
+        calls.append(1)
+        raise Fatal()
+
+    with pytest.raises(Fatal):
+        fatal()
+    assert len(calls) == 1
@@ -0,0 +1,64 @@
+import json
+import os
+import time
+
+import pytest
+
+from core.browser_manager import Browser
+from core.driver_backends import FakeBackend
+from core.session_cache import SessionCache
+
+BASE = "http://sitac.local"
+
+
+def _browser():
+    return Browser(backend=FakeBackend(pages={BASE + "/": "<html><body></body></html>"}, start_url=BASE + "/"),
+                   log_level="WARNING")
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return SessionCache(folder=str(tmp_path / "sessoes"), ttl=3600)
+
+
+@pytest.fixture
+def salvo(cache):
+    nav = _browser()
+    try:
+        nav.driver.add_cookie({"name": "PHPSESSID", "value": "abc"})
+        nav.driver.add_cookie({"name": "_ga", "value": "x", "expiry": int(time.time()) - 60})
+        nav.set_local_storage({"tema": "escuro"})
+        cache.save(nav, "fiscal01", BASE)
+    finally:
+        nav.quit()
+    return cache
+
+
+def test_restore_skips_expired_cookies(salvo):
+    nav = _browser()
+    try:
+        assert salvo.restore(nav, "fiscal01", BASE)
+        assert [c["name"] for c in nav.get_cookies()] == ["PHPSESSID"]
+        assert nav.get_local_storage() == {"tema": "escuro"}
+    finally:
+        nav.quit()
+
+
+def test_snapshot_older_than_ttl_is_discarded(salvo):
+    path = salvo._path("fiscal01", BASE)
+    with open(path, encoding="utf-8") as f:
+        snapshot = json.load(f)
+    snapshot["created_at"] -= 2 * salvo.ttl
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(snapshot, f)
+
+    assert salvo.load("fiscal01", BASE) is None
+    assert not os.path.exists(path)
+
+
+def test_other_user_has_no_snapshot(salvo):
+    nav = _browser()
+    try:
+        assert not salvo.restore(nav, "fiscal02", BASE)
+    finally:
+        nav.quit()
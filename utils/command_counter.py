@@ -0,0 +1,101 @@
+"""
+CommandCounter — contagem de comandos WebDriver (round trips)
+-------------------------------------------------------------
+Inclui:
+- Interceptação de ``driver.execute``, por onde passa todo comando do
+  Selenium (inclusive os de WebElement e ActionChains)
+- Contagem total e por comando (ex: findElement, executeScript)
+- ``delta()`` para medir quantos comandos um trecho de código gasta
+
+Exemplo:
+    with CommandCounter(browser.driver) as counter:
+        browser.extract_table(".display")
+    logger.info("%s comandos: %s", counter.total, counter.by_command())
+"""
+
+import threading
+from collections import Counter
+from contextlib import contextmanager
+from typing import Dict
+
+
+class CommandCounter:
+    def __init__(self, driver=None):
+        self.counts: Counter = Counter()
+        self._lock = threading.Lock()
+        self._driver = None
+        self._original = None
+        self._had_instance_execute = False
+        if driver is not None:
+            self.attach(driver)
+
+    def attach(self, driver):
+        """Passa a contar os comandos de ``driver`` (substitui ``execute`` na instância)."""
+        if self._driver is not None:
+            raise RuntimeError("CommandCounter já está ligado a um driver.")
+
+        original = driver.execute
+        counts, lock = self.counts, self._lock
+
+        def execute(driver_command, params=None):
+            with lock:
+                counts[driver_command] += 1
+            return original(driver_command, params)
+
+        self._had_instance_execute = "execute" in vars(driver)
+        self._original = original
+        self._driver = driver
+        driver.execute = execute
+        return self
+
+    def detach(self):
+        """Restaura o ``execute`` original do driver."""
+        if self._driver is None:
+            return
+        if self._had_instance_execute:
+            self._driver.execute = self._original
+        else:
+            del self._driver.execute
+        self._driver = self._original = None
+
+    # ------------------------------------------------------------------
+    # Leitura
+    # ------------------------------------------------------------------
+    @property
+    def total(self) -> int:
+        with self._lock:
+            return sum(self.counts.values())
+
+    def by_command(self) -> Dict[str, int]:
+        """Contagem por comando, do mais frequente para o menos."""
+        with self._lock:
+            return dict(self.counts.most_common())
+
+    def reset(self):
+        with self._lock:
+            self.counts.clear()
+
+    @contextmanager
+    def delta(self):
+        """
+        Mede os comandos enviados dentro do bloco; o Counter entregue é
+        preenchido na saída.
+
+            with counter.delta() as gasto:
+                browser.click("#salvar")
+            assert sum(gasto.values()) <= 3
+        """
+        with self._lock:
+            before = Counter(self.counts)
+        result: Counter = Counter()
+        try:
+            yield result
+        finally:
+            with self._lock:
+                result.update(self.counts - before)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.detach()
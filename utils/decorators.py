@@ -1,34 +1,219 @@
 import time
+import random
 import functools
 import logging
+import threading
+from typing import Callable, Optional, Tuple, Type, Union
+
+from utils.logger import log_context
+from utils.profiler import record_sleep
 
 logger = logging.getLogger('web_automation')
 
+# Deadline compartilhado entre chamadas aninhadas de retry_on_fail na mesma thread
+_retry_state = threading.local()
+
+
+def _profiler_of(instance):
+    """Profiler do Browser (``self.profiler``) ou da página/fluxo (``self.browser.profiler``)."""
+    profiler = getattr(instance, "profiler", None)
+    if profiler is None:
+        profiler = getattr(getattr(instance, "browser", None), "profiler", None)
+    return profiler
+
+
+def _locator_key(args, kwargs) -> Optional[str]:
+    """
+    Locator da chamada: ``locator=`` (rótulo passado junto com um
+    WebElement já resolvido) ou o primeiro argumento após ``self``
+    (seletor, tupla ou índice).
+    """
+    if kwargs.get("locator") is not None:
+        return str(kwargs["locator"])[:120]
+    if len(args) > 1 and isinstance(args[1], (str, tuple, int)):
+        return str(args[1])[:120]
+    return None
+
+
+def _log_fields(instance, kind: str, name: str, key: Optional[str]) -> dict:
+    """Campos de contexto de log da chamada: sessão do Browser, passo e locator."""
+    fields = {}
+    session_id = getattr(instance, "session_id", None) or getattr(
+        getattr(instance, "browser", None), "session_id", None
+    )
+    if session_id:
+        fields["session_id"] = session_id
+    if kind == "step":
+        fields["step"] = name
+    elif key is not None:
+        fields["locator"] = key
+    return fields
+
+
+def time_it(func=None, *, kind: str = "action", keyed: bool = True):
+    """
+    Mede a chamada. Em métodos de objetos com profiler (Browser, páginas e
+    fluxos) a chamada vira um span do ``utils.profiler.Profiler`` (se
+    habilitado), com o locator como chave, e os logs emitidos durante a
+    chamada recebem session_id/step/locator; a duração vai para um log de
+    debug. Fora desses objetos apenas registra o tempo no log.
+
+    ``kind``: "action", "wait" (todo o tempo conta como espera) ou "step"
+    (passo de fluxo/página). ``keyed=False`` não usa o primeiro argumento
+    como chave (ex: quando ele é um usuário). Pode ser usado como ``@time_it`` ou
+    ``@time_it(kind="wait")``.
+    """
+    def deco(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            instance = args[0] if args else None
+            profiler = _profiler_of(instance)
+            if profiler is None:
+                start = time.time()
+                try:
+                    return fn(*args, **kwargs)
+                finally:
+                    elapsed = time.time() - start
+                    logger.info("%s levou %.2fs", fn.__name__, elapsed)
+
+            name = f"{type(instance).__name__}.{fn.__name__}"
+            key = _locator_key(args, kwargs) if keyed else None
+            with log_context(**_log_fields(instance, kind, name, key)):
+                start = time.perf_counter()
+                try:
+                    if not profiler.enabled:
+                        return fn(*args, **kwargs)
+                    with profiler.span(name, kind=kind, key=key):
+                        return fn(*args, **kwargs)
+                finally:
+                    if logger.isEnabledFor(logging.DEBUG):
+                        elapsed = time.perf_counter() - start
+                        logger.debug(
+                            "%s concluído em %.3fs", name, elapsed, extra={"duration": round(elapsed, 4)}
+                        )
+        return wrapper
+
+    return deco(func) if func is not None else deco
+
+
+class RetryPolicy:
+    """
+    Política de retry usada por ``retry_on_fail``.
+
+    - ``retries``: número máximo de tentativas
+    - ``delay``/``backoff``/``max_delay``: espera exponencial entre tentativas
+      (delay * backoff ** (tentativa - 1), limitada a max_delay)
+    - ``jitter``: variação aleatória relativa aplicada à espera (0.25 = ±25%)
+    - ``retry_on``: apenas essas exceções disparam nova tentativa;
+      as demais sobem imediatamente
+    - ``give_up_on``: exceções que nunca são repetidas, mesmo que sejam
+      subclasses de algo em ``retry_on``
+    - ``budget``: orçamento total em segundos (ou callable que recebe os
+      argumentos da chamada e devolve o orçamento). O deadline é aberto pela
+      chamada mais externa e propagado às chamadas aninhadas, que nunca o
+      estendem.
+    """
+
+    def __init__(
+        self,
+        retries: int = 3,
+        delay: float = 1.0,
+        backoff: float = 2.0,
+        max_delay: float = 10.0,
+        jitter: float = 0.25,
+        retry_on: Tuple[Type[BaseException], ...] = (Exception,),
+        give_up_on: Tuple[Type[BaseException], ...] = (),
+        budget: Union[float, Callable[..., Optional[float]], None] = None,
+    ):
+        self.retries = retries
+        self.delay = delay
+        self.backoff = backoff
+        self.max_delay = max_delay
+        self.jitter = jitter
+        self.retry_on = retry_on
+        self.give_up_on = give_up_on
+        self.budget = budget
 
-def time_it(func):
-    @functools.wraps(func)
-    def wrapper(*args, **kwargs):
-        start = time.time()
-        try:
-            return func(*args, **kwargs)
-        finally:
-            elapsed = time.time() - start
-            logger.info(f"{func.__name__} levou {elapsed:.2f}s")
-    return wrapper
+    def pause_for(self, attempt: int) -> float:
+        """Tempo de espera após a tentativa ``attempt`` (1-based)."""
+        pause = min(self.max_delay, self.delay * (self.backoff ** (attempt - 1)))
+        if self.jitter:
+            pause *= 1 + random.uniform(-self.jitter, self.jitter)
+        return max(0.0, pause)
 
+    def budget_for(self, *args, **kwargs) -> Optional[float]:
+        if callable(self.budget):
+            return self.budget(*args, **kwargs)
+        return self.budget
+
+
+def remaining_budget() -> Optional[float]:
+    """
+    Segundos restantes no deadline de retry ativo na thread atual,
+    ou None se nenhuma chamada com orçamento estiver em andamento.
+    """
+    deadline = getattr(_retry_state, "deadline", None)
+    if deadline is None:
+        return None
+    return max(0.0, deadline - time.monotonic())
+
+
+def retry_on_fail(
+    retries: int = 3,
+    delay: float = 1.0,
+    backoff: float = 2.0,
+    max_delay: float = 10.0,
+    jitter: float = 0.25,
+    retry_on: Tuple[Type[BaseException], ...] = (Exception,),
+    give_up_on: Tuple[Type[BaseException], ...] = (),
+    budget: Union[float, Callable[..., Optional[float]], None] = None,
+    policy: Optional[RetryPolicy] = None,
+):
+    policy = policy or RetryPolicy(
+        retries=retries,
+        delay=delay,
+        backoff=backoff,
+        max_delay=max_delay,
+        jitter=jitter,
+        retry_on=retry_on,
+        give_up_on=give_up_on,
+        budget=budget,
+    )
 
-def retry_on_fail(retries: int = 3, delay: float = 1.0):
     def deco(func):
         @functools.wraps(func)
         def wrapped(*args, **kwargs):
-            last_exc = None
-            for attempt in range(1, retries + 1):
-                try:
-                    return func(*args, **kwargs)
-                except Exception as e:
-                    last_exc = e
-                    logger.warning(f"Tentativa {attempt}/{retries} falhou: {e}")
-                    time.sleep(delay)
-            raise last_exc
+            outer_deadline = getattr(_retry_state, "deadline", None)
+            own_budget = policy.budget_for(*args, **kwargs)
+            if own_budget is not None:
+                own_deadline = time.monotonic() + own_budget
+                _retry_state.deadline = (
+                    own_deadline if outer_deadline is None else min(outer_deadline, own_deadline)
+                )
+
+            try:
+                for attempt in range(1, policy.retries + 1):
+                    try:
+                        return func(*args, **kwargs)
+                    except policy.retry_on as e:
+                        remaining = remaining_budget()
+                        if (
+                            attempt == policy.retries
+                            or remaining == 0
+                            or isinstance(e, policy.give_up_on)
+                        ):
+                            raise
+                        pause = policy.pause_for(attempt)
+                        if remaining is not None:
+                            pause = min(pause, remaining)
+                        logger.warning(
+                            "Tentativa %s/%s de %s falhou: "
+                            "%s; nova tentativa em %.2fs",
+                            attempt, policy.retries, func.__name__, e.__class__.__name__, pause
+                        )
+                        record_sleep(pause)
+                        time.sleep(pause)
+            finally:
+                _retry_state.deadline = outer_deadline
         return wrapped
-    return deco
\ No newline at end of file
+    return deco
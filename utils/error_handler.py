@@ -1,50 +1,220 @@
 import os
+import gzip
 import time
+import queue
 import functools
 import logging
+import threading
+from typing import Optional
+
+from selenium.common.exceptions import InvalidSessionIdException, WebDriverException
+
+from core.config_manager import ConfigManager
 
 logger = logging.getLogger("browser")
 
+# Trechos de mensagem que indicam driver/navegador morto (e não uma falha da página)
+DEAD_SESSION_MESSAGES = (
+    "invalid session id",
+    "session deleted",
+    "session not found",
+    "chrome not reachable",
+    "browser has closed the connection",
+    "disconnected: not connected to devtools",
+    "connection refused",
+    "max retries exceeded",
+    "failed to establish a new connection",
+    "remote end closed connection",
+)
+
+# Profundidade de chamadas decoradas com capture_failures na thread atual
+_capture_state = threading.local()
+
+
+class EvidenceWriter:
+    """
+    Grava evidências de falha (screenshot + HTML comprimido) em background.
+
+    O conteúdo é obtido do driver na thread da automação (o estado da página
+    só existe ali), mas a escrita em disco, a compressão e a limpeza da
+    pasta acontecem numa thread dedicada, alimentada por uma fila limitada.
+    Se a fila estiver cheia, a evidência é descartada em vez de bloquear o fluxo.
+    """
+
+    def __init__(self, folder: str = None, max_queue: int = None, max_bytes: int = None):
+        cfg = ConfigManager
+
+        self.folder = folder or cfg.get("EVIDENCE_DIR", os.path.join("logs", "errors"))
+        max_queue = max_queue or cfg.get("EVIDENCE_QUEUE_SIZE", 16, cast=int)
+        self.max_bytes = (
+            max_bytes
+            if max_bytes is not None
+            else cfg.get("EVIDENCE_MAX_MB", 200, cast=int) * 1024 * 1024
+        )
+
+        self._queue: "queue.Queue[tuple]" = queue.Queue(maxsize=max_queue)
+        self._thread = threading.Thread(target=self._run, name="evidence-writer", daemon=True)
+        self._thread.start()
+
+    def submit(self, name: str, png: Optional[bytes], html: Optional[str]) -> bool:
+        """Enfileira uma evidência; retorna False se ela foi descartada."""
+        timestamp = time.strftime("%Y-%m-%d_%H-%M-%S")
+        base = os.path.join(self.folder, f"{timestamp}_{name}")
+        try:
+            self._queue.put_nowait((base, png, html))
+            return True
+        except queue.Full:
+            logger.warning("[ERROR] Fila de evidências cheia, descartando: %s", base)
+            return False
+
+    def flush(self):
+        """Bloqueia até que todas as evidências enfileiradas sejam gravadas."""
+        self._queue.join()
+
+    # ------------------------------------------------------------------
+    # Thread de escrita
+    # ------------------------------------------------------------------
+    def _run(self):
+        while True:
+            base, png, html = self._queue.get()
+            try:
+                self._write(base, png, html)
+                self._prune()
+            except Exception as e:
+                logger.error("[ERROR] Falha ao gravar evidências %s: %s", base, e)
+            finally:
+                self._queue.task_done()
+
+    def _write(self, base: str, png: Optional[bytes], html: Optional[str]):
+        os.makedirs(self.folder, exist_ok=True)
+
+        if png is not None:
+            screenshot_path = base + ".png"
+            with open(screenshot_path, "wb") as f:
+                f.write(png)
+            logger.error("[ERROR] Screenshot salva: %s", screenshot_path)
+
+        if html is not None:
+            html_path = base + ".html.gz"
+            with gzip.open(html_path, "wt", encoding="utf-8") as f:
+                f.write(html)
+            logger.error("[ERROR] HTML dump salvo: %s", html_path)
+
+    def _prune(self):
+        """Remove as evidências mais antigas até a pasta caber em max_bytes."""
+        if not self.max_bytes:
+            return
+
+        files = []
+        for entry in os.scandir(self.folder):
+            if entry.is_file():
+                stat = entry.stat()
+                files.append((stat.st_mtime, stat.st_size, entry.path))
+
+        total = sum(size for _, size, _ in files)
+        for _, size, path in sorted(files):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+                total -= size
+            except OSError:
+                pass
+
+
+_writer: Optional[EvidenceWriter] = None
+_writer_lock = threading.Lock()
+
+
+def get_evidence_writer() -> EvidenceWriter:
+    """Retorna o EvidenceWriter compartilhado do processo (criado sob demanda)."""
+    global _writer
+    with _writer_lock:
+        if _writer is None:
+            _writer = EvidenceWriter()
+        return _writer
+
+
+def flush_evidence():
+    """Aguarda a gravação das evidências pendentes, se houver writer ativo."""
+    with _writer_lock:
+        writer = _writer
+    if writer is not None:
+        writer.flush()
+
+
+def capture_evidence(driver, name: str) -> bool:
+    """
+    Lê screenshot e HTML do driver e envia para gravação em background.
+    Cada parte é opcional: uma falha ao ler uma não impede a outra.
+    """
+    png = html = None
+    try:
+        png = driver.get_screenshot_as_png()
+    except Exception as ss_err:
+        logger.error("[ERROR] Falha ao capturar screenshot: %s", ss_err)
+    try:
+        html = driver.page_source
+    except Exception as html_err:
+        logger.error("[ERROR] Falha ao capturar HTML dump: %s", html_err)
+
+    if png is None and html is None:
+        return False
+    return get_evidence_writer().submit(name, png, html)
+
+
+def is_dead_session(error: BaseException) -> bool:
+    """
+    True se a exceção (ou alguma causa encadeada) indica que a sessão do
+    WebDriver não responde mais: driver encerrado, navegador fechado ou
+    conexão recusada.
+    """
+    seen = set()
+    while error is not None and id(error) not in seen:
+        seen.add(id(error))
+        if isinstance(error, (InvalidSessionIdException, ConnectionError)):
+            return True
+        if isinstance(error, WebDriverException) or type(error).__module__.startswith("urllib3"):
+            message = str(error).lower()
+            if any(fragment in message for fragment in DEAD_SESSION_MESSAGES):
+                return True
+        error = error.__cause__ or error.__context__
+    return False
+
 
 def capture_failures(func):
-    """Decorator que captura screenshots + HTML quando há falha no Browser."""
+    """
+    Decorator que captura screenshot + HTML quando há falha no Browser.
+
+    Só a chamada decorada mais externa captura, e uma única vez por exceção:
+    métodos aninhados (ex: click → wait_for) e as tentativas intermediárias
+    de retry não geram evidências repetidas.
+    """
 
     @functools.wraps(func)
     def wrapper(self, *args, **kwargs):
+        depth = getattr(_capture_state, "depth", 0)
+        _capture_state.depth = depth + 1
         try:
             return func(self, *args, **kwargs)
 
         except Exception as e:
-            timestamp = time.strftime("%Y-%m-%d_%H-%M-%S")
-            method = func.__name__
-            folder = "logs/errors"
-            os.makedirs(folder, exist_ok=True)
-
-            # gerar nomes de arquivo
-            base = f"{timestamp}_{method}"
-            screenshot_path = os.path.join(folder, base + ".png")
-            html_path = os.path.join(folder, base + ".html")
+            # com a sessão morta não há página para capturar
+            if depth == 0 and not getattr(e, "_evidence_captured", False) and not is_dead_session(e):
+                method = func.__name__
+                capture_evidence(self.driver, method)
+                try:
+                    e._evidence_captured = True
+                except AttributeError:
+                    pass
 
-            # salvar screenshot
-            try:
-                self.driver.save_screenshot(screenshot_path)
-                logger.error(f"[ERROR] Screenshot salva: {screenshot_path}")
-            except Exception as ss_err:
-                logger.error(f"[ERROR] Falha ao salvar screenshot: {ss_err}")
-
-            # salvar HTML dump
-            try:
-                html = self.driver.page_source
-                with open(html_path, "w", encoding="utf-8") as f:
-                    f.write(html)
-                logger.error(f"[ERROR] HTML dump salvo: {html_path}")
-            except Exception as html_err:
-                logger.error(f"[ERROR] Falha ao salvar HTML dump: {html_err}")
-
-            # logar exceção original
-            logger.exception(f"Exceção capturada em {method}: {e}")
+                # logar exceção original
+                logger.exception("Exceção capturada em %s: %s", method, e)
 
             # re-levantar exceção para retry ou fluxo normal
-            raise e
+            raise
+
+        finally:
+            _capture_state.depth = depth
 
     return wrapper
@@ -0,0 +1,333 @@
+"""
+html_dom — árvore HTML mínima com seletores CSS, sem dependências externas
+-------------------------------------------------------------------------
+Usada para ler páginas HTML obtidas fora do navegador (ex: ``HttpSession``)
+e como DOM do ``FakeDriver``.
+
+Seletores suportados: ``tag``, ``#id``, ``.classe``, ``[attr]``,
+``[attr=valor]``, ``[attr^=..]``, ``[attr$=..]``, ``[attr*=..]``,
+``:first-child``, ``:last-child``, ``:nth-child(an+b | odd | even)``,
+combinadores de descendente (espaço) e filho (``>``) e listas separadas
+por vírgula.
+
+Exemplo:
+    doc = parse_html(html)
+    for tr in doc.select_one("table.display").select("tr"):
+        print([td.text for td in tr.select("td")])
+"""
+
+import re
+from functools import lru_cache
+from html import escape
+from html.parser import HTMLParser
+from typing import Dict, List, Optional, Union
+
+VOID_ELEMENTS = {
+    "area", "base", "br", "col", "embed", "hr", "img", "input",
+    "link", "meta", "param", "source", "track", "wbr",
+}
+
+# Tags fechadas implicitamente quando outra tag abre (subconjunto do HTML5)
+IMPLICIT_CLOSE = {
+    "td": {"td", "th"},
+    "th": {"td", "th"},
+    "tr": {"tr", "td", "th"},
+    "thead": {"tbody", "tfoot", "tr", "td", "th"},
+    "tbody": {"thead", "tbody", "tfoot", "tr", "td", "th"},
+    "tfoot": {"thead", "tbody", "tr", "td", "th"},
+    "li": {"li"},
+    "option": {"option"},
+    "p": {"p"},
+}
+# Blocos fecham um <p> aberto
+for _tag in ("div", "ul", "ol", "table", "form", "pre", "blockquote", "hr", "section",
+             "header", "footer", "h1", "h2", "h3", "h4", "h5", "h6"):
+    IMPLICIT_CLOSE.setdefault(_tag, set()).add("p")
+# O fechamento implícito não atravessa estes elementos
+SCOPE_BOUNDARIES = {"table", "td", "th", "ul", "ol", "select", "html", "body"}
+
+BLOCK_ELEMENTS = {"p", "div", "tr", "li", "br", "table", "ul", "ol", "h1", "h2", "h3", "h4", "h5", "h6"}
+
+
+class Element:
+    def __init__(self, tag: str, attrs: Optional[Dict[str, str]] = None, parent: "Element" = None):
+        self.tag = tag
+        self.attrs = attrs or {}
+        self.parent = parent
+        self.children: List[Union["Element", str]] = []
+
+    # ------------------------------------------------------------------
+    # Conteúdo
+    # ------------------------------------------------------------------
+    def get(self, name: str, default=None) -> Optional[str]:
+        return self.attrs.get(name, default)
+
+    @property
+    def elements(self) -> List["Element"]:
+        return [child for child in self.children if isinstance(child, Element)]
+
+    def iter(self):
+        """Descendentes em ordem de documento (sem incluir o próprio elemento)."""
+        for child in self.children:
+            if isinstance(child, Element):
+                yield child
+                yield from child.iter()
+
+    @property
+    def text_content(self) -> str:
+        parts = []
+        for child in self.children:
+            parts.append(child.text_content if isinstance(child, Element) else child)
+        return "".join(parts)
+
+    @property
+    def text(self) -> str:
+        """Texto com espaços colapsados, próximo do ``innerText`` do navegador."""
+        lines = []
+        current = []
+
+        def walk(node):
+            for child in node.children:
+                if isinstance(child, str):
+                    current.append(child)
+                    continue
+                if child.tag in ("script", "style"):
+                    continue
+                if child.tag in BLOCK_ELEMENTS:
+                    lines.append("".join(current))
+                    current.clear()
+                walk(child)
+                if child.tag in BLOCK_ELEMENTS:
+                    lines.append("".join(current))
+                    current.clear()
+
+        walk(self)
+        lines.append("".join(current))
+        return "\n".join(" ".join(line.split()) for line in lines if line.strip())
+
+    @property
+    def inner_html(self) -> str:
+        raw = self.tag in ("script", "style")
+        return "".join(
+            child.outer_html if isinstance(child, Element) else (child if raw else escape(child, quote=False))
+            for child in self.children
+        )
+
+    @property
+    def outer_html(self) -> str:
+        if self.tag == "#document":
+            return self.inner_html
+        attrs = "".join(
+            f' {name}="{escape(value)}"' if value != "" else f" {name}"
+            for name, value in self.attrs.items()
+        )
+        if self.tag in VOID_ELEMENTS:
+            return f"<{self.tag}{attrs}>"
+        return f"<{self.tag}{attrs}>{self.inner_html}</{self.tag}>"
+
+    # ------------------------------------------------------------------
+    # Seletores
+    # ------------------------------------------------------------------
+    def select(self, selector: str) -> List["Element"]:
+        groups = parse_selector(selector)
+        return [el for el in self.iter() if any(_matches(el, parts, len(parts) - 1) for parts in groups)]
+
+    def select_one(self, selector: str) -> Optional["Element"]:
+        groups = parse_selector(selector)
+        for el in self.iter():
+            if any(_matches(el, parts, len(parts) - 1) for parts in groups):
+                return el
+        return None
+
+    def __repr__(self):
+        return f"<Element {self.tag} {self.attrs}>"
+
+
+class _TreeBuilder(HTMLParser):
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.root = Element("#document")
+        self.stack = [self.root]
+
+    def handle_starttag(self, tag, attrs):
+        closes = IMPLICIT_CLOSE.get(tag)
+        if closes:
+            for i in range(len(self.stack) - 1, 0, -1):
+                open_tag = self.stack[i].tag
+                if open_tag in closes:
+                    del self.stack[i:]
+                    break
+                if open_tag in SCOPE_BOUNDARIES:
+                    break
+
+        el = Element(tag, {name: value if value is not None else "" for name, value in attrs}, self.stack[-1])
+        self.stack[-1].children.append(el)
+        if tag not in VOID_ELEMENTS:
+            self.stack.append(el)
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+        if tag not in VOID_ELEMENTS and self.stack[-1].tag == tag:
+            self.stack.pop()
+
+    def handle_endtag(self, tag):
+        for i in range(len(self.stack) - 1, 0, -1):
+            if self.stack[i].tag == tag:
+                del self.stack[i:]
+                return
+
+    def handle_data(self, data):
+        self.stack[-1].children.append(data)
+
+
+def parse_html(html: str) -> Element:
+    """Monta a árvore do documento (raiz ``#document``)."""
+    builder = _TreeBuilder()
+    builder.feed(html)
+    builder.close()
+    return builder.root
+
+
+# ----------------------------------------------------------------------
+# Seletores CSS
+# ----------------------------------------------------------------------
+_TOKEN = re.compile(
+    r"""
+    (?P<combinator>\s*>\s*|\s+)
+    |(?P<tag>\*|[a-zA-Z][\w-]*)
+    |\#(?P<id>[\w-]+)
+    |\.(?P<cls>[\w-]+)
+    |\[\s*(?P<attr>[\w-]+)\s*(?:(?P<op>[\^$*]?=)\s*(?:"(?P<dq>[^"]*)"|'(?P<sq>[^']*)'|(?P<bare>[^\]\s]+))\s*)?\]
+    |:(?P<pseudo>[\w-]+)(?:\((?P<arg>[^)]*)\))?
+    """,
+    re.VERBOSE,
+)
+
+
+class _Compound:
+    __slots__ = ("tag", "ids", "classes", "attrs", "pseudos")
+
+    def __init__(self):
+        self.tag = None
+        self.ids = []
+        self.classes = []
+        self.attrs = []
+        self.pseudos = []
+
+    def matches(self, el: Element) -> bool:
+        if self.tag and self.tag != "*" and el.tag != self.tag:
+            return False
+        if any(el.attrs.get("id") != value for value in self.ids):
+            return False
+        classes = el.attrs.get("class", "").split()
+        if any(cls not in classes for cls in self.classes):
+            return False
+        for name, op, value in self.attrs:
+            actual = el.attrs.get(name)
+            if actual is None:
+                return False
+            if op == "=" and actual != value:
+                return False
+            if op == "^=" and not actual.startswith(value):
+                return False
+            if op == "$=" and not actual.endswith(value):
+                return False
+            if op == "*=" and value not in actual:
+                return False
+        for name, arg in self.pseudos:
+            siblings = el.parent.elements if el.parent else [el]
+            if name == "first-child" and siblings[0] is not el:
+                return False
+            if name == "last-child" and siblings[-1] is not el:
+                return False
+            if name == "nth-child":
+                a, b = arg
+                offset = siblings.index(el) + 1 - b
+                # existe n >= 0 com a*n + b == posição?
+                if a == 0:
+                    if offset != 0:
+                        return False
+                elif offset % a != 0 or offset // a < 0:
+                    return False
+        return True
+
+
+_NTH = re.compile(r"^(?:(?P<a>[+-]?\d*)n\s*(?:(?P<sign>[+-])\s*(?P<b>\d+))?|(?P<only>[+-]?\d+))$")
+
+
+def _parse_nth(arg: str, selector: str) -> tuple:
+    """Argumento de ``:nth-child`` (``an+b``, ``odd``, ``even``, ``3``) → ``(a, b)``."""
+    arg = arg.strip().lower()
+    if arg == "odd":
+        return 2, 1
+    if arg == "even":
+        return 2, 0
+    m = _NTH.match(arg)
+    if not m:
+        raise ValueError(f"Seletor CSS não suportado: {selector!r}")
+    if m.group("only") is not None:
+        return 0, int(m.group("only"))
+    a = m.group("a")
+    a = -1 if a == "-" else 1 if a in ("", "+") else int(a)
+    b = int(m.group("b") or 0) * (-1 if m.group("sign") == "-" else 1)
+    return a, b
+
+
+@lru_cache(maxsize=256)
+def parse_selector(selector: str) -> List[List[tuple]]:
+    """Converte o seletor em grupos de ``(combinador, composto)`` (cache por seletor)."""
+    groups = []
+    for part in selector.split(","):
+        part = part.strip()
+        parts = []
+        compound = _Compound()
+        combinator = " "
+        pos = 0
+        while pos < len(part):
+            m = _TOKEN.match(part, pos)
+            if not m or m.end() == pos:
+                raise ValueError(f"Seletor CSS não suportado: {selector!r}")
+            pos = m.end()
+            if m.group("combinator") is not None:
+                parts.append((combinator, compound))
+                compound = _Compound()
+                combinator = ">" if ">" in m.group("combinator") else " "
+            elif m.group("tag"):
+                compound.tag = m.group("tag").lower()
+            elif m.group("id"):
+                compound.ids.append(m.group("id"))
+            elif m.group("cls"):
+                compound.classes.append(m.group("cls"))
+            elif m.group("attr"):
+                value = next((v for v in (m.group("dq"), m.group("sq"), m.group("bare")) if v is not None), None)
+                compound.attrs.append((m.group("attr"), m.group("op"), value))
+            else:
+                pseudo = m.group("pseudo")
+                if pseudo not in ("first-child", "last-child", "nth-child"):
+                    raise ValueError(f"Pseudo-classe não suportada: :{pseudo}")
+                arg = (m.group("arg") or "").strip()
+                if pseudo == "nth-child":
+                    arg = _parse_nth(arg, selector)
+                compound.pseudos.append((pseudo, arg))
+        parts.append((combinator, compound))
+        groups.append(parts)
+    return groups
+
+
+def _matches(el: Element, parts: List[tuple], index: int) -> bool:
+    combinator, compound = parts[index]
+    if not compound.matches(el):
+        return False
+    if index == 0:
+        return True
+
+    if combinator == ">":
+        parent = el.parent
+        return parent is not None and parent.tag != "#document" and _matches(parent, parts, index - 1)
+
+    ancestor = el.parent
+    while ancestor is not None and ancestor.tag != "#document":
+        if _matches(ancestor, parts, index - 1):
+            return True
+        ancestor = ancestor.parent
+    return False
@@ -1,16 +1,182 @@
+"""
+Logger — logging estruturado e de baixo custo
+---------------------------------------------
+Inclui:
+- Um único QueueHandler por logger e um QueueListener compartilhado: a
+  escrita em console/arquivo acontece fora da thread da automação
+- Mensagens no estilo ``logger.info("... %s", valor)``: a formatação só
+  ocorre se o nível estiver habilitado
+- Campos de contexto (session_id, step, locator, duration) anexados a cada
+  registro, via ``extra``/LoggerAdapter ou ``log_context``
+- Saída texto (padrão) ou JSON lines (LOG_FORMAT=json); LOG_JSON_FILE grava
+  JSON lines em arquivo além do console
+- Redação de segredos registrados com ``register_secret`` (ex: senhas)
+
+Exemplo:
+    logger = setup_logger("meu_fluxo")
+    register_secret(senha)
+    with log_context(step="login"):
+        logger.info("Entrando como %s", usuario)
+"""
+
+import atexit
+import contextvars
+import json
 import logging
+import queue
 import sys
+import threading
+from contextlib import contextmanager
+from logging.handlers import QueueHandler, QueueListener
+
+TEXT_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+CONTEXT_FIELDS = ("session_id", "step", "locator", "duration")
+REDACTED = "***"
+
+_context: contextvars.ContextVar = contextvars.ContextVar("log_context", default={})
+_secrets = set()
+
+_queue: "queue.SimpleQueue" = queue.SimpleQueue()
+_handlers = []
+_files = set()
+_listener = None
+_lock = threading.Lock()
+
+
+# ----------------------------------------------------------------------
+# Contexto e segredos
+# ----------------------------------------------------------------------
+@contextmanager
+def log_context(**fields):
+    """Anexa ``fields`` aos registros emitidos dentro do bloco (na task/thread atual)."""
+    token = _context.set({**_context.get(), **fields})
+    try:
+        yield
+    finally:
+        _context.reset(token)
+
+
+def register_secret(value):
+    """Passa a substituir ``value`` por *** em todas as mensagens de log."""
+    if value and len(str(value)) >= 3:
+        _secrets.add(str(value))
+
+
+def redact(text: str) -> str:
+    for secret in sorted(_secrets, key=len, reverse=True):
+        text = text.replace(secret, REDACTED)
+    return text
+
+
+class ContextFilter(logging.Filter):
+    """Preenche os campos de contexto que não vieram em ``extra``."""
+
+    def filter(self, record):
+        context = _context.get()
+        for field in CONTEXT_FIELDS:
+            if getattr(record, field, None) is None:
+                setattr(record, field, context.get(field))
+        return True
+
+
+class RedactingQueueHandler(QueueHandler):
+    """QueueHandler que formata a mensagem e remove segredos antes de enfileirar."""
+
+    def prepare(self, record):
+        record = super().prepare(record)
+        if _secrets:
+            record.msg = record.message = redact(record.msg)
+        return record
+
+
+class JsonFormatter(logging.Formatter):
+    """Um objeto JSON por linha, com os campos de contexto presentes."""
+
+    def format(self, record):
+        data = {
+            "ts": f"{self.formatTime(record, '%Y-%m-%dT%H:%M:%S')}.{int(record.msecs):03d}",
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for field in CONTEXT_FIELDS:
+            value = getattr(record, field, None)
+            if value is not None:
+                data[field] = value
+        return json.dumps(data, ensure_ascii=False, default=str)
+
+
+# ----------------------------------------------------------------------
+# Listener compartilhado
+# ----------------------------------------------------------------------
+def _formatter(kind: str) -> logging.Formatter:
+    return JsonFormatter() if kind == "json" else logging.Formatter(TEXT_FORMAT)
+
+
+def _ensure_listener(log_file: str = None):
+    """Inicia o listener (uma vez) e acrescenta ``log_file`` aos destinos, se novo."""
+    global _listener
+    with _lock:
+        new_file = bool(log_file) and log_file not in _files
+        if _listener is not None and not new_file:
+            return
+
+        if not _handlers:
+            from core.config_manager import ConfigManager
+
+            console = logging.StreamHandler(sys.stdout)
+            console.setFormatter(_formatter(ConfigManager.get("LOG_FORMAT", "text")))
+            _handlers.append(console)
+
+            json_file = ConfigManager.get("LOG_JSON_FILE")
+            if json_file:
+                _add_file_handler(json_file, "json")
+
+        if new_file:
+            _add_file_handler(log_file, "json" if log_file.endswith(".jsonl") else "text")
+
+        if _listener is not None:
+            _listener.stop()
+        _listener = QueueListener(_queue, *_handlers)
+        _listener.start()
+
+
+def _add_file_handler(path: str, kind: str):
+    handler = logging.FileHandler(path, encoding="utf-8")
+    handler.setFormatter(_formatter(kind))
+    _handlers.append(handler)
+    _files.add(path)
+
+
+def flush_logs():
+    """Espera o listener escrever tudo o que já foi enfileirado."""
+    with _lock:
+        if _listener is not None:
+            _listener.stop()
+            _listener.start()
+
+
+def _stop_listener():
+    with _lock:
+        if _listener is not None:
+            _listener.stop()
+
+
+atexit.register(_stop_listener)
+
 
 def setup_logger(name: str = 'web_automation', level: int = logging.INFO, log_file: str = None):
+    """
+    Retorna o logger ``name`` ligado à fila compartilhada.
+
+    ``log_file`` acrescenta um arquivo de saída (JSON lines se terminar em
+    ``.jsonl``); os destinos são comuns a todos os loggers do framework.
+    """
     logger = logging.getLogger(name)
     logger.setLevel(level)
-    formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
-    if not logger.handlers:
-        ch = logging.StreamHandler(sys.stdout)
-        ch.setFormatter(formatter)
-        logger.addHandler(ch)
-        if log_file:
-            fh = logging.FileHandler(log_file)
-            fh.setFormatter(formatter)
-            logger.addHandler(fh)
-    return logger
\ No newline at end of file
+    _ensure_listener(log_file)
+    if not any(isinstance(h, RedactingQueueHandler) for h in logger.handlers):
+        handler = RedactingQueueHandler(_queue)
+        handler.addFilter(ContextFilter())
+        logger.addHandler(handler)
+    return logger
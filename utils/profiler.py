@@ -0,0 +1,200 @@
+"""
+Profiler — latência por chamada de ações do Browser, páginas e fluxos
+--------------------------------------------------------------------
+Cada chamada instrumentada (``utils.decorators.time_it``) abre um span.
+Ao fechar, o tempo total é dividido em:
+
+- wait: tempo dentro de spans de espera (wait_for, wait_until_idle, ...)
+- retry_sleep: pausas entre tentativas de ``retry_on_fail``
+- action: o restante (round trips da ação em si + código do framework)
+
+Os spans aninhados repassam wait/retry_sleep ao span pai, então um passo de
+fluxo mostra quanto do seu tempo foi espera. As estatísticas são agregadas
+por nome (ex: ``Browser.click``) e por nome + locator, com histograma.
+"""
+
+import os
+import json
+import time
+import threading
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Tuple
+
+# Limites superiores (ms) das faixas do histograma
+HISTOGRAM_BUCKETS_MS = [1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000, float("inf")]
+
+# Pilha de spans abertos na thread atual
+_span_state = threading.local()
+
+
+class _Span:
+    __slots__ = ("name", "kind", "key", "start", "wait", "sleep")
+
+    def __init__(self, name: str, kind: str, key: Optional[str]):
+        self.name = name
+        self.kind = kind
+        self.key = key
+        self.start = time.perf_counter()
+        self.wait = 0.0
+        self.sleep = 0.0
+
+
+def _stack() -> List[_Span]:
+    stack = getattr(_span_state, "stack", None)
+    if stack is None:
+        stack = _span_state.stack = []
+    return stack
+
+
+def record_sleep(seconds: float):
+    """Atribui uma pausa de retry ao span aberto na thread atual (se houver)."""
+    stack = _stack()
+    if stack:
+        stack[-1].sleep += seconds
+
+
+class _Stats:
+    __slots__ = ("count", "total", "wait", "action", "sleep", "min", "max", "samples", "histogram")
+
+    def __init__(self):
+        self.count = 0
+        self.total = self.wait = self.action = self.sleep = 0.0
+        self.min = float("inf")
+        self.max = 0.0
+        self.samples: List[float] = []
+        self.histogram = [0] * len(HISTOGRAM_BUCKETS_MS)
+
+    def add(self, total: float, wait: float, action: float, sleep: float, max_samples: int):
+        self.count += 1
+        self.total += total
+        self.wait += wait
+        self.action += action
+        self.sleep += sleep
+        self.min = min(self.min, total)
+        self.max = max(self.max, total)
+        if len(self.samples) < max_samples:
+            self.samples.append(total)
+        ms = total * 1000
+        for i, limit in enumerate(HISTOGRAM_BUCKETS_MS):
+            if ms <= limit:
+                self.histogram[i] += 1
+                break
+
+    def percentile(self, p: float) -> float:
+        if not self.samples:
+            return 0.0
+        ordered = sorted(self.samples)
+        return ordered[min(len(ordered) - 1, int(round(p / 100 * (len(ordered) - 1))))]
+
+    def to_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "total_s": round(self.total, 4),
+            "mean_ms": round(self.total / self.count * 1000, 2) if self.count else 0,
+            "min_ms": round(self.min * 1000, 2) if self.count else 0,
+            "max_ms": round(self.max * 1000, 2),
+            "p50_ms": round(self.percentile(50) * 1000, 2),
+            "p95_ms": round(self.percentile(95) * 1000, 2),
+            "wait_s": round(self.wait, 4),
+            "action_s": round(self.action, 4),
+            "retry_sleep_s": round(self.sleep, 4),
+            "histogram_ms": {
+                ("inf" if limit == float("inf") else f"<={limit}"): n
+                for limit, n in zip(HISTOGRAM_BUCKETS_MS, self.histogram)
+                if n
+            },
+        }
+
+
+class Profiler:
+    def __init__(self, enabled: bool = True, max_samples: int = 5000):
+        self.enabled = enabled
+        self.max_samples = max_samples
+        self._by_name: Dict[str, _Stats] = {}
+        self._by_key: Dict[Tuple[str, str], _Stats] = {}
+        self._kinds: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def span(self, name: str, kind: str = "action", key: Optional[str] = None):
+        """Mede o bloco como uma chamada ``name`` (kind: action, wait ou step)."""
+        if not self.enabled:
+            yield
+            return
+
+        stack = _stack()
+        span = _Span(name, kind, key)
+        stack.append(span)
+        try:
+            yield
+        finally:
+            stack.pop()
+            total = time.perf_counter() - span.start
+            wait = max(0.0, total - span.sleep) if kind == "wait" else span.wait
+            action = max(0.0, total - wait - span.sleep)
+            if stack:
+                stack[-1].wait += wait
+                stack[-1].sleep += span.sleep
+            self._record(span, total, wait, action)
+
+    def _record(self, span: _Span, total: float, wait: float, action: float):
+        with self._lock:
+            self._kinds[span.name] = span.kind
+            self._by_name.setdefault(span.name, _Stats()).add(
+                total, wait, action, span.sleep, self.max_samples
+            )
+            if span.key:
+                self._by_key.setdefault((span.name, span.key), _Stats()).add(
+                    total, wait, action, span.sleep, self.max_samples
+                )
+
+    # ------------------------------------------------------------------
+    # Relatórios
+    # ------------------------------------------------------------------
+    def has_data(self) -> bool:
+        return bool(self._by_name)
+
+    def to_dict(self) -> dict:
+        with self._lock:
+            return {
+                "by_name": {
+                    name: dict(kind=self._kinds[name], **stats.to_dict())
+                    for name, stats in self._by_name.items()
+                },
+                "by_locator": [
+                    dict(name=name, locator=key, **stats.to_dict())
+                    for (name, key), stats in self._by_key.items()
+                ],
+            }
+
+    def report(self, top_n: int = 15) -> str:
+        """Tabela texto com as ``top_n`` chamadas de maior tempo total."""
+        data = self.to_dict()
+        rows = sorted(data["by_name"].items(), key=lambda item: item[1]["total_s"], reverse=True)[:top_n]
+        locators = sorted(data["by_locator"], key=lambda item: item["total_s"], reverse=True)[:top_n]
+
+        lines = [
+            f"{'chamada':<45} {'tipo':<6} {'n':>6} {'total(s)':>9} {'wait(s)':>8} "
+            f"{'ação(s)':>8} {'sleep(s)':>8} {'p50(ms)':>8} {'p95(ms)':>8}",
+            "-" * 112,
+        ]
+        for name, s in rows:
+            lines.append(
+                f"{name[:45]:<45} {s['kind']:<6} {s['count']:>6} {s['total_s']:>9.2f} {s['wait_s']:>8.2f} "
+                f"{s['action_s']:>8.2f} {s['retry_sleep_s']:>8.2f} {s['p50_ms']:>8.1f} {s['p95_ms']:>8.1f}"
+            )
+        if locators:
+            lines += ["", f"{'locator':<70} {'n':>6} {'total(s)':>9} {'p95(ms)':>8}", "-" * 96]
+            for s in locators:
+                label = f"{s['name']} {s['locator']}"
+                lines.append(f"{label[:70]:<70} {s['count']:>6} {s['total_s']:>9.2f} {s['p95_ms']:>8.1f}")
+        return "\n".join(lines)
+
+    def dump(self, folder: str, name: str = "profile") -> str:
+        """Grava o perfil em JSON e retorna o caminho."""
+        os.makedirs(folder, exist_ok=True)
+        timestamp = time.strftime("%Y-%m-%d_%H-%M-%S")
+        path = os.path.join(folder, f"{timestamp}_{name}.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, indent=2, ensure_ascii=False)
+        return path